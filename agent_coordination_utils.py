@@ -27,6 +27,9 @@ class TaskResult:
 class BaseAgent(ABC):
     """Base class for agents that participate in the communication layer"""
     
+    # How many delivered and revoked task ids to remember for answering revokes
+    TASK_MEMORY = 1024
+    
     def __init__(self, agent_id: str = None, agent_type: str = "generic", 
                  name: str = None, capabilities: List[str] = None,
                  max_concurrent_tasks: int = 5, nats_url: str = "nats://localhost:4223",
@@ -47,6 +50,8 @@ class BaseAgent(ABC):
         # State management
         self.status = AgentStatus.OFFLINE
         self.current_tasks: Dict[str, Dict] = {}
+        self._seen_tasks: Dict[str, None] = {}  # delivered task ids, oldest first
+        self._revoked_tasks: Dict[str, None] = {}  # revoked before their assignment arrived, oldest first
         self.task_handlers: Dict[str, Callable] = {}
         self.running = False
         
@@ -119,6 +124,12 @@ class BaseAgent(ABC):
             cb=self._handle_task_assignment
         )
         
+        # Task revocations from the orchestrator's rebalancer (request/reply)
+        await self.nc.subscribe(
+            f"hero.v1.{env}.agents.{self.agent_id}.tasks.revoke",
+            cb=self._handle_task_revoke
+        )
+        
         # Sync checkpoints
         await self.nc.subscribe(
             f"hero.v1.{env}.agents.{self.agent_id}.sync.checkpoint",
@@ -240,6 +251,13 @@ class BaseAgent(ABC):
             
             self.logger.info(f"📋 Received task assignment: {task_id}")
             
+            # Already handed back to the orchestrator before this assignment arrived
+            if task_id in self._revoked_tasks:
+                del self._revoked_tasks[task_id]
+                self.logger.info(f"🔀 Dropping revoked task {task_id}")
+                return
+            self._remember_task(self._seen_tasks, task_id)
+            
             # Check if we can accept the task
             if len(self.current_tasks) >= self.max_concurrent_tasks:
                 await self._reject_task(task_id, "Agent at capacity")
@@ -261,6 +279,34 @@ class BaseAgent(ABC):
         except Exception as e:
             self.logger.error(f"Error handling task assignment: {e}")
     
+    async def _handle_task_revoke(self, msg):
+        """Give a task back to the orchestrator if it has not been accepted yet"""
+        try:
+            data = json.loads(msg.data.decode())
+            task_id = data["task_id"]
+            
+            # Only a task this agent never received can be handed back; running or finished ones stay
+            revoked = task_id not in self.current_tasks and task_id not in self._seen_tasks
+            if revoked:
+                self._remember_task(self._revoked_tasks, task_id)
+                self.logger.info(f"🔀 Task {task_id} revoked for {data.get('target_agent', 'another agent')}")
+            
+            await msg.respond(json.dumps({
+                "task_id": task_id,
+                "agent_id": self.agent_id,
+                "revoked": revoked
+            }).encode())
+            
+        except Exception as e:
+            self.logger.error(f"Error handling task revoke: {e}")
+    
+    def _remember_task(self, task_ids: Dict[str, None], task_id: str):
+        """Add ``task_id`` to an insertion-ordered id set, forgetting the oldest beyond ``TASK_MEMORY``"""
+        task_ids.pop(task_id, None)
+        task_ids[task_id] = None
+        while len(task_ids) > self.TASK_MEMORY:
+            del task_ids[next(iter(task_ids))]
+    
     async def _execute_task(self, task_id: str, task_data: Dict[str, Any]):
         """Execute a task"""
         try:
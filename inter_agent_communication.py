@@ -5,9 +5,12 @@ Handles task distribution, synchronization, load balancing, and agent coordinati
 """
 import asyncio
 import json
+import os
 import time
 import uuid
 import hashlib
+import heapq
+import itertools
 import threading
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -41,6 +44,12 @@ logging.basicConfig(
 )
 logger = logging.getLogger("InterAgentCommunication")
 
+def _enum_value(obj):
+    """json.dumps fallback that sends enums by value"""
+    if isinstance(obj, Enum):
+        return obj.value
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
 class TaskPriority(Enum):
     CRITICAL = 1
     HIGH = 2
@@ -105,10 +114,215 @@ class SyncPoint:
     timeout: datetime
     data: Dict[str, Any]
 
+class CapabilityIndex:
+    """Inverted index from capability to assignable agents, one min-heap per capability.
+    
+    Heap entries are ``(score, agent_id, version)`` with the same score as the old linear
+    scan (load minus 0.3 x performance, lower is better). Every update bumps the agent's
+    version and pushes fresh entries; outdated ones are dropped lazily when they surface,
+    and a heap is rebuilt once stale entries outnumber live ones.
+    """
+    
+    ASSIGNABLE = (AgentStatus.ONLINE, AgentStatus.IDLE)
+    
+    def __init__(self):
+        self._heaps: Dict[str, List[tuple]] = defaultdict(list)
+        self._members: Dict[str, Set[str]] = defaultdict(set)  # capability -> assignable agent ids
+        self._versions: Dict[str, int] = {}
+        self._capabilities: Dict[str, Set[str]] = {}
+        self._assignable: Set[str] = set()
+    
+    @staticmethod
+    def score(agent: Agent) -> float:
+        load_score = len(agent.current_tasks) / agent.max_concurrent_tasks
+        return load_score - (agent.performance_score * 0.3)
+    
+    def update(self, agent: Agent):
+        """Re-index an agent after its load, performance, status or capabilities changed"""
+        agent_id = agent.agent_id
+        self._drop(agent_id)
+        version = self._versions[agent_id]
+        if agent.status not in self.ASSIGNABLE or len(agent.current_tasks) >= agent.max_concurrent_tasks:
+            return
+        capabilities = set(agent.capabilities)
+        self._capabilities[agent_id] = capabilities
+        self._assignable.add(agent_id)
+        entry = (self.score(agent), agent_id, version)
+        for capability in capabilities:
+            self._members[capability].add(agent_id)
+            heap = self._heaps[capability]
+            heapq.heappush(heap, entry)
+            if len(heap) > 2 * len(self._members[capability]) + 16:
+                self._heaps[capability] = [item for item in heap if self._versions.get(item[1]) == item[2]]
+                heapq.heapify(self._heaps[capability])
+    
+    def remove(self, agent_id: str):
+        self._drop(agent_id)
+        self._versions.pop(agent_id, None)
+    
+    def _drop(self, agent_id: str):
+        self._versions[agent_id] = self._versions.get(agent_id, 0) + 1
+        self._assignable.discard(agent_id)
+        for capability in self._capabilities.pop(agent_id, ()):
+            self._members[capability].discard(agent_id)
+    
+    def best(self, capabilities: List[str]) -> Optional[str]:
+        """Lowest-scoring assignable agent offering any of ``capabilities``"""
+        best = None
+        for capability in capabilities:
+            heap = self._heaps.get(capability)
+            while heap and self._versions.get(heap[0][1]) != heap[0][2]:
+                heapq.heappop(heap)
+            if heap and (best is None or heap[0] < best):
+                best = heap[0]
+        return best[1] if best else None
+    
+    def has_capacity(self) -> bool:
+        return bool(self._assignable)
+
+class DeadlineQueue:
+    """Min-heap of deadlines on the monotonic clock, one live deadline per key.
+    
+    Rescheduling a key pushes a new entry and leaves the old one to be skipped when it
+    surfaces, so a heartbeat costs O(log n) and a tick only inspects expired entries.
+    """
+    
+    def __init__(self):
+        self._heap: List[tuple] = []
+        self._deadlines: Dict[Any, float] = {}
+    
+    def schedule(self, key: Any, deadline: float):
+        self._deadlines[key] = deadline
+        heapq.heappush(self._heap, (deadline, key))
+        if len(self._heap) > 2 * len(self._deadlines) + 64:
+            self._heap = [(when, item) for item, when in self._deadlines.items()]
+            heapq.heapify(self._heap)
+    
+    def cancel(self, key: Any):
+        self._deadlines.pop(key, None)
+    
+    def pop_expired(self, now: float) -> List[Any]:
+        """Remove and return every key whose current deadline is at or before ``now``"""
+        expired = []
+        while self._heap and self._heap[0][0] <= now:
+            deadline, key = heapq.heappop(self._heap)
+            if self._deadlines.get(key) == deadline:
+                del self._deadlines[key]
+                expired.append(key)
+        return expired
+    
+    def next_deadline(self) -> Optional[float]:
+        while self._heap and self._deadlines.get(self._heap[0][1]) != self._heap[0][0]:
+            heapq.heappop(self._heap)
+        return self._heap[0][0] if self._heap else None
+
+class DashboardCacheWriter:
+    """Coalescing, atomic writer for the dashboard cache file.
+    
+    ``request`` writes at most once per ``min_interval``; calls in between schedule a single
+    trailing write of the latest state. Files are replaced via tmp+rename, so readers never
+    see a torn document. With ``delta_log`` every write also appends one JSON line holding
+    only the agents and tasks that changed since the previous write. The document records
+    the ``delta_seq`` it already contains, so a reader loads it once and then follows lines
+    with a higher ``seq``. A line with ``"reset": true`` means the log restarted (first write,
+    or after it outgrew ``delta_log_max_bytes``) and the document must be re-read. The document
+    is replaced before its line is written, so it is never older than the last line a reader saw.
+    """
+    
+    def __init__(self, path: Path, min_interval: float = 10.0, compact: bool = False,
+                 delta_log: bool = False, delta_log_max_bytes: int = 5 * 1024 * 1024):
+        self.path = path
+        self.delta_path = path.with_suffix(".deltas.jsonl")
+        self.min_interval = min_interval
+        self.compact = compact
+        self.delta_log = delta_log
+        self.delta_log_max_bytes = delta_log_max_bytes
+        self.writes = 0
+        self.coalesced = 0
+        self._build: Optional[Callable[[], Dict[str, Any]]] = None
+        self._pending: Optional[asyncio.TimerHandle] = None
+        self._last_write = float("-inf")
+        self._previous: Optional[Dict[str, Any]] = None
+        self._seq = 0
+    
+    def request(self, build: Callable[[], Dict[str, Any]]):
+        """Write ``build()`` now if the last write is old enough, otherwise once the interval ends"""
+        self._build = build
+        if self._pending is not None:
+            self.coalesced += 1
+            return
+        wait = self._last_write + self.min_interval - time.monotonic()
+        if wait <= 0:
+            self.flush()
+        else:
+            self._pending = asyncio.get_running_loop().call_later(wait, self.flush)
+    
+    def flush(self, build: Optional[Callable[[], Dict[str, Any]]] = None):
+        """Write the latest requested state (or ``build()``) immediately"""
+        if build is not None:
+            self._build = build
+        if self._pending is not None:
+            self._pending.cancel()
+            self._pending = None
+        if self._build is None:
+            return
+        status = self._build()
+        self._last_write = time.monotonic()
+        delta = self._next_delta(status) if self.delta_log else None
+        self._replace(self.path, self._dumps(status))
+        if delta is not None:
+            self._write_delta(*delta)
+        self.writes += 1
+    
+    def _dumps(self, payload: Dict[str, Any]) -> str:
+        if self.compact:
+            return json.dumps(payload, separators=(",", ":"))
+        return json.dumps(payload, indent=2)
+    
+    @staticmethod
+    def _replace(path: Path, text: str):
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(text)
+        os.replace(tmp, path)
+    
+    def _next_delta(self, status: Dict[str, Any]) -> tuple:
+        """Stamp ``status`` with the next ``delta_seq`` and return its log line and whether it resets the log"""
+        self._seq += 1
+        previous = self._previous
+        rotate = previous is None or (
+            self.delta_path.exists() and self.delta_path.stat().st_size > self.delta_log_max_bytes
+        )
+        if rotate:
+            record = {"seq": self._seq, "timestamp": status["timestamp"], "reset": True}
+        else:
+            record = {"seq": self._seq, "timestamp": status["timestamp"]}
+            if status["communication_layer"] != previous["communication_layer"]:
+                record["communication_layer"] = status["communication_layer"]
+            for section in ("agents", "tasks"):
+                current, before = status[section], previous[section]
+                changed = {key: value for key, value in current.items() if before.get(key) != value}
+                removed = [key for key in before if key not in current]
+                if changed:
+                    record[section] = changed
+                if removed:
+                    record[f"removed_{section}"] = removed
+        status["delta_seq"] = self._seq
+        self._previous = status
+        return json.dumps(record, separators=(",", ":")) + "\n", rotate
+    
+    def _write_delta(self, line: str, rotate: bool):
+        if rotate:
+            self._replace(self.delta_path, line)
+        else:
+            with open(self.delta_path, "a") as handle:
+                handle.write(line)
+
 class InterAgentCommunicationLayer:
     """Advanced NATS-based communication layer for multi-agent coordination"""
     
-    def __init__(self, nats_url: str = "nats://localhost:4223", environment: str = "dev"):
+    def __init__(self, nats_url: str = "nats://localhost:4223", environment: str = "dev",
+                 cache_interval: float = 10.0, compact_cache: bool = False, cache_delta_log: bool = False,
+                 heartbeat_timeout: float = 60.0, rebalance_interval: float = 0.5, revoke_timeout: float = 2.0):
         self.nats_url = nats_url
         self.environment = environment
         self.nc = None
@@ -118,17 +332,37 @@ class InterAgentCommunicationLayer:
         self.agents: Dict[str, Agent] = {}
         self.tasks: Dict[str, Task] = {}
         self.sync_points: Dict[str, SyncPoint] = {}
-        self.task_queues: Dict[TaskPriority, deque] = {
-            TaskPriority.CRITICAL: deque(),
-            TaskPriority.HIGH: deque(),
-            TaskPriority.MEDIUM: deque(),
-            TaskPriority.LOW: deque()
-        }
+        
+        # Dependency-aware scheduling: tasks move to the ready heap the moment their last
+        # dependency completes, and the scheduler wakes on events instead of polling.
+        self._ready_tasks: List[tuple] = []  # heap of (priority, sequence, task_id)
+        self._task_sequence = itertools.count()
+        self._waiting_on: Dict[str, Set[str]] = {}  # task_id -> unfinished dependency ids
+        self._dependents: Dict[str, Set[str]] = defaultdict(set)  # dependency id -> waiting task_ids
+        self._schedule_event = asyncio.Event()
+        self.capability_index = CapabilityIndex()
+        
+        # Heartbeat expiry and sync point timeouts, keyed ("agent", id) / ("sync", id)
+        self.heartbeat_timeout = heartbeat_timeout
+        self._deadlines = DeadlineQueue()
+        
+        # Work stealing: passes run when queue depths change, at most once per rebalance_interval
+        self.rebalance_interval = rebalance_interval
+        self.revoke_timeout = revoke_timeout
+        self._rebalance_event = asyncio.Event()
+        self._revocations: Dict[str, str] = {}  # task_id -> agent it is being moved to
+        self._queue_states: Dict[str, tuple] = {}  # agent_id -> (ASSIGNED depth, free slot) at its last heartbeat
         
         # Coordination state
         self.running = False
         self.cache_dir = Path.home() / ".hero_core" / "cache"
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.dashboard_cache = DashboardCacheWriter(
+            self.cache_dir / "communication_layer.json",
+            min_interval=cache_interval,
+            compact=compact_cache,
+            delta_log=cache_delta_log
+        )
         
         # Performance tracking
         self.metrics = {
@@ -137,7 +371,8 @@ class InterAgentCommunicationLayer:
             "tasks_distributed": 0,
             "sync_operations": 0,
             "agent_registrations": 0,
-            "load_balancing_operations": 0
+            "load_balancing_operations": 0,
+            "tasks_rebalanced": 0
         }
         
         # Background tasks
@@ -277,6 +512,8 @@ class InterAgentCommunicationLayer:
         try:
             # Store agent locally
             self.agents[agent.agent_id] = agent
+            self.capability_index.update(agent)
+            self._deadlines.schedule(("agent", agent.agent_id), time.monotonic() + self.heartbeat_timeout)
             self.metrics["agent_registrations"] += 1
             
             # Publish registration event
@@ -289,6 +526,8 @@ class InterAgentCommunicationLayer:
             
             logger.info(f"✅ Registered agent: {agent.name} ({agent.agent_id})")
             await self._update_dashboard_cache()
+            self._wake_scheduler()
+            self._rebalance_event.set()
             
             return True
             
@@ -301,12 +540,20 @@ class InterAgentCommunicationLayer:
         if agent_id in self.agents:
             self.agents[agent_id].status = status
             self.agents[agent_id].last_heartbeat = datetime.now().isoformat()
+            self.capability_index.update(self.agents[agent_id])
+            if status == AgentStatus.OFFLINE:
+                self._deadlines.cancel(("agent", agent_id))
+            else:
+                self._deadlines.schedule(("agent", agent_id), time.monotonic() + self.heartbeat_timeout)
             
             await self._publish_event("agent_status_updated", {
                 "agent_id": agent_id,
                 "status": status.value,
                 "data": data or {}
             })
+            if status in [AgentStatus.ONLINE, AgentStatus.IDLE]:
+                self._wake_scheduler()
+                self._rebalance_event.set()
     
     # Task Distribution System
     async def create_task(self, task_type: str, description: str, data: Dict[str, Any],
@@ -330,8 +577,8 @@ class InterAgentCommunicationLayer:
         # Store task
         self.tasks[task_id] = task
         
-        # Queue for processing
-        self.task_queues[priority].append(task_id)
+        # Queue for processing, or park it until its dependencies complete
+        self._enqueue_task(task)
         
         # Publish task created event
         await self._publish_event("task_created", {
@@ -343,9 +590,38 @@ class InterAgentCommunicationLayer:
         
         logger.info(f"📋 Created task {task_id}: {description}")
         self.metrics["tasks_distributed"] += 1
+        self._wake_scheduler()
         
         return task_id
     
+    def _enqueue_task(self, task: Task):
+        """Push a task onto the ready heap, or register it against its unfinished dependencies"""
+        unmet = self._unmet_dependencies(task)
+        if unmet:
+            self._waiting_on[task.task_id] = unmet
+            for dep_id in unmet:
+                self._dependents[dep_id].add(task.task_id)
+        else:
+            heapq.heappush(self._ready_tasks, (task.priority.value, next(self._task_sequence), task.task_id))
+    
+    def _release_dependents(self, task_id: str):
+        """Move tasks whose last unfinished dependency was ``task_id`` onto the ready heap"""
+        for dependent_id in self._dependents.pop(task_id, set()):
+            unmet = self._waiting_on.get(dependent_id)
+            if unmet is None:
+                continue
+            unmet.discard(task_id)
+            if not unmet:
+                del self._waiting_on[dependent_id]
+                dependent = self.tasks.get(dependent_id)
+                if dependent is not None and dependent.status == TaskStatus.PENDING:
+                    heapq.heappush(self._ready_tasks, (dependent.priority.value, next(self._task_sequence), dependent_id))
+                    self._wake_scheduler()
+    
+    def _wake_scheduler(self):
+        """Signal the scheduler that a task became ready or an agent gained capacity"""
+        self._schedule_event.set()
+    
     async def assign_task(self, task_id: str, agent_id: str = None) -> bool:
         """Assign task to specific agent or best available agent"""
         if task_id not in self.tasks:
@@ -375,11 +651,14 @@ class InterAgentCommunicationLayer:
         task.assigned_agent = agent_id
         task.status = TaskStatus.ASSIGNED
         agent.current_tasks.append(task_id)
+        self.capability_index.update(agent)
+        if len(agent.current_tasks) >= agent.max_concurrent_tasks:
+            self._rebalance_event.set()
         
         # Send task to agent
         await self.nc.publish(
             f"hero.v1.{self.environment}.agents.{agent_id}.tasks.assign",
-            json.dumps(asdict(task)).encode()
+            json.dumps(asdict(task), default=_enum_value).encode()
         )
         
         # Publish assignment event
@@ -394,28 +673,9 @@ class InterAgentCommunicationLayer:
     
     async def _find_best_agent_for_task(self, task: Task) -> Optional[str]:
         """Find the best available agent for a task using load balancing"""
-        suitable_agents = []
-        
-        for agent_id, agent in self.agents.items():
-            # Check if agent is online and not at capacity
-            if (agent.status in [AgentStatus.ONLINE, AgentStatus.IDLE] and 
-                len(agent.current_tasks) < agent.max_concurrent_tasks):
-                
-                # Check if agent has required capabilities
-                if any(capability in agent.capabilities for capability in [task.task_type, "general"]):
-                    load_score = len(agent.current_tasks) / agent.max_concurrent_tasks
-                    performance_score = agent.performance_score
-                    
-                    # Combined score (lower is better for load, higher is better for performance)
-                    score = load_score - (performance_score * 0.3)
-                    suitable_agents.append((agent_id, score))
-        
-        if not suitable_agents:
-            return None
-        
-        # Return agent with best score
-        suitable_agents.sort(key=lambda x: x[1])
-        return suitable_agents[0][0]
+        # Online/idle agents below capacity that can run the task type or anything "general",
+        # lowest load-minus-performance score first
+        return self.capability_index.best([task.task_type, "general"])
     
     # Synchronization System
     async def create_sync_point(self, sync_id: str, required_agents: Set[str], 
@@ -433,6 +693,7 @@ class InterAgentCommunicationLayer:
         )
         
         self.sync_points[sync_id] = sync_point
+        self._deadlines.schedule(("sync", sync_id), time.monotonic() + timeout_seconds)
         
         # Notify required agents
         for agent_id in required_agents:
@@ -487,6 +748,7 @@ class InterAgentCommunicationLayer:
         
         # Clean up
         del self.sync_points[sync_id]
+        self._deadlines.cancel(("sync", sync_id))
         
         logger.info(f"✅ Sync point {sync_id} completed successfully")
     
@@ -523,6 +785,7 @@ class InterAgentCommunicationLayer:
             if agent_id in self.agents:
                 self.agents[agent_id].last_heartbeat = datetime.now().isoformat()
                 self.agents[agent_id].status = AgentStatus(data.get("status", "online"))
+                self._deadlines.schedule(("agent", agent_id), time.monotonic() + self.heartbeat_timeout)
                 
                 # Update performance metrics if provided
                 if "metrics" in data:
@@ -538,6 +801,16 @@ class InterAgentCommunicationLayer:
                     if total > 0:
                         agent.performance_score = agent.completed_tasks / total
                 
+                self.capability_index.update(self.agents[agent_id])
+                if self.agents[agent_id].status in CapabilityIndex.ASSIGNABLE:
+                    self._wake_scheduler()
+                
+                # Steady heartbeats leave the balancer asleep; only a moved backlog or slot wakes it
+                queue_state = self._queue_state(self.agents[agent_id])
+                if self._queue_states.get(agent_id) != queue_state:
+                    self._queue_states[agent_id] = queue_state
+                    self._rebalance_event.set()
+                
         except Exception as e:
             logger.error(f"Error handling heartbeat: {e}")
     
@@ -550,7 +823,21 @@ class InterAgentCommunicationLayer:
             
             if task_id in self.tasks:
                 task = self.tasks[task_id]
+                if task.assigned_agent != agent_id:
+                    # Late answer from an agent the task was revoked from, even if nobody holds it now
+                    logger.info(f"Ignoring response for task {task_id} from {agent_id}; it belongs to {task.assigned_agent or 'no agent'}")
+                    return
                 task.status = TaskStatus(data["status"])
+                
+                # Acceptance only marks the start; the agent keeps its slot until a final status
+                if task.status == TaskStatus.IN_PROGRESS:
+                    task.started_at = datetime.now().isoformat()
+                    await self._publish_event("task_started", {
+                        "task_id": task_id,
+                        "agent_id": agent_id
+                    })
+                    return
+                
                 task.completed_at = datetime.now().isoformat()
                 task.result = data.get("result", {})
                 
@@ -566,6 +853,7 @@ class InterAgentCommunicationLayer:
                     elif task.status == TaskStatus.FAILED:
                         agent.failed_tasks += 1
                         agent.total_tasks += 1
+                    self.capability_index.update(agent)
                 
                 # Publish task completion event
                 await self._publish_event("task_completed", {
@@ -577,6 +865,11 @@ class InterAgentCommunicationLayer:
                 
                 logger.info(f"✅ Task {task_id} completed by {agent_id}: {task.status.value}")
                 
+                if task.status == TaskStatus.COMPLETED:
+                    self._release_dependents(task_id)
+                self._wake_scheduler()
+                self._rebalance_event.set()
+                
         except Exception as e:
             logger.error(f"Error handling task response: {e}")
     
@@ -594,98 +887,175 @@ class InterAgentCommunicationLayer:
     
     # Background Tasks
     async def _task_scheduler(self):
-        """Background task scheduler"""
+        """Background task scheduler, woken by task creation, completion and agent capacity"""
         while self.running:
             try:
-                # Process tasks by priority
-                for priority in [TaskPriority.CRITICAL, TaskPriority.HIGH, TaskPriority.MEDIUM, TaskPriority.LOW]:
-                    queue = self.task_queues[priority]
-                    
-                    while queue and self.running:
-                        task_id = queue.popleft()
-                        if task_id in self.tasks:
-                            task = self.tasks[task_id]
-                            
-                            # Check dependencies
-                            if await self._check_task_dependencies(task):
-                                await self.assign_task(task_id)
-                            else:
-                                # Re-queue task
-                                queue.append(task_id)
-                                break
-                
-                await asyncio.sleep(1)  # Check every second
+                await self._schedule_event.wait()
+                self._schedule_event.clear()
+                await self._dispatch_ready_tasks()
                 
+            except asyncio.CancelledError:
+                raise
             except Exception as e:
                 logger.error(f"Error in task scheduler: {e}")
                 await asyncio.sleep(5)
+                self._wake_scheduler()
+    
+    async def _dispatch_ready_tasks(self):
+        """Assign ready tasks in priority order; tasks no agent can take wait for the next event"""
+        parked = []
+        while self._ready_tasks and self.running:
+            entry = heapq.heappop(self._ready_tasks)
+            task = self.tasks.get(entry[2])
+            if task is None or task.status != TaskStatus.PENDING:
+                continue
+            if not await self.assign_task(task.task_id):
+                # A task without a capable agent must not hold back the ones behind it
+                parked.append(entry)
+                if not self._has_free_capacity():
+                    break
+        for entry in parked:
+            heapq.heappush(self._ready_tasks, entry)
+    
+    def _queue_state(self, agent: Agent) -> tuple:
+        """An agent's ASSIGNED (not yet accepted) depth and whether it can take another task"""
+        queued = sum(
+            1 for task_id in agent.current_tasks
+            if task_id in self.tasks and self.tasks[task_id].status == TaskStatus.ASSIGNED
+        )
+        free = agent.status in CapabilityIndex.ASSIGNABLE and len(agent.current_tasks) < agent.max_concurrent_tasks
+        return queued, free
+    
+    def _has_free_capacity(self) -> bool:
+        """Whether any assignable agent has a free task slot"""
+        return self.capability_index.has_capacity()
     
     async def _load_balancer(self):
-        """Background load balancing"""
+        """Background load balancing, woken when an agent saturates or frees a slot"""
         while self.running:
             try:
-                # Calculate load metrics
-                total_load = 0
-                agent_loads = {}
+                await self._rebalance_event.wait()
+                self._rebalance_event.clear()
                 
+                # Queue depth per agent: tasks assigned to it that it has not accepted yet
+                agent_loads = {}
+                queued = {}
                 for agent_id, agent in self.agents.items():
                     if agent.status in [AgentStatus.ONLINE, AgentStatus.BUSY, AgentStatus.IDLE]:
-                        load = len(agent.current_tasks) / agent.max_concurrent_tasks
-                        agent_loads[agent_id] = load
-                        total_load += load
+                        agent_loads[agent_id] = len(agent.current_tasks) / agent.max_concurrent_tasks
+                        queued[agent_id] = self._queue_state(agent)[0]
                 
-                if len(agent_loads) > 1:
-                    avg_load = total_load / len(agent_loads)
-                    
-                    # Find overloaded and underloaded agents
-                    overloaded = [(aid, load) for aid, load in agent_loads.items() if load > avg_load + 0.2]
-                    underloaded = [(aid, load) for aid, load in agent_loads.items() if load < avg_load - 0.2]
-                    
-                    # Rebalance if needed
-                    if overloaded and underloaded:
-                        await self._rebalance_tasks(overloaded, underloaded)
+                # Agents with a backlog are sources, assignable agents with a free slot are thieves
+                overloaded = [(aid, load) for aid, load in agent_loads.items() if queued[aid] > 0]
+                underloaded = [
+                    (aid, load) for aid, load in agent_loads.items()
+                    if load < 1 and self.agents[aid].status in CapabilityIndex.ASSIGNABLE
+                ]
+                
+                # Rebalance if needed
+                if overloaded and underloaded:
+                    await self._rebalance_tasks(overloaded, underloaded)
                 
                 self.metrics["load_balancing_operations"] += 1
-                await asyncio.sleep(30)  # Check every 30 seconds
+                await asyncio.sleep(self.rebalance_interval)  # Coalesce bursts of depth changes
                 
+            except asyncio.CancelledError:
+                raise
             except Exception as e:
                 logger.error(f"Error in load balancer: {e}")
-                await asyncio.sleep(60)
+                await asyncio.sleep(5)
+    
+    async def _rebalance_tasks(self, overloaded: List[tuple], underloaded: List[tuple]):
+        """Steal assigned-but-unaccepted tasks from overloaded agents for underloaded ones"""
+        projected = dict(underloaded + overloaded)
+        moves = []
+        for agent_id, _ in sorted(overloaded, key=lambda item: item[1], reverse=True):
+            source = self.agents[agent_id]
+            for task_id in list(source.current_tasks):
+                task = self.tasks.get(task_id)
+                if task is None or task.status != TaskStatus.ASSIGNED or task_id in self._revocations:
+                    continue
+                candidates = [
+                    candidate for candidate, _ in underloaded
+                    if candidate != agent_id and projected[candidate] < 1
+                    and any(c in self.agents[candidate].capabilities for c in [task.task_type, "general"])
+                ]
+                if not candidates:
+                    continue
+                target = min(candidates, key=lambda candidate: projected[candidate])
+                step = 1 / self.agents[target].max_concurrent_tasks
+                # Only move work if it leaves the thief less loaded than the victim was
+                if projected[target] + step >= projected[agent_id]:
+                    continue
+                projected[target] += step
+                projected[agent_id] -= 1 / source.max_concurrent_tasks
+                self._revocations[task_id] = target
+                moves.append(self._move_task(task, agent_id, target))
+        if moves:
+            await asyncio.gather(*moves)
+    
+    async def _move_task(self, task: Task, source_id: str, target_id: str) -> bool:
+        """Revoke ``task`` from ``source_id`` and, once the agent acks, assign it to ``target_id``"""
+        try:
+            reply = await self.nc.request(
+                f"hero.v1.{self.environment}.agents.{source_id}.tasks.revoke",
+                json.dumps({"task_id": task.task_id, "reason": "rebalance", "target_agent": target_id}).encode(),
+                timeout=self.revoke_timeout
+            )
+            ack = json.loads(reply.data.decode())
+        except Exception as e:
+            logger.warning(f"Revoke of task {task.task_id} from {source_id} got no ack: {e}")
+            return False
+        finally:
+            self._revocations.pop(task.task_id, None)
+        
+        # The agent may have accepted the task while the revoke was in flight
+        if not ack.get("revoked") or task.status != TaskStatus.ASSIGNED or task.assigned_agent != source_id:
+            return False
+        
+        source = self.agents.get(source_id)
+        if source and task.task_id in source.current_tasks:
+            source.current_tasks.remove(task.task_id)
+            self.capability_index.update(source)
+        task.status = TaskStatus.PENDING
+        task.assigned_agent = None
+        self.metrics["tasks_rebalanced"] += 1
+        await self._publish_event("task_revoked", {
+            "task_id": task.task_id,
+            "agent_id": source_id,
+            "target_agent": target_id
+        })
+        logger.info(f"🔀 Moved task {task.task_id} from {source_id} to {target_id}")
+        
+        if not await self.assign_task(task.task_id, target_id):
+            heapq.heappush(self._ready_tasks, (task.priority.value, next(self._task_sequence), task.task_id))
+            self._wake_scheduler()
+        return True
     
     async def _health_monitor(self):
-        """Background health monitoring"""
+        """Background health monitoring: expire stale heartbeats and sync points as their deadlines pass"""
         while self.running:
             try:
-                current_time = datetime.now()
-                stale_agents = []
-                
-                for agent_id, agent in self.agents.items():
-                    # Check if agent heartbeat is stale (>60 seconds)
-                    last_heartbeat = datetime.fromisoformat(agent.last_heartbeat)
-                    if (current_time - last_heartbeat).total_seconds() > 60:
-                        stale_agents.append(agent_id)
-                
-                # Mark stale agents as offline
-                for agent_id in stale_agents:
-                    await self.update_agent_status(agent_id, AgentStatus.OFFLINE)
-                    logger.warning(f"⚠️ Agent {agent_id} marked offline due to stale heartbeat")
-                
-                # Check for timed out sync points
-                expired_syncs = []
-                for sync_id, sync_point in self.sync_points.items():
-                    if current_time > sync_point.timeout:
-                        expired_syncs.append(sync_id)
+                for kind, key in self._deadlines.pop_expired(time.monotonic()):
+                    if kind == "agent" and key in self.agents:
+                        # Mark stale agents as offline
+                        await self.update_agent_status(key, AgentStatus.OFFLINE)
+                        logger.warning(f"⚠️ Agent {key} marked offline due to stale heartbeat")
+                    elif kind == "sync" and key in self.sync_points:
+                        # Clean up expired sync points
+                        logger.warning(f"⚠️ Sync point {key} timed out")
+                        del self.sync_points[key]
                 
-                # Clean up expired sync points
-                for sync_id in expired_syncs:
-                    logger.warning(f"⚠️ Sync point {sync_id} timed out")
-                    del self.sync_points[sync_id]
-                
-                await asyncio.sleep(30)  # Check every 30 seconds
+                # Wake for the next deadline, and at least once a second
+                next_deadline = self._deadlines.next_deadline()
+                delay = 1.0 if next_deadline is None else min(1.0, next_deadline - time.monotonic())
+                await asyncio.sleep(max(0.0, delay))
                 
+            except asyncio.CancelledError:
+                raise
             except Exception as e:
                 logger.error(f"Error in health monitor: {e}")
-                await asyncio.sleep(60)
+                await asyncio.sleep(1)
     
     async def _metrics_collector(self):
         """Background metrics collection"""
@@ -714,9 +1084,10 @@ class InterAgentCommunicationLayer:
                             if (current_time - completed_time).total_seconds() > 3600:  # 1 hour
                                 tasks_to_remove.append(task_id)
                 
-                # Remove old tasks
+                # Remove old tasks; dependencies that are gone count as satisfied
                 for task_id in tasks_to_remove:
                     del self.tasks[task_id]
+                    self._release_dependents(task_id)
                 
                 await asyncio.sleep(300)  # Clean up every 5 minutes
                 
@@ -743,16 +1114,22 @@ class InterAgentCommunicationLayer:
     
     async def _check_task_dependencies(self, task: Task) -> bool:
         """Check if task dependencies are satisfied"""
-        for dep_id in task.dependencies:
-            if dep_id in self.tasks:
-                dep_task = self.tasks[dep_id]
-                if dep_task.status != TaskStatus.COMPLETED:
-                    return False
-        return True
+        return not self._unmet_dependencies(task)
+    
+    def _unmet_dependencies(self, task: Task) -> Set[str]:
+        """Known dependencies of ``task`` that have not completed yet"""
+        return {
+            dep_id for dep_id in task.dependencies
+            if dep_id in self.tasks and self.tasks[dep_id].status != TaskStatus.COMPLETED
+        }
     
     async def _update_dashboard_cache(self):
-        """Update dashboard cache with current communication state"""
-        status = {
+        """Update dashboard cache with current communication state, coalescing bursts into one write"""
+        self.dashboard_cache.request(self._dashboard_status)
+    
+    def _dashboard_status(self) -> Dict[str, Any]:
+        """Current communication state in the communication_layer.json shape"""
+        return {
             "timestamp": datetime.now().isoformat(),
             "environment": self.environment,
             "nats_connected": self.nc is not None and not self.nc.is_closed,
@@ -764,7 +1141,9 @@ class InterAgentCommunicationLayer:
                 "active_tasks": len([t for t in self.tasks.values() if t.status in [TaskStatus.PENDING, TaskStatus.ASSIGNED, TaskStatus.IN_PROGRESS]]),
                 "completed_tasks": len([t for t in self.tasks.values() if t.status == TaskStatus.COMPLETED]),
                 "sync_points": len(self.sync_points),
-                "metrics": self.metrics.copy()
+                "metrics": self.metrics.copy(),
+                "cache_writes": self.dashboard_cache.writes,
+                "cache_writes_coalesced": self.dashboard_cache.coalesced
             },
             "agents": {
                 agent_id: {
@@ -797,11 +1176,6 @@ class InterAgentCommunicationLayer:
                 } for task_id, task in self.tasks.items()
             }
         }
-        
-        # Write to cache
-        cache_file = self.cache_dir / "communication_layer.json"
-        with open(cache_file, 'w') as f:
-            json.dump(status, f, indent=2)
     
     def _calculate_task_duration(self, task: Task) -> Optional[float]:
         """Calculate task duration in seconds"""
@@ -848,6 +1222,9 @@ class InterAgentCommunicationLayer:
         if self.nc:
             await self.nc.close()
         
+        # Leave the final offline state on disk instead of waiting out the write interval
+        self.dashboard_cache.flush(self._dashboard_status)
+        
         logger.info("✅ Inter-agent communication layer shut down")
 
 # Additional handlers and utility classes would continue here...
@@ -0,0 +1,391 @@
+"""Load benchmark for the dashboard API against deterministic fake probe backends.
+
+Not collected by pytest. Run it directly from the repo root:
+
+    python tests/bench_web_dashboard.py --clients 16 --duration 15 --output bench.json
+    python tests/bench_web_dashboard.py --compare bench.json
+
+The app runs in-process under uvicorn with ``HOME`` pointed at a throwaway directory. The
+process table is synthetic and every scan or ``pgrep`` sleeps ``--pgrep-delay``. Hermes ports,
+the Droid bridge and the GBrain endpoint are served by a local HTTP server that sleeps
+``--http-delay`` per request. Each WORKFLOWS lane is a generated tree of ``--tree-dirs``
+directories with ``--tree-files`` files apiece. Clients hold keep-alive connections and pick
+endpoints from ``--mix`` until ``--duration`` runs out.
+"""
+
+from __future__ import annotations
+
+import argparse
+import http.client
+import json
+import os
+import platform
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+LANES = (
+    "content-engine/inbox",
+    "knowledge-router/inbox",
+    "build-engine/inbox",
+    "workflow-02-packet-promotion/state",
+    "workflow-03-opportunity-review-gate",
+    "control-plane",
+)
+ENDPOINTS = {
+    "status": ("GET", "/api/status"),
+    "labyrinth": ("GET", "/api/labyrinth"),
+    "action": ("POST", "/api/actions/refresh_status"),
+}
+FAKE_PROCESSES = [
+    (4101, "python -m hermes gateway run --profile tg-alpha"),
+    (4102, "python -m webapi --port 8642"),
+    (4103, "python -m hermes gateway run --profile tg-beta"),
+    (4201, "droid exec --bridge"),
+    (4301, "uvicorn web_dashboard:app"),
+] + [(5000 + index, f"/usr/bin/worker --shard {index}") for index in range(400)]
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=8, help="concurrent keep-alive clients")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds of load per run")
+    parser.add_argument("--mix", default="status=4,labyrinth=3,action=1", help="weighted endpoint mix")
+    parser.add_argument("--pgrep-delay", type=float, default=0.05, help="seconds per process scan or pgrep")
+    parser.add_argument("--pgrep-fallback", action="store_true", help="skip the process index and fork pgrep per query")
+    parser.add_argument("--http-delay", type=float, default=0.2, help="seconds per fake upstream HTTP request")
+    parser.add_argument("--tree-dirs", type=int, default=200, help="directories per WORKFLOWS lane")
+    parser.add_argument("--tree-files", type=int, default=20, help="files per generated directory")
+    parser.add_argument("--snapshot-ttl", type=float, default=5.0, help="HERO_SNAPSHOT_TTL for the run")
+    parser.add_argument("--scheduler", action="store_true", help="run the background probe scheduler")
+    parser.add_argument("--seed", type=int, default=1, help="seed for the client endpoint choice")
+    parser.add_argument("--output", type=Path, help="write the result JSON here (use as a baseline)")
+    parser.add_argument("--compare", type=Path, help="baseline JSON to compare this run against")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed relative regression")
+    return parser.parse_args(argv)
+
+
+def parse_mix(raw: str) -> list[tuple[str, int]]:
+    mix = []
+    for item in raw.split(","):
+        name, _, weight = item.partition("=")
+        name = name.strip()
+        if name not in ENDPOINTS:
+            raise SystemExit(f"unknown endpoint in --mix: {name} (choose from {', '.join(ENDPOINTS)})")
+        mix.append((name, int(weight or 1)))
+    return mix
+
+
+class SlowUpstream(BaseHTTPRequestHandler):
+    delay = 0.0
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        time.sleep(self.delay)
+        body = b'{"ok":true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, _format: str, *_args) -> None:
+        return
+
+
+def start_upstream(delay: float) -> ThreadingHTTPServer:
+    handler = type("Upstream", (SlowUpstream,), {"delay": delay})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="bench-upstream", daemon=True).start()
+    return server
+
+
+def build_fixture(home: Path, args: argparse.Namespace, upstream_port: int) -> dict[str, str]:
+    workflows = home / "WORKFLOWS"
+    for lane in LANES:
+        for index in range(args.tree_dirs):
+            directory = workflows / lane / f"d{index // 20:03d}" / f"d{index:04d}"
+            directory.mkdir(parents=True, exist_ok=True)
+            for number in range(args.tree_files):
+                (directory / f"item-{number:03d}.md").write_text("x\n", encoding="utf-8")
+    git_dir = workflows / ".git"
+    (git_dir / "refs" / "heads").mkdir(parents=True, exist_ok=True)
+    (git_dir / "HEAD").write_text("ref: refs/heads/main\n", encoding="utf-8")
+    (git_dir / "refs" / "heads" / "main").write_text("0" * 40 + "\n", encoding="utf-8")
+
+    hermes = home / ".hermes"
+    for profile in ("tg-alpha", "tg-beta", "synthesizer"):
+        profile_dir = hermes / "profiles" / profile
+        profile_dir.mkdir(parents=True, exist_ok=True)
+        (profile_dir / "config.yaml").write_text(
+            "telegram:\n  enabled: true\nmodel:\n  default: bench-model\n", encoding="utf-8"
+        )
+    (hermes / "config.yaml").write_text(
+        f"mcp_servers:\n  gbrain:\n    url: http://127.0.0.1:{upstream_port}/mcp\n", encoding="utf-8"
+    )
+    (home / "brain").mkdir(exist_ok=True)
+    factory = home / ".factory"
+    factory.mkdir(exist_ok=True)
+    (factory / "settings.json").write_text(
+        json.dumps({"customModels": [{"model": "bench", "baseUrl": f"http://127.0.0.1:{upstream_port}/v1"}]}),
+        encoding="utf-8",
+    )
+    canon = home / "wiki" / "queries" / "grok420system.md"
+    canon.parent.mkdir(parents=True, exist_ok=True)
+    canon.write_text("# Topic ownership\n", encoding="utf-8")
+    return {
+        "HOME": str(home),
+        "HERO_WORKFLOWS_ROOT": str(workflows),
+        "HERO_WEBAPI_PORT": str(upstream_port),
+        "HERO_WORKSPACE_PORT": str(upstream_port),
+        "HERO_DROID_BRIDGE_PORT": str(upstream_port),
+        "HERO_SNAPSHOT_TTL": str(args.snapshot_ttl),
+        "HERO_PROBE_SCHEDULER": "1" if args.scheduler else "0",
+        # Spawned probe workers would not see the fake process table.
+        "HERO_PROBE_ISOLATION": "0",
+        "HERO_BOOT_TOKEN": "bench",
+    }
+
+
+def install_fake_processes(web_dashboard, args: argparse.Namespace) -> None:
+    def fake_scan():
+        time.sleep(args.pgrep_delay)
+        return None if args.pgrep_fallback else list(FAKE_PROCESSES)
+
+    def fake_pgrep(pattern: str) -> list[str]:
+        web_dashboard.count_spawn("pgrep")
+        time.sleep(args.pgrep_delay)
+        return [f"{pid} {command}" for pid, command in FAKE_PROCESSES if pattern in command]
+
+    web_dashboard.process_index._scan = fake_scan
+    web_dashboard.pgrep_subprocess = fake_pgrep
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(app, port: int):
+    import uvicorn
+
+    config = uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning", access_log=False)
+    server = uvicorn.Server(config)
+    thread = threading.Thread(target=server.run, name="bench-uvicorn", daemon=True)
+    thread.start()
+    deadline = time.monotonic() + 30
+    while not server.started:
+        if time.monotonic() > deadline or not thread.is_alive():
+            raise SystemExit("dashboard server did not start")
+        time.sleep(0.05)
+    return server, thread
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, min(len(sorted_values), round(pct / 100 * len(sorted_values) + 0.5)))
+    return sorted_values[rank - 1]
+
+
+def run_client(port: int, mix: list[tuple[str, int]], stop_at: float, seed: int, samples: dict, lock: threading.Lock) -> None:
+    rng = random.Random(seed)
+    names = [name for name, _ in mix]
+    weights = [weight for _, weight in mix]
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=60)
+    local: dict[str, list[tuple[float, bool]]] = defaultdict(list)
+    while time.monotonic() < stop_at:
+        name = rng.choices(names, weights)[0]
+        method, path = ENDPOINTS[name]
+        started = time.perf_counter()
+        try:
+            conn.request(method, path)
+            response = conn.getresponse()
+            response.read()
+            ok = response.status < 500
+        except (OSError, http.client.HTTPException):
+            conn.close()
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=60)
+            ok = False
+        local[name].append(((time.perf_counter() - started) * 1000, ok))
+    conn.close()
+    with lock:
+        for name, values in local.items():
+            samples[name].extend(values)
+
+
+def spawn_counts(web_dashboard) -> dict[str, dict[str, float]]:
+    counts: dict[str, dict[str, float]] = {"subprocesses": defaultdict(float), "socket_connects": defaultdict(float)}
+    for (name, key), value in web_dashboard.metrics.counter_values().items():
+        labels = dict(key)
+        if name == "hero_subprocess_spawns_total":
+            counts["subprocesses"][labels.get("kind", "unknown")] += value
+        elif name == "hero_socket_connects_total":
+            counts["socket_connects"][labels.get("kind", "unknown")] += value
+    return counts
+
+
+def counts_delta(before: dict, after: dict) -> dict[str, dict[str, int]]:
+    delta = {}
+    for family, values in after.items():
+        delta[family] = {
+            kind: int(value - before[family].get(kind, 0))
+            for kind, value in sorted(values.items())
+            if value - before[family].get(kind, 0)
+        }
+        delta[family]["total"] = sum(delta[family].values())
+    return delta
+
+
+def git_commit() -> str | None:
+    try:
+        result = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=False)
+    except FileNotFoundError:
+        return None
+    return result.stdout.strip() or None
+
+
+def run_benchmark(args: argparse.Namespace) -> dict:
+    mix = parse_mix(args.mix)
+    upstream = start_upstream(args.http_delay)
+    home = Path(tempfile.mkdtemp(prefix="hero-bench-"))
+    os.environ.update(build_fixture(home, args, upstream.server_address[1]))
+
+    sys.path.insert(0, str(ROOT))
+    import logging
+
+    import web_dashboard
+
+    logging.getLogger("hero_reboot_dashboard").setLevel(logging.WARNING)
+    install_fake_processes(web_dashboard, args)
+    port = free_port()
+    server, thread = start_server(web_dashboard.app, port)
+    try:
+        warm = http.client.HTTPConnection("127.0.0.1", port, timeout=60)
+        for name in ENDPOINTS:
+            method, path = ENDPOINTS[name]
+            warm.request(method, path)
+            warm.getresponse().read()
+        warm.close()
+
+        before = spawn_counts(web_dashboard)
+        samples: dict[str, list[tuple[float, bool]]] = defaultdict(list)
+        lock = threading.Lock()
+        started = time.monotonic()
+        stop_at = started + args.duration
+        clients = [
+            threading.Thread(target=run_client, args=(port, mix, stop_at, args.seed + index, samples, lock))
+            for index in range(args.clients)
+        ]
+        for client in clients:
+            client.start()
+        for client in clients:
+            client.join()
+        elapsed = time.monotonic() - started
+        after = spawn_counts(web_dashboard)
+    finally:
+        server.should_exit = True
+        thread.join(timeout=10)
+        upstream.shutdown()
+
+    endpoints = {}
+    for name, values in sorted(samples.items()):
+        latencies = sorted(latency for latency, _ in values)
+        endpoints[name] = {
+            "requests": len(values),
+            "errors": sum(1 for _, ok in values if not ok),
+            "rps": round(len(values) / elapsed, 1),
+            "p50_ms": round(percentile(latencies, 50), 2),
+            "p95_ms": round(percentile(latencies, 95), 2),
+            "p99_ms": round(percentile(latencies, 99), 2),
+            "max_ms": round(latencies[-1], 2) if latencies else 0.0,
+        }
+    total = sum(item["requests"] for item in endpoints.values())
+    config = {key: (str(value) if isinstance(value, Path) else value) for key, value in vars(args).items() if key not in {"output", "compare"}}
+    return {
+        "meta": {
+            "commit": git_commit(),
+            "created": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "config": config,
+        },
+        "totals": {
+            "requests": total,
+            "errors": sum(item["errors"] for item in endpoints.values()),
+            "rps": round(total / elapsed, 1),
+            "duration_s": round(elapsed, 2),
+        },
+        "endpoints": endpoints,
+        **counts_delta(before, after),
+    }
+
+
+def compare(result: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Human-readable regressions of ``result`` against ``baseline``; empty when within tolerance."""
+    regressions = []
+    for name, current in result["endpoints"].items():
+        base = baseline.get("endpoints", {}).get(name)
+        if not base:
+            continue
+        for field in ("p50_ms", "p95_ms", "p99_ms"):
+            if base[field] and current[field] > base[field] * (1 + tolerance):
+                regressions.append(f"{name} {field}: {base[field]} -> {current[field]}")
+        if base["rps"] and current["rps"] < base["rps"] * (1 - tolerance):
+            regressions.append(f"{name} rps: {base['rps']} -> {current['rps']}")
+        if current["errors"] > base["errors"]:
+            regressions.append(f"{name} errors: {base['errors']} -> {current['errors']}")
+    # Spawns scale with run length, so compare them per thousand requests.
+    base_requests = max(1, baseline.get("totals", {}).get("requests", 0))
+    base_rate = baseline.get("subprocesses", {}).get("total", 0) * 1000 / base_requests
+    rate = result["subprocesses"]["total"] * 1000 / max(1, result["totals"]["requests"])
+    if rate > base_rate * (1 + tolerance) and rate - base_rate >= 1:
+        regressions.append(f"subprocesses per 1k requests: {base_rate:.1f} -> {rate:.1f}")
+    return regressions
+
+
+def print_summary(result: dict) -> None:
+    print(f"{'endpoint':<12}{'requests':>10}{'errors':>8}{'rps':>9}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for name, item in result["endpoints"].items():
+        print(
+            f"{name:<12}{item['requests']:>10}{item['errors']:>8}{item['rps']:>9}"
+            f"{item['p50_ms']:>10}{item['p95_ms']:>10}{item['p99_ms']:>10}"
+        )
+    totals = result["totals"]
+    print(f"total {totals['requests']} requests in {totals['duration_s']}s, {totals['rps']} req/s, {totals['errors']} errors")
+    print(f"subprocesses {result['subprocesses']}  socket connects {result['socket_connects']}")
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    result = run_benchmark(args)
+    print_summary(result)
+    if args.output:
+        args.output.write_text(json.dumps(result, indent=2) + "\n", encoding="utf-8")
+        print(f"wrote {args.output}")
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        regressions = compare(result, baseline, args.tolerance)
+        print(f"compared with {args.compare} ({baseline.get('meta', {}).get('commit')}), tolerance {args.tolerance:.0%}")
+        for line in regressions:
+            print(f"  REGRESSION {line}")
+        if regressions:
+            return 1
+        print("  no regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
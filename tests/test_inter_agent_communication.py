@@ -0,0 +1,598 @@
+from datetime import datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+
+import pytest
+
+pytest.importorskip("nats")
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+# The module opens ~/.hero_core/communication.log at import; keep it out of the real home.
+_real_home = os.environ.get("HOME")
+os.environ["HOME"] = tempfile.mkdtemp(prefix="hero-iac-")
+(Path(os.environ["HOME"]) / ".hero_core").mkdir()
+try:
+    import inter_agent_communication as iac
+    from agent_coordination_utils import BaseAgent, TaskResult
+finally:
+    if _real_home is None:
+        del os.environ["HOME"]
+    else:
+        os.environ["HOME"] = _real_home
+
+
+class StubNats:
+    """Records publishes; ``request`` answers from ``replies`` (a dict, or an exception to raise)."""
+
+    def __init__(self):
+        self.is_closed = False
+        self.published = []
+        self.requests = []
+        self.replies = {}
+
+    async def publish(self, subject, data):
+        self.published.append((subject, json.loads(data)))
+
+    async def request(self, subject, data, timeout):
+        self.requests.append((subject, json.loads(data), timeout))
+        reply = self.replies.get(subject)
+        if isinstance(reply, Exception):
+            raise reply
+        return SimpleNamespace(data=json.dumps(reply).encode())
+
+    async def close(self):
+        self.is_closed = True
+
+    def assigned(self):
+        return [(subject.split(".")[4], payload["task_id"]) for subject, payload in self.published if subject.endswith(".tasks.assign")]
+
+
+def make_layer(tmp_path, monkeypatch, **kwargs):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    layer = iac.InterAgentCommunicationLayer(**kwargs)
+    layer.nc = StubNats()
+    layer.running = True
+    return layer
+
+
+def make_agent(agent_id, capabilities=("general",), slots=2, status=None, performance=1.0):
+    return iac.Agent(
+        agent_id=agent_id,
+        agent_type="worker",
+        name=agent_id,
+        capabilities=list(capabilities),
+        status=status or iac.AgentStatus.ONLINE,
+        current_tasks=[],
+        max_concurrent_tasks=slots,
+        last_heartbeat=datetime.now().isoformat(),
+        performance_score=performance,
+        load_factor=0.0,
+    )
+
+
+def message(**payload):
+    return SimpleNamespace(data=json.dumps(payload).encode())
+
+
+async def respond(layer, task_id, agent_id, status):
+    await layer._handle_task_response(message(task_id=task_id, agent_id=agent_id, status=status))
+
+
+async def settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def ready_ids(layer):
+    return sorted(entry[2] for entry in layer._ready_tasks)
+
+
+def test_dependent_is_released_when_its_last_dependency_completes(tmp_path, monkeypatch):
+    async def scenario():
+        layer = make_layer(tmp_path, monkeypatch)
+        await layer.register_agent(make_agent("a1"))
+        first = await layer.create_task("general", "first", {})
+        second = await layer.create_task("general", "second", {})
+        joined = await layer.create_task("general", "joined", {}, dependencies=[first, second])
+        assert ready_ids(layer) == sorted([first, second])
+        assert layer._waiting_on[joined] == {first, second}
+
+        await layer._dispatch_ready_tasks()
+        layer._schedule_event.clear()
+        await respond(layer, first, "a1", "completed")
+        assert layer._waiting_on[joined] == {second}
+        assert ready_ids(layer) == []
+
+        await respond(layer, second, "a1", "completed")
+        assert joined not in layer._waiting_on
+        assert ready_ids(layer) == [joined]
+        assert layer._schedule_event.is_set()
+
+    asyncio.run(scenario())
+
+
+def test_dispatch_runs_in_priority_order_past_tasks_no_agent_can_take(tmp_path, monkeypatch):
+    async def scenario():
+        layer = make_layer(tmp_path, monkeypatch)
+        await layer.register_agent(make_agent("builder", capabilities=["build"], slots=3))
+        stuck = await layer.create_task("render", "nobody renders", {}, priority=iac.TaskPriority.CRITICAL)
+        low = await layer.create_task("build", "low", {}, priority=iac.TaskPriority.LOW)
+        high = await layer.create_task("build", "high", {}, priority=iac.TaskPriority.HIGH)
+
+        await layer._dispatch_ready_tasks()
+
+        assert layer.nc.assigned() == [("builder", high), ("builder", low)]
+        assert ready_ids(layer) == [stuck]
+        assert layer.tasks[stuck].status == iac.TaskStatus.PENDING
+
+    asyncio.run(scenario())
+
+
+def test_scheduler_sleeps_until_a_task_or_agent_event(tmp_path, monkeypatch):
+    async def scenario():
+        layer = make_layer(tmp_path, monkeypatch)
+        passes = []
+        dispatch = layer._dispatch_ready_tasks
+
+        async def counted():
+            passes.append(1)
+            await dispatch()
+
+        layer._dispatch_ready_tasks = counted
+        scheduler = asyncio.create_task(layer._task_scheduler())
+        try:
+            task_id = await layer.create_task("general", "waits for an agent", {})
+            await settle()
+            assert len(passes) == 1
+            assert layer.tasks[task_id].status == iac.TaskStatus.PENDING
+
+            await asyncio.sleep(0.05)
+            assert len(passes) == 1
+
+            await layer.register_agent(make_agent("late"))
+            await settle()
+            assert len(passes) == 2
+            assert layer.nc.assigned() == [("late", task_id)]
+        finally:
+            layer.running = False
+            scheduler.cancel()
+            await asyncio.gather(scheduler, return_exceptions=True)
+
+    asyncio.run(scenario())
+
+
+def test_dependents_of_a_failed_task_stay_parked_until_cleanup_forgets_it(tmp_path, monkeypatch):
+    async def scenario():
+        layer = make_layer(tmp_path, monkeypatch)
+        await layer.register_agent(make_agent("a1"))
+        upstream = await layer.create_task("general", "upstream", {})
+        downstream = await layer.create_task("general", "downstream", {}, dependencies=[upstream])
+        await layer._dispatch_ready_tasks()
+
+        await respond(layer, upstream, "a1", "failed")
+        assert layer._waiting_on[downstream] == {upstream}
+        assert ready_ids(layer) == []
+
+        layer.tasks[upstream].completed_at = (datetime.now() - timedelta(hours=2)).isoformat()
+        cleanup = asyncio.create_task(layer._cleanup_handler())
+        await settle()
+        cleanup.cancel()
+        await asyncio.gather(cleanup, return_exceptions=True)
+
+        assert upstream not in layer.tasks
+        assert downstream not in layer._waiting_on
+        assert ready_ids(layer) == [downstream]
+
+    asyncio.run(scenario())
+
+
+def test_capability_index_prefers_lower_load_then_higher_performance():
+    index = iac.CapabilityIndex()
+    busy = make_agent("busy", slots=4)
+    busy.current_tasks = ["t1", "t2"]
+    idle = make_agent("idle", slots=4, performance=0.5)
+    sharp = make_agent("sharp", slots=4, performance=1.0)
+    for agent in (busy, idle, sharp):
+        index.update(agent)
+
+    assert index.best(["general"]) == "sharp"
+
+    sharp.current_tasks = ["t3", "t4", "t5"]
+    index.update(sharp)
+    assert index.best(["general"]) == "idle"
+
+    idle.current_tasks = ["t6", "t7", "t8"]
+    index.update(idle)
+    assert index.best(["general"]) == "busy"
+
+
+def test_capability_index_drops_full_offline_and_removed_agents():
+    index = iac.CapabilityIndex()
+    only = make_agent("only", slots=1)
+    index.update(only)
+    assert index.best(["general"]) == "only"
+    assert index.has_capacity()
+
+    only.current_tasks = ["t1"]
+    index.update(only)
+    assert index.best(["general"]) is None
+    assert not index.has_capacity()
+
+    only.current_tasks = []
+    only.status = iac.AgentStatus.OFFLINE
+    index.update(only)
+    assert index.best(["general"]) is None
+
+    only.status = iac.AgentStatus.IDLE
+    index.update(only)
+    assert index.best(["general"]) == "only"
+
+    index.remove("only")
+    assert index.best(["general"]) is None
+    assert not index.has_capacity()
+
+
+def test_capability_index_matches_any_capability_and_forgets_dropped_ones():
+    index = iac.CapabilityIndex()
+    polyglot = make_agent("polyglot", capabilities=["build", "render"], slots=4)
+    builder = make_agent("builder", capabilities=["build"], slots=4)
+    builder.current_tasks = ["t1"]
+    index.update(polyglot)
+    index.update(builder)
+
+    assert index.best(["render"]) == "polyglot"
+    assert index.best(["build"]) == "polyglot"
+    assert index.best(["deploy", "render"]) == "polyglot"
+    assert index.best(["deploy"]) is None
+
+    polyglot.capabilities = ["render"]
+    index.update(polyglot)
+    assert index.best(["build"]) == "builder"
+    assert index.best(["render"]) == "polyglot"
+
+
+def test_capability_index_compacts_heaps_of_superseded_entries():
+    index = iac.CapabilityIndex()
+    agent = make_agent("chatty", slots=100)
+    for load in range(90):
+        agent.current_tasks = [f"t{i}" for i in range(load)]
+        index.update(agent)
+
+    assert index.best(["general"]) == "chatty"
+    assert len(index._heaps["general"]) <= 2 * len(index._members["general"]) + 17
+
+
+def dashboard_state(seq, agents=None, tasks=None):
+    return {
+        "timestamp": f"t{seq}",
+        "communication_layer": {"status": "online"},
+        "agents": agents or {},
+        "tasks": tasks or {},
+    }
+
+
+def delta_lines(writer):
+    return [json.loads(line) for line in writer.delta_path.read_text().splitlines()]
+
+
+def test_dashboard_cache_coalesces_a_burst_into_one_trailing_write(tmp_path):
+    async def scenario():
+        writer = iac.DashboardCacheWriter(tmp_path / "layer.json", min_interval=0.05)
+        writer.request(lambda: dashboard_state(0))
+        for seq in range(1, 6):
+            writer.request(lambda seq=seq: dashboard_state(seq))
+        assert writer.writes == 1
+        assert writer.coalesced == 4
+
+        await asyncio.sleep(0.1)
+        assert writer.writes == 2
+        assert json.loads(writer.path.read_text())["timestamp"] == "t5"
+
+    asyncio.run(scenario())
+
+
+def test_dashboard_cache_replaces_the_document_whole(tmp_path, monkeypatch):
+    writer = iac.DashboardCacheWriter(tmp_path / "layer.json", min_interval=0)
+    writer.flush(lambda: dashboard_state(1, agents={"a1": {"status": "online"}}))
+    seen = []
+    replace = os.replace
+
+    def watched(src, dst):
+        seen.append((json.loads(Path(dst).read_text())["timestamp"], json.loads(Path(src).read_text())["timestamp"]))
+        replace(src, dst)
+
+    monkeypatch.setattr(iac.os, "replace", watched)
+    writer.flush(lambda: dashboard_state(2, agents={"a1": {"status": "busy"}}))
+
+    assert seen == [("t1", "t2")]
+    assert json.loads(writer.path.read_text())["agents"] == {"a1": {"status": "busy"}}
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["layer.json"]
+
+
+def test_dashboard_cache_delta_log_appends_in_order_and_rotates(tmp_path):
+    writer = iac.DashboardCacheWriter(tmp_path / "layer.json", min_interval=0, delta_log=True)
+    writer.flush(lambda: dashboard_state(1, agents={"a1": {"status": "online"}}))
+    writer.flush(lambda: dashboard_state(2, agents={"a1": {"status": "busy"}, "a2": {"status": "online"}}))
+    writer.flush(lambda: dashboard_state(3, agents={"a2": {"status": "online"}}, tasks={"t1": {"status": "pending"}}))
+
+    assert delta_lines(writer) == [
+        {"seq": 1, "timestamp": "t1", "reset": True},
+        {"seq": 2, "timestamp": "t2", "agents": {"a1": {"status": "busy"}, "a2": {"status": "online"}}},
+        {"seq": 3, "timestamp": "t3", "tasks": {"t1": {"status": "pending"}}, "removed_agents": ["a1"]},
+    ]
+    assert json.loads(writer.path.read_text())["delta_seq"] == 3
+
+    writer.delta_log_max_bytes = 1
+    writer.flush(lambda: dashboard_state(4))
+
+    assert delta_lines(writer) == [{"seq": 4, "timestamp": "t4", "reset": True}]
+    assert json.loads(writer.path.read_text())["delta_seq"] == 4
+
+
+def test_dashboard_cache_never_logs_a_delta_ahead_of_the_document(tmp_path, monkeypatch):
+    writer = iac.DashboardCacheWriter(tmp_path / "layer.json", min_interval=0, delta_log=True, delta_log_max_bytes=200)
+    observed = []
+    replace = os.replace
+    append = open
+
+    def reader_view():
+        document = json.loads(writer.path.read_text())["delta_seq"] if writer.path.exists() else 0
+        lines = delta_lines(writer) if writer.delta_path.exists() else []
+        observed.append((document, max((line["seq"] for line in lines), default=0)))
+
+    def watched_replace(src, dst):
+        reader_view()
+        replace(src, dst)
+        reader_view()
+
+    def watched_open(path, *args, **kwargs):
+        if Path(path) == writer.delta_path:
+            reader_view()
+        return append(path, *args, **kwargs)
+
+    monkeypatch.setattr(iac.os, "replace", watched_replace)
+    monkeypatch.setattr("builtins.open", watched_open)
+    for seq in range(1, 12):
+        writer.flush(lambda seq=seq: dashboard_state(seq, agents={"a1": {"status": f"s{seq}"}}))
+    reader_view()
+
+    lines = delta_lines(writer)
+    assert lines[0]["reset"] is True
+    assert lines[0]["seq"] > 1
+    assert all(document >= logged for document, logged in observed)
+    assert observed[-1] == (11, 11)
+
+
+def test_deadline_queue_expires_keys_in_deadline_order():
+    queue = iac.DeadlineQueue()
+    queue.schedule(("agent", "late"), 30.0)
+    queue.schedule(("sync", "early"), 10.0)
+    queue.schedule(("agent", "middle"), 20.0)
+
+    assert queue.next_deadline() == 10.0
+    assert queue.pop_expired(5.0) == []
+    assert queue.pop_expired(20.0) == [("sync", "early"), ("agent", "middle")]
+    assert queue.next_deadline() == 30.0
+    assert queue.pop_expired(100.0) == [("agent", "late")]
+    assert queue.next_deadline() is None
+
+
+def test_deadline_queue_reschedule_supersedes_the_old_deadline():
+    queue = iac.DeadlineQueue()
+    queue.schedule(("agent", "a1"), 10.0)
+    queue.schedule(("agent", "a1"), 40.0)
+
+    assert queue.pop_expired(15.0) == []
+    assert queue.next_deadline() == 40.0
+
+    queue.schedule(("agent", "a1"), 12.0)
+    assert queue.pop_expired(15.0) == [("agent", "a1")]
+    assert queue.pop_expired(100.0) == []
+
+
+def test_deadline_queue_cancel_and_compaction():
+    queue = iac.DeadlineQueue()
+    queue.schedule(("sync", "s1"), 10.0)
+    queue.schedule(("sync", "s2"), 20.0)
+    queue.cancel(("sync", "s1"))
+    queue.cancel(("sync", "missing"))
+
+    assert queue.next_deadline() == 20.0
+    assert queue.pop_expired(25.0) == [("sync", "s2")]
+
+    for beat in range(500):
+        queue.schedule(("agent", "chatty"), float(beat))
+    assert len(queue._heap) <= 2 * len(queue._deadlines) + 65
+    assert queue.pop_expired(498.0) == []
+    assert queue.pop_expired(499.0) == [("agent", "chatty")]
+
+
+def test_heartbeat_pushes_back_the_agents_expiry(tmp_path, monkeypatch):
+    async def scenario():
+        layer = make_layer(tmp_path, monkeypatch, heartbeat_timeout=0.2)
+        registered = time.monotonic()
+        await layer.register_agent(make_agent("a1"))
+
+        await asyncio.sleep(0.1)
+        await layer._handle_agent_heartbeat(message(agent_id="a1", status="online"))
+        assert layer._deadlines.pop_expired(registered + 0.25) == []
+        assert layer.agents["a1"].status == iac.AgentStatus.ONLINE
+
+        monitor = asyncio.create_task(layer._health_monitor())
+        try:
+            await asyncio.sleep(0.4)
+        finally:
+            monitor.cancel()
+            await asyncio.gather(monitor, return_exceptions=True)
+        assert layer.agents["a1"].status == iac.AgentStatus.OFFLINE
+        assert layer.capability_index.best(["general"]) is None
+
+    asyncio.run(scenario())
+
+
+def test_heartbeats_only_wake_the_balancer_when_the_backlog_or_a_slot_moves(tmp_path, monkeypatch):
+    async def scenario():
+        layer = make_layer(tmp_path, monkeypatch)
+        await layer.register_agent(make_agent("a1", slots=2))
+
+        async def beat(status="online"):
+            layer._rebalance_event.clear()
+            await layer._handle_agent_heartbeat(message(agent_id="a1", status=status))
+            return layer._rebalance_event.is_set()
+
+        assert await beat() is True
+        assert await beat() is False
+
+        task_id = await layer.create_task("general", "queued", {})
+        await layer._dispatch_ready_tasks()
+        assert await beat() is True
+        assert await beat() is False
+
+        await respond(layer, task_id, "a1", "in_progress")
+        assert await beat() is True
+        assert await beat("busy") is True
+        assert await beat("busy") is False
+
+    asyncio.run(scenario())
+
+
+class EchoAgent(BaseAgent):
+    TASK_MEMORY = 4
+
+    async def default_task_handler(self, task_data):
+        return TaskResult(success=True, data={"echo": task_data["task_id"]})
+
+
+class Inbox:
+    def __init__(self, payload):
+        self.data = json.dumps(payload).encode()
+        self.replies = []
+
+    async def respond(self, data):
+        self.replies.append(json.loads(data))
+
+
+async def revoke(agent, task_id):
+    request = Inbox({"task_id": task_id, "reason": "rebalance", "target_agent": "thief"})
+    await agent._handle_task_revoke(request)
+    return request.replies[0]["revoked"]
+
+
+def test_agent_only_hands_back_tasks_it_never_received():
+    async def scenario():
+        agent = EchoAgent(agent_id="victim")
+        agent.nc = StubNats()
+
+        assert await revoke(agent, "early") is True
+        await agent._handle_task_assignment(message(task_id="early", task_type="general"))
+        assert "early" not in agent.current_tasks
+        assert "early" not in agent._revoked_tasks
+        assert agent.nc.published == []
+
+        await agent._handle_task_assignment(message(task_id="done", task_type="general"))
+        await settle()
+        assert "done" not in agent.current_tasks
+        assert [payload["status"] for _, payload in agent.nc.published] == ["in_progress", "completed"]
+        assert await revoke(agent, "done") is False
+        assert "done" not in agent._revoked_tasks
+
+    asyncio.run(scenario())
+
+
+def test_agent_task_memory_is_bounded():
+    async def scenario():
+        agent = EchoAgent(agent_id="busy")
+        agent.nc = StubNats()
+        for number in range(10):
+            assert await revoke(agent, f"never-{number}") is True
+            await agent._handle_task_assignment(message(task_id=f"seen-{number}", task_type="general"))
+            await settle()
+
+        assert list(agent._revoked_tasks) == [f"never-{number}" for number in range(6, 10)]
+        assert list(agent._seen_tasks) == [f"seen-{number}" for number in range(6, 10)]
+
+    asyncio.run(scenario())
+
+
+REVOKE_SUBJECT = "hero.v1.dev.agents.source.tasks.revoke"
+
+
+async def queued_on_source(layer, target_slots=2):
+    await layer.register_agent(make_agent("source", slots=2))
+    await layer.register_agent(make_agent("target", slots=target_slots))
+    task_id = await layer.create_task("general", "movable", {})
+    assert await layer.assign_task(task_id, "source")
+    return layer.tasks[task_id]
+
+
+def test_rebalance_moves_a_task_once_the_source_acks_the_revoke(tmp_path, monkeypatch):
+    async def scenario():
+        layer = make_layer(tmp_path, monkeypatch, revoke_timeout=0.5)
+        task = await queued_on_source(layer)
+        kept = await layer.create_task("general", "stays", {})
+        assert await layer.assign_task(kept, "source")
+        layer.nc.replies[REVOKE_SUBJECT] = {"task_id": task.task_id, "agent_id": "source", "revoked": True}
+
+        await layer._rebalance_tasks([("source", 1.0)], [("target", 0.0)])
+
+        assert [(subject, payload["task_id"], payload["target_agent"], timeout) for subject, payload, timeout in layer.nc.requests] == [
+            (REVOKE_SUBJECT, task.task_id, "target", 0.5)
+        ]
+        assert layer.nc.assigned() == [("source", task.task_id), ("source", kept), ("target", task.task_id)]
+        assert task.assigned_agent == "target"
+        assert layer.agents["source"].current_tasks == [kept]
+        assert layer.agents["target"].current_tasks == [task.task_id]
+        assert layer.metrics["tasks_rebalanced"] == 1
+        assert layer._revocations == {}
+
+        await respond(layer, task.task_id, "source", "completed")
+        assert task.status == iac.TaskStatus.ASSIGNED
+
+    asyncio.run(scenario())
+
+
+def test_revoke_nack_or_timeout_leaves_the_task_with_its_agent(tmp_path, monkeypatch):
+    async def scenario(reply):
+        layer = make_layer(tmp_path, monkeypatch)
+        task = await queued_on_source(layer)
+        layer.nc.replies[REVOKE_SUBJECT] = reply
+
+        assert await layer._move_task(task, "source", "target") is False
+
+        assert task.assigned_agent == "source"
+        assert task.status == iac.TaskStatus.ASSIGNED
+        assert layer.agents["source"].current_tasks == [task.task_id]
+        assert layer.nc.assigned() == [("source", task.task_id)]
+        assert layer.metrics["tasks_rebalanced"] == 0
+
+        await respond(layer, task.task_id, "source", "completed")
+        assert task.status == iac.TaskStatus.COMPLETED
+
+    asyncio.run(scenario({"revoked": False}))
+    asyncio.run(scenario(iac.TimeoutError("no ack")))
+
+
+def test_late_response_after_revoke_is_ignored_when_nobody_holds_the_task(tmp_path, monkeypatch):
+    async def scenario():
+        layer = make_layer(tmp_path, monkeypatch)
+        task = await queued_on_source(layer, target_slots=1)
+        layer.agents["target"].current_tasks.append("elsewhere")
+        layer.nc.replies[REVOKE_SUBJECT] = {"revoked": True}
+
+        assert await layer._move_task(task, "source", "target") is True
+        assert task.assigned_agent is None
+        assert task.status == iac.TaskStatus.PENDING
+        assert task.task_id in ready_ids(layer)
+
+        await respond(layer, task.task_id, "source", "completed")
+        assert task.status == iac.TaskStatus.PENDING
+        assert task.result is None
+        assert layer.agents["source"].completed_tasks == 0
+
+    asyncio.run(scenario())
@@ -1,15 +1,22 @@
-from io import BytesIO
 from pathlib import Path
+import json
+import os
 import sys
-from urllib.error import HTTPError
+import time
 
 from fastapi.testclient import TestClient
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+# Keep the background prober out of TestClient lifespans; scheduler tests drive it by hand.
+os.environ.setdefault("HERO_PROBE_SCHEDULER", "0")
+# Heavy probes run in spawned workers that would not see monkeypatches; isolation is tested directly.
+os.environ.setdefault("HERO_PROBE_ISOLATION", "0")
 
 from web_dashboard import (
     ACTION_REGISTRY,
     DashboardRuntime,
+    HttpProbeEngine,
+    SnapshotCache,
     app,
     build_alerts,
     build_labyrinth,
@@ -94,8 +101,9 @@ def test_healthz_reports_dashboard_alive_even_if_dependencies_degraded(monkeypat
         },
     }
 
-    from web_dashboard import runtime
+    from web_dashboard import runtime, snapshot_cache
     monkeypatch.setattr(runtime, "snapshot", lambda: fake_snapshot)
+    snapshot_cache.invalidate()
 
     health = client.get("/api/healthz")
     ready = client.get("/api/readiness")
@@ -126,10 +134,9 @@ def test_probe_gbrain_marks_http_500_as_degraded(monkeypatch):
     monkeypatch.setattr("web_dashboard.try_load_yaml", lambda path: {"mcp_servers": {"gbrain": {"url": "https://example.com/mcp", "headers": {}}}})
     monkeypatch.setattr("web_dashboard.BRAIN_ROOT", Path.home())
 
-    def fake_urlopen(request, timeout=4):
-        raise HTTPError(request.full_url, 500, "boom", hdrs=None, fp=BytesIO(b"fail"))
-
-    monkeypatch.setattr("web_dashboard.urlopen", fake_urlopen)
+    engine = HttpProbeEngine()
+    monkeypatch.setattr(engine, "_request", lambda url, headers, timeout: 500)
+    monkeypatch.setattr("web_dashboard.http_probes", engine)
     probe = runtime.probe_gbrain()
 
     assert probe["status"] == "degraded"
@@ -263,29 +270,59 @@ def test_api_actions_and_unknown_action(monkeypatch):
     assert missing.status_code == 404
 
 
-def test_api_run_action_uses_allowlisted_executor(monkeypatch):
+def _fast_compile_action(monkeypatch, tmp_path, script):
+    import sys
     import web_dashboard
 
-    client = TestClient(app)
-    monkeypatch.setattr(
-        web_dashboard,
-        "execute_action",
-        lambda action_id: {
-            "id": "action-test",
-            "action_id": action_id,
-            "label": "Compile Dashboard",
-            "status": "succeeded",
-            "exit_code": 0,
-            "duration_ms": 4,
-            "stdout_preview": "ok",
-            "stderr_preview": "",
-        },
+    monkeypatch.setattr(web_dashboard, "HERO_ACTION_LOG", tmp_path / "actions.jsonl")
+    spec = dict(web_dashboard.ACTION_REGISTRY["compile_dashboard"])
+    spec["args"] = [sys.executable, "-c", script]
+    monkeypatch.setitem(web_dashboard.ACTION_REGISTRY, "compile_dashboard", spec)
+
+
+def test_api_run_action_returns_job_and_streams_redacted_output(monkeypatch, tmp_path):
+    _fast_compile_action(
+        monkeypatch,
+        tmp_path,
+        "import time; print('api_key=' + 'secret' + '-token', flush=True); time.sleep(0.3); print('ok')",
     )
 
-    response = client.post("/api/actions/compile_dashboard")
+    with TestClient(app) as client:
+        response = client.post("/api/actions/compile_dashboard")
+        duplicate = client.post("/api/actions/compile_dashboard")
+
+        assert response.status_code == 202
+        job = response.json()
+        assert job["action_id"] == "compile_dashboard"
+        assert duplicate.json()["job_id"] == job["job_id"]
+        assert duplicate.json()["deduplicated"] is True
+
+        with client.stream("GET", job["links"]["stream"]) as stream:
+            body = "".join(stream.iter_text())
+
+        final = client.get(job["links"]["self"]).json()
+        metrics = client.get("/api/jobs").json()["metrics"]["compile_dashboard"]
+
+    assert "event: output" in body
+    assert "event: done" in body
+    assert "api_key=secret-token" not in body
+    assert "api_key=[redacted]" in body
+    assert final["status"] == "succeeded"
+    assert final["event"]["job_id"] == job["job_id"]
+    assert [item["line"] for item in final["output"]] == ["api_key=[redacted]", "ok"]
+    assert metrics["deduplicated"] >= 1
+    assert (tmp_path / "actions.jsonl").exists()
+
 
-    assert response.status_code == 200
+def test_api_run_action_wait_returns_final_event(monkeypatch, tmp_path):
+    _fast_compile_action(monkeypatch, tmp_path, "import sys; sys.exit(3)")
+
+    with TestClient(app) as client:
+        response = client.post("/api/actions/compile_dashboard?wait=true")
+
+    assert response.status_code == 500
     assert response.json()["action_id"] == "compile_dashboard"
+    assert response.json()["exit_code"] == 3
 
 
 def test_build_labyrinth_includes_probe_crossings_and_failed_action(monkeypatch):
@@ -332,3 +369,922 @@ def test_build_labyrinth_includes_probe_crossings_and_failed_action(monkeypatch)
     assert any(crossing["id"] == "crossing-probe-droids" for crossing in payload["crossings"])
     assert any(guidepost["title"] == "Compile Dashboard failed" for guidepost in payload["guideposts"])
     assert "password=[redacted]" in str(payload)
+
+
+def _fake_card(name, status="healthy"):
+    return make_probe(name=name, status=status, source="test", details={"marker": name})
+
+
+def test_labyrinth_event_store_records_transitions_and_pages_by_cursor(monkeypatch, tmp_path):
+    import web_dashboard
+
+    monkeypatch.setattr(web_dashboard, "HERO_ACTION_LOG", tmp_path / "actions.jsonl")
+    store = web_dashboard.LabyrinthEventStore(memory=2)
+    monkeypatch.setattr(web_dashboard, "labyrinth_events", store)
+
+    first = store.record_probes({"hermes": _fake_card("hermes"), "alerts": _fake_card("alerts")})
+    assert [event["seq"] for event in first] == [1, 2]
+    assert store.record_probes({"hermes": _fake_card("hermes")}) == []
+    store.record_probes({"hermes": _fake_card("hermes", "down")})
+    web_dashboard.append_action_event(
+        {"id": "a1", "action_id": "compile_dashboard", "label": "Compile", "status": "failed", "completed_at": "2026-04-28T00:00:02Z"}
+    )
+
+    other_worker = web_dashboard.LabyrinthEventStore(memory=2)
+    assert other_worker.cursor() == 4
+    page = other_worker.query(cursor=0, limit=2)
+    assert [event["seq"] for event in page["crossings"]] == [1, 2]
+    assert page["has_more"] is True
+    rest = other_worker.query(cursor=page["next_cursor"])
+    assert [event["label"] for event in rest["crossings"]] == ["hermes", "Compile"]
+    assert rest["crossings"][0]["previous_status"] == "healthy"
+    assert rest["next_cursor"] == 4
+
+    client = TestClient(app)
+    tools = client.get("/api/labyrinth", params={"cursor": 0, "thread": "tools"}).json()
+    assert [event["id"] for event in tools["crossings"]] == ["crossing-a1"]
+    down = client.get("/api/labyrinth", params={"status": "down,failed"}).json()
+    assert [event["seq"] for event in down["crossings"]] == [3, 4]
+
+
+def test_snapshot_runs_probes_concurrently_and_times_out_slow_probe(monkeypatch):
+    import threading
+    import time
+    import web_dashboard
+
+    runtime = DashboardRuntime()
+    release = threading.Event()
+    calls = {"workflows": 0}
+
+    def slow_workflows():
+        calls["workflows"] += 1
+        if calls["workflows"] > 1:
+            release.wait(5)
+        return _fake_card("workflows")
+
+    def sleepy(name):
+        def probe():
+            time.sleep(0.2)
+            return _fake_card(name)
+        return probe
+
+    for name in ("hermes", "droids", "telegram", "gbrain"):
+        monkeypatch.setattr(runtime, f"probe_{name}", sleepy(name))
+    monkeypatch.setattr(runtime, "probe_workflows", slow_workflows)
+    monkeypatch.setitem(web_dashboard.PROBE_DEADLINES, "workflows", 0.5)
+
+    first = runtime.snapshot()
+    assert first["cards"]["workflows"]["status"] == "healthy"
+
+    started = time.monotonic()
+    second = runtime.snapshot()
+    elapsed = time.monotonic() - started
+    release.set()
+
+    assert elapsed < 0.8
+    assert second["cards"]["hermes"]["status"] == "healthy"
+    timed_out = second["cards"]["workflows"]
+    assert timed_out["status"] == "stale"
+    assert timed_out["details"]["probe_timeout"] is True
+    assert timed_out["details"]["marker"] == "workflows"
+    assert "deadline" in timed_out["last_error"]
+
+
+def test_probe_metrics_count_duration_timeouts_and_subprocess_spawns(monkeypatch):
+    import threading
+    import web_dashboard
+
+    runtime = DashboardRuntime()
+    release = threading.Event()
+
+    def spawning_hermes():
+        web_dashboard.count_spawn("pgrep")
+        return _fake_card("hermes")
+
+    def hung_workflows():
+        release.wait(5)
+        return _fake_card("workflows")
+
+    for name in ("droids", "telegram", "gbrain"):
+        monkeypatch.setattr(runtime, f"probe_{name}", lambda name=name: _fake_card(name))
+    monkeypatch.setattr(runtime, "probe_hermes", spawning_hermes)
+    monkeypatch.setattr(runtime, "probe_workflows", hung_workflows)
+    monkeypatch.setitem(web_dashboard.PROBE_DEADLINES, "workflows", 0.2)
+    registry = web_dashboard.metrics
+    spawns = registry.value("hero_subprocess_spawns_total", kind="pgrep", probe="hermes")
+    timeouts = registry.value("hero_probe_timeouts_total", probe="workflows")
+    runs = registry.value("hero_probe_duration_seconds", probe="droids")
+
+    snapshot = runtime.snapshot()
+    release.set()
+
+    assert snapshot["cards"]["hermes"]["duration_ms"] >= 0
+    assert snapshot["cards"]["workflows"]["duration_ms"] == 200.0
+    assert registry.value("hero_subprocess_spawns_total", kind="pgrep", probe="hermes") == spawns + 1
+    assert registry.value("hero_probe_timeouts_total", probe="workflows") == timeouts + 1
+    assert registry.value("hero_probe_duration_seconds", probe="droids") == runs + 1
+    assert build_labyrinth(snapshot)["crossings"][0]["duration_ms"] is not None
+
+    client = TestClient(app)
+    client.get("/api/healthz")
+    response = client.get("/api/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    body = response.text
+    assert "# TYPE hero_probe_duration_seconds histogram" in body
+    assert 'hero_probe_duration_seconds_bucket{probe="droids",le="+Inf"}' in body
+    assert 'hero_subprocess_spawns_total{kind="pgrep",probe="hermes"}' in body
+    assert 'hero_http_request_duration_seconds_count{method="GET",path="/api/healthz"}' in body
+    assert "hero_snapshot_cache_events_total" in body
+
+
+def test_probe_scheduler_paces_cards_by_threshold_and_rechecks_degradations(monkeypatch):
+    import web_dashboard
+
+    runtime = DashboardRuntime()
+    calls = {name: 0 for name in ("hermes", "droids", "telegram", "gbrain", "workflows")}
+    statuses = {"hermes": "healthy"}
+
+    def probe(name):
+        def run():
+            calls[name] += 1
+            return _fake_card(name, statuses.get(name, "healthy"))
+        return run
+
+    for name in calls:
+        monkeypatch.setattr(runtime, f"probe_{name}", probe(name))
+    monkeypatch.setattr(web_dashboard.process_index, "refresh", lambda force=False: None)
+    updates = []
+    scheduler = web_dashboard.ProbeScheduler(runtime, min_interval=5, max_interval=300, jitter=0, on_update=lambda: updates.append(1))
+
+    assert sorted(scheduler.tick(now=0)) == sorted(calls)
+    assert updates == [1]
+    assert scheduler.intervals()["hermes"] == 15
+    assert scheduler.intervals()["telegram"] == 300
+    assert scheduler.due(now=10) == []
+    assert scheduler.due(now=16) == ["hermes", "droids"]
+
+    statuses["hermes"] = "degraded"
+    scheduler.tick(now=16)
+    assert "hermes" in scheduler.due(now=16)
+    assert scheduler.intervals()["hermes"] < 15
+    assert len(updates) == 2
+
+    runtime.scheduler = scheduler
+    before = dict(calls)
+    snapshot = runtime.snapshot()
+    assert calls == before
+    assert snapshot["cards"]["hermes"]["status"] == "degraded"
+    assert snapshot["cards"]["alerts"]["details"]["count"] == 1
+
+
+def test_scheduler_logs_a_crossing_nobody_polls_for(monkeypatch, tmp_path):
+    import web_dashboard
+
+    events = web_dashboard.LabyrinthEventStore(path=tmp_path / "labyrinth_events.jsonl")
+    runtime = DashboardRuntime(events=events)
+    statuses = {"hermes": "down"}
+    for name in ("hermes", "droids", "telegram", "gbrain", "workflows"):
+        monkeypatch.setattr(runtime, f"probe_{name}", lambda name=name: _fake_card(name, statuses.get(name, "healthy")))
+    monkeypatch.setattr(web_dashboard.process_index, "refresh", lambda force=False: None)
+    scheduler = web_dashboard.ProbeScheduler(runtime, min_interval=5, max_interval=300, jitter=0)
+
+    scheduler.tick(now=0)
+    cursor = events.cursor()
+    assert cursor == 6
+    scheduler.tick(now=1)
+    assert events.cursor() == cursor
+
+    statuses["hermes"] = "healthy"
+    assert "hermes" in scheduler.tick(now=16)
+
+    crossings = events.query(cursor=cursor)["crossings"]
+    assert [(event["label"], event["previous_status"], event["status"]) for event in crossings] == [
+        ("hermes", "down", "healthy"),
+        ("alerts", "down", "healthy"),
+    ]
+
+
+def test_refresh_status_action_reprobes_every_card_with_the_scheduler_attached(monkeypatch):
+    import web_dashboard
+
+    runtime = DashboardRuntime()
+    calls = {name: 0 for name in ("hermes", "droids", "telegram", "gbrain", "workflows")}
+
+    def probe(name):
+        def run():
+            calls[name] += 1
+            return _fake_card(name)
+        return run
+
+    for name in calls:
+        monkeypatch.setattr(runtime, f"probe_{name}", probe(name))
+    monkeypatch.setattr(web_dashboard.process_index, "refresh", lambda force=False: None)
+    monkeypatch.setattr(web_dashboard, "runtime", runtime)
+    cache = SnapshotCache(web_dashboard.compute_snapshot)
+    monkeypatch.setattr(web_dashboard, "snapshot_cache", cache)
+    scheduler = web_dashboard.ProbeScheduler(runtime, min_interval=5, max_interval=300, jitter=0, on_update=cache.invalidate)
+    runtime.scheduler = scheduler
+
+    cache.get()
+    assert set(calls.values()) == {1}
+    assert scheduler.due(now=time.monotonic()) == []
+
+    for _ in range(2):
+        status, exit_code, stdout, _ = web_dashboard.run_internal_action("refresh_status")
+        assert (status, exit_code) == ("succeeded", 0)
+    assert set(calls.values()) == {3}
+    assert json.loads(stdout)["cards"]["hermes"] == "healthy"
+    assert scheduler.due(now=time.monotonic()) == []
+
+
+def test_history_store_rings_persist_downsample_and_count_flaps(monkeypatch, tmp_path):
+    import web_dashboard
+
+    path = tmp_path / "history.bin"
+    store = web_dashboard.HistoryStore(path=path, capacity=8, cards=["hermes", "gbrain"])
+    for step in range(12):
+        status = "healthy" if step % 2 == 0 else "degraded"
+        store.record({"hermes": {"status": status, "freshness_seconds": step, "duration_ms": 10.0 * step}}, now=1000.0 + step)
+    store.record({"gbrain": {"status": "down", "freshness_seconds": None, "duration_ms": None}}, now=1011.0)
+
+    raw = store.series("hermes")
+    assert len(raw) == 8
+    assert raw[0]["t"] == 1004.0
+    assert raw[-1]["duration_ms"] == 110.0
+    assert store.series("gbrain")[0]["freshness_seconds"] is None
+
+    reduced = store.series("hermes", since=1004.0, points=4)
+    assert len(reduced) == 4
+    assert sum(point["samples"] for point in reduced) == 8
+    assert {point["status"] for point in reduced} == {"degraded"}
+
+    reloaded = web_dashboard.HistoryStore(path=path, capacity=8, cards=["hermes", "gbrain"])
+    assert reloaded.series("hermes") == raw
+    assert reloaded.flap_counts(window=5, now=1011.0) == {"hermes": 5, "gbrain": 0}
+
+    alerts = build_alerts({"hermes": _fake_card("hermes"), "gbrain": _fake_card("gbrain")}, flaps={"hermes": 5})
+    assert alerts["status"] == "degraded"
+    assert alerts["details"]["items"][0]["flaps"] == 5
+    assert "changed status 5 times" in alerts["details"]["items"][0]["message"]
+
+    monkeypatch.setattr(web_dashboard, "history_store", reloaded)
+    client = TestClient(app)
+    payload = client.get("/api/history", params={"card": "hermes", "since": "1970-01-01T00:16:46Z", "points": 2}).json()
+    assert len(payload["cards"]["hermes"]) == 2
+    assert payload["since"] == 1006.0
+    assert client.get("/api/history", params={"card": "nope"}).status_code == 404
+
+
+def test_shared_snapshot_store_elects_one_prober_and_followers_read_its_snapshots(monkeypatch, tmp_path):
+    import web_dashboard
+
+    paths = {"path": tmp_path / "snapshots.sqlite3", "lock_path": tmp_path / "prober.lock"}
+    prober = web_dashboard.SharedSnapshotStore(**paths)
+    follower = web_dashboard.SharedSnapshotStore(**paths)
+    assert prober.try_elect() is True
+    assert follower.try_elect() is False
+    assert follower.read() == (None, None)
+
+    prober.publish({"overview": {"timestamp": "t1"}, "cards": {}})
+    first, age = follower.read()
+    assert first["overview"]["timestamp"] == "t1"
+    assert age < 5
+    assert follower.read()[0] is first
+
+    monkeypatch.setattr(web_dashboard, "shared_snapshots", follower)
+    monkeypatch.setattr(web_dashboard.runtime, "snapshot", lambda: _fail("followers must not probe"))
+    assert web_dashboard.compute_snapshot() is first
+
+    history_path = tmp_path / "history.bin"
+    writer = web_dashboard.HistoryStore(path=history_path, capacity=4, cards=["hermes"])
+    reader = web_dashboard.HistoryStore(path=history_path, capacity=4, cards=["hermes"])
+    writer.record({"hermes": {"status": "healthy"}}, now=1.0)
+    assert len(reader.series("hermes")) == 1
+    writer.record({"hermes": {"status": "down"}}, now=2.0)
+    assert [point["status"] for point in reader.series("hermes")] == ["healthy", "down"]
+
+    prober.close()
+    assert follower.try_elect() is True
+    follower.close()
+
+
+def _fail(message):
+    raise AssertionError(message)
+
+
+def test_isolated_probe_pool_reuses_workers_and_kills_overruns():
+    import functools
+    import time
+    from concurrent.futures import TimeoutError as FutureTimeoutError
+
+    import web_dashboard
+
+    pool = web_dashboard.IsolatedProbePool(size=1)
+    try:
+        first = pool.call(functools.partial(os.getpid), timeout=30)
+        assert first != os.getpid()
+        assert pool.call(functools.partial(os.getpid), timeout=30) == first
+
+        started = time.monotonic()
+        try:
+            pool.call(functools.partial(time.sleep, 30), timeout=0.5)
+        except FutureTimeoutError:
+            pass
+        else:
+            raise AssertionError("overrunning probe should time out")
+        assert time.monotonic() - started < 5
+        assert pool.stats["killed"] == 1
+        assert pool.call(functools.partial(os.getpid), timeout=30) != first
+    finally:
+        pool.shutdown()
+
+
+def test_registered_probe_becomes_a_card_and_heavy_probes_route_through_pool(monkeypatch):
+    import web_dashboard
+
+    monkeypatch.setattr(web_dashboard, "PROBE_REGISTRY", web_dashboard.OrderedDict(web_dashboard.PROBE_REGISTRY))
+    monkeypatch.setattr(web_dashboard, "CARD_ORDER", list(web_dashboard.CARD_ORDER))
+    monkeypatch.setattr(web_dashboard, "PROBE_DEADLINES", dict(web_dashboard.PROBE_DEADLINES))
+    web_dashboard.register_probe("disk", cost="heavy", timeout=1.5)(lambda: _fake_card("disk"))
+    assert web_dashboard.CARD_ORDER[-2:] == ["disk", "alerts"]
+    assert web_dashboard.PROBE_DEADLINES["disk"] == 1.5
+
+    calls = []
+
+    class FakePool:
+        def call(self, func, timeout):
+            name = func.args[0]
+            calls.append((name, timeout))
+            assert func.keywords["processes"] == [(1, "droid exec")]
+            deltas = {("hero_subprocess_spawns_total", (("kind", "command"), ("probe", "droids"))): 2.0} if name == "droids" else {}
+            return _fake_card(name), deltas
+
+    runtime = DashboardRuntime()
+    for name in ("hermes", "telegram", "gbrain", "workflows"):
+        monkeypatch.setattr(runtime, f"probe_{name}", lambda name=name: _fake_card(name))
+    monkeypatch.setattr(web_dashboard, "isolated_pool", FakePool())
+    monkeypatch.setattr(web_dashboard, "PROBE_ISOLATION", True)
+    monkeypatch.setattr(web_dashboard, "process_index", web_dashboard.ProcessIndex())
+    web_dashboard.process_index.pin([(1, "droid exec")])
+    spawns = web_dashboard.metrics.value("hero_subprocess_spawns_total", kind="command", probe="droids")
+
+    snapshot = runtime.snapshot()
+
+    assert sorted(calls) == [("disk", 1.5), ("droids", 5.0)]
+    assert snapshot["card_order"][-2:] == ["disk", "alerts"]
+    assert snapshot["cards"]["disk"]["details"]["marker"] == "disk"
+    assert web_dashboard.metrics.value("hero_subprocess_spawns_total", kind="command", probe="droids") == spawns + 2
+
+
+def test_timeout_card_never_reads_better_than_the_last_evidence():
+    runtime = DashboardRuntime()
+    runtime._last_cards["gbrain"] = make_probe(name="gbrain", status="down", source="endpoint-probe", details={}, last_error="refused")
+    runtime._last_cards["hermes"] = make_probe(name="hermes", status="healthy", source="gateway", details={})
+
+    down = runtime.timeout_card("gbrain", 1.5)
+    healthy = runtime.timeout_card("hermes", 1.5)
+
+    assert down["status"] == "down"
+    assert down["details"]["probe_timeout"] is True
+    assert healthy["status"] == "stale"
+
+
+def test_timeout_card_without_prior_evidence_is_down():
+    card = DashboardRuntime().timeout_card("gbrain", 1.5)
+
+    assert card["status"] == "down"
+    assert card["details"]["probe_timeout"] is True
+
+
+def test_snapshot_cache_single_flight_under_concurrency():
+    import threading
+    import time
+
+    calls = []
+
+    def compute():
+        calls.append(1)
+        time.sleep(0.2)
+        return {"n": len(calls)}
+
+    cache = SnapshotCache(compute, ttl=30, stale_ttl=0)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get())) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert results == [{"n": 1}] * 8
+    assert cache.get() == {"n": 1}
+    assert cache.stats["hits"] == 1
+
+
+def test_snapshot_cache_serves_stale_while_revalidating():
+    import threading
+
+    gate = threading.Event()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        if len(calls) > 1:
+            gate.wait(2)
+        return {"n": len(calls)}
+
+    cache = SnapshotCache(compute, ttl=0, stale_ttl=60)
+    assert cache.get() == {"n": 1}
+    assert cache.get() == {"n": 1}
+    assert cache.stats["stale_hits"] == 1
+    gate.set()
+    for _ in range(100):
+        if cache.version == 2:
+            break
+        threading.Event().wait(0.01)
+    assert cache.get(force=True)["n"] >= 2
+
+
+def test_stream_differ_sends_keyframe_then_only_changed_cards_and_crossings():
+    from web_dashboard import StreamDiffer
+
+    def status(hermes_status, timestamp):
+        return {
+            "overview": {"timestamp": timestamp},
+            "cards": {
+                "hermes": {**make_probe(name="hermes", status=hermes_status, source="x", details={}), "timestamp": timestamp},
+                "gbrain": {**make_probe(name="gbrain", status="healthy", source="x", details={}), "timestamp": timestamp},
+            },
+        }
+
+    labyrinth = {"crossings": [{"id": "crossing-probe-hermes", "status": "healthy", "summary": "ok"}], "guideposts": []}
+    differ = StreamDiffer(keyframe_seconds=60)
+
+    event, payload = differ.frame(status("healthy", "t0"), labyrinth, now=0)
+    assert event == "keyframe"
+    assert "labyrinth" in payload
+
+    assert differ.frame(status("healthy", "t1"), labyrinth, now=1) is None
+
+    new_labyrinth = {
+        "crossings": [
+            {"id": "crossing-probe-hermes", "status": "degraded", "summary": "gateway missing"},
+            {"id": "crossing-action-1", "status": "failed", "summary": "boom"},
+        ],
+        "guideposts": [{"id": "guidepost-hermes", "severity": "degraded", "summary": "gateway missing"}],
+    }
+    event, payload = differ.frame(status("degraded", "t2"), new_labyrinth, now=2)
+    paths = {(op["op"], op["path"]) for op in payload["ops"]}
+    assert event == "patch"
+    assert paths == {
+        ("replace", "/cards/hermes"),
+        ("replace", "/crossings/crossing-probe-hermes"),
+        ("add", "/crossings/crossing-action-1"),
+        ("add", "/guideposts/guidepost-hermes"),
+    }
+
+    event, _ = differ.frame(status("degraded", "t3"), new_labyrinth, now=61)
+    assert event == "keyframe"
+
+
+def test_api_status_revalidates_with_etag_and_compresses_once_per_version(monkeypatch):
+    import web_dashboard
+
+    snapshot = {"overview": {"timestamp": "2026-04-28T00:00:00Z"}, "cards": {"hermes": _fake_card("hermes", "degraded")}, "pad": "x" * 4096}
+    current = [snapshot]
+    cache = SnapshotCache(lambda: current[0], ttl=60)
+    responses = web_dashboard.ResponseCache()
+    monkeypatch.setattr(web_dashboard, "snapshot_cache", cache)
+    monkeypatch.setattr(web_dashboard, "response_cache", responses)
+    client = TestClient(app)
+
+    first = client.get("/api/status", headers={"Accept-Encoding": "gzip"})
+    assert first.status_code == 200
+    assert first.headers["content-encoding"] == "gzip"
+    assert first.json()["cards"]["hermes"]["status"] == "degraded"
+    etag = first.headers["etag"]
+
+    plain = client.get("/api/status", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in plain.headers
+    assert plain.headers["etag"] == etag
+    assert responses.stats["encodes"] == 1
+
+    revalidated = client.get("/api/status", headers={"If-None-Match": etag})
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+
+    current[0] = {**snapshot, "cards": {"hermes": _fake_card("hermes", "healthy")}}
+    cache.invalidate()
+    changed = client.get("/api/status", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert web_dashboard.negotiate_encoding("gzip;q=0, br;q=0", 10_000) is None
+
+
+def test_identical_recompute_keeps_etag_but_serves_fresh_timestamps(monkeypatch):
+    import web_dashboard
+
+    ticks = []
+
+    def compute():
+        ticks.append(1)
+        stamp = f"2026-04-28T00:00:{len(ticks):02d}Z"
+        card = {**_fake_card("hermes", "healthy"), "timestamp": stamp, "freshness_seconds": len(ticks), "duration_ms": 3.0 * len(ticks)}
+        return {"overview": {"timestamp": stamp}, "cards": {"hermes": card}}
+
+    cache = SnapshotCache(compute, ttl=60)
+    monkeypatch.setattr(web_dashboard, "snapshot_cache", cache)
+    monkeypatch.setattr(web_dashboard, "response_cache", web_dashboard.ResponseCache())
+    client = TestClient(app)
+
+    first = client.get("/api/status")
+    cache.get(force=True)
+    assert cache.version == 1
+    assert cache.generation == 2
+    revalidated = client.get("/api/status", headers={"If-None-Match": first.headers["etag"]})
+    assert revalidated.status_code == 304
+    fresh = client.get("/api/status")
+    assert fresh.headers["etag"] == first.headers["etag"]
+    assert fresh.json()["overview"]["timestamp"] == "2026-04-28T00:00:02Z"
+
+
+def test_etags_agree_across_workers_only_when_content_does(monkeypatch):
+    import web_dashboard
+
+    def snapshot(status):
+        cards = {"hermes": _fake_card("hermes", status)}
+        cards["alerts"] = web_dashboard.build_alerts(cards)
+        return {"overview": {"timestamp": "t"}, "cards": cards, "card_order": ["hermes", "alerts"]}
+
+    # Two workers at the same local version number, one of them holding different content.
+    worker_a = SnapshotCache(lambda: snapshot("healthy"), ttl=60)
+    worker_b = SnapshotCache(lambda: snapshot("down"), ttl=60)
+    worker_c = SnapshotCache(lambda: snapshot("healthy"), ttl=60)
+    client = TestClient(app)
+
+    def fetch(worker, path, etag=None):
+        monkeypatch.setattr(web_dashboard, "snapshot_cache", worker)
+        monkeypatch.setattr(web_dashboard, "response_cache", web_dashboard.ResponseCache())
+        return client.get(path, headers={"If-None-Match": etag} if etag else {})
+
+    for path in ("/api/status", "/"):
+        first = fetch(worker_a, path)
+        assert worker_a.version == 1
+        moved = fetch(worker_b, path, first.headers["etag"])
+        assert worker_b.version == 1
+        assert moved.status_code == 200
+        assert moved.headers["etag"] != first.headers["etag"]
+        assert fetch(worker_c, path, first.headers["etag"]).status_code == 304
+
+    monkeypatch.setattr(web_dashboard, "STREAM_STATE", {"key": None, "labyrinth": None})
+    first = fetch(worker_a, "/api/labyrinth")
+    monkeypatch.setattr(web_dashboard, "STREAM_STATE", {"key": None, "labyrinth": None})
+    assert fetch(worker_b, "/api/labyrinth", first.headers["etag"]).status_code == 200
+
+
+def test_dashboard_home_renders_once_per_snapshot_version(monkeypatch):
+    import json
+    import re
+
+    import web_dashboard
+
+    snapshot = {"overview": {"timestamp": "t"}, "cards": {"hermes": _fake_card("hermes")}, "card_order": ["hermes"], "note": "</script><b>&'"}
+    cache = SnapshotCache(lambda: snapshot, ttl=60)
+    responses = web_dashboard.ResponseCache()
+    monkeypatch.setattr(web_dashboard, "snapshot_cache", cache)
+    monkeypatch.setattr(web_dashboard, "response_cache", responses)
+    renders = []
+    original = web_dashboard.render_dashboard
+    monkeypatch.setattr(web_dashboard, "render_dashboard", lambda *args: renders.append(1) or original(*args))
+    client = TestClient(app)
+
+    first = client.get("/")
+    second = client.get("/")
+    assert first.status_code == second.status_code == 200
+    assert first.headers["content-type"].startswith("text/html")
+    assert first.text == second.text
+    assert renders == [1]
+    assert "</script><b>" not in first.text
+    inline = re.search(r"const initialData = (.*);", first.text).group(1)
+    assert json.loads(inline) == snapshot
+
+    client.get("/api/status")
+    assert responses.stats["encodes"] == 2  # status JSON is shared with the page
+    assert client.get("/", headers={"If-None-Match": first.headers["etag"]}).status_code == 304
+
+
+def test_snapshot_event_stream_emits_keyframe(monkeypatch):
+    import asyncio
+    import web_dashboard
+
+    snapshot = {"overview": {"timestamp": "t"}, "cards": {"hermes": make_probe(name="hermes", status="healthy", source="x", details={})}}
+    monkeypatch.setattr(web_dashboard, "stream_state", lambda: (snapshot, {"crossings": [], "guideposts": []}))
+    monkeypatch.setattr(web_dashboard, "STREAM_INTERVAL", 0)
+
+    class FakeRequest:
+        checks = 0
+
+        async def is_disconnected(self):
+            self.checks += 1
+            return self.checks > 1
+
+    async def collect():
+        return [chunk async for chunk in web_dashboard.snapshot_event_stream(FakeRequest())]
+
+    chunks = asyncio.run(collect())
+
+    assert chunks[0].startswith("retry:")
+    assert chunks[1].startswith("event: keyframe\n")
+    assert len(chunks) == 2
+
+
+def test_process_index_scans_proc_once_and_answers_patterns(tmp_path):
+    from web_dashboard import ProcessIndex
+
+    for pid, cmdline in {
+        "101": b"/usr/bin/hermes\0gateway\0run\0--replace\0",
+        "102": b"/usr/local/bin/droid\0exec\0--api-key\0secret\0",
+        "103": b"/Applications/Factory.app/Contents/MacOS/Factory\0",
+        "104": b"",
+        "105": b"bash\0hermes-snap\0",
+    }.items():
+        (tmp_path / pid).mkdir()
+        (tmp_path / pid / "cmdline").write_bytes(cmdline)
+    (tmp_path / "meminfo").write_text("")
+
+    index = ProcessIndex(ttl=60, proc_root=tmp_path)
+
+    assert index.query("hermes") == ["101 /usr/bin/hermes gateway run --replace"]
+    assert index.query("Factory|factory") == ["103 /Applications/Factory.app/Contents/MacOS/Factory"]
+    assert index.evidence("droid") == ["102 droid-exec+droid"]
+    assert index.scans == 1
+
+
+def test_isolated_probe_answers_pgrep_from_the_parents_process_table(tmp_path, monkeypatch):
+    import web_dashboard
+
+    (tmp_path / "7").mkdir()
+    (tmp_path / "7" / "cmdline").write_bytes(b"/usr/local/bin/droid\0serve\0")
+    child_index = web_dashboard.ProcessIndex(ttl=0, proc_root=tmp_path)
+    monkeypatch.setattr(web_dashboard, "process_index", child_index)
+    parent_table = [(42, "/usr/local/bin/droid exec")]
+
+    card, _ = web_dashboard.run_isolated_probe("droids", lambda: {"seen": web_dashboard.run_pgrep("droid")}, processes=parent_table)
+
+    assert card == {"seen": ["42 /usr/local/bin/droid exec"]}
+    assert child_index.scans == 0
+    assert web_dashboard.run_pgrep("droid") == ["7 /usr/local/bin/droid serve"]
+    assert child_index.scans == 1
+
+
+def test_directory_count_index_only_relists_changed_directories(tmp_path):
+    import os
+    from web_dashboard import DirectoryCountIndex
+
+    lane = tmp_path / "lane"
+    (lane / "a" / "deep").mkdir(parents=True)
+    (lane / "b").mkdir()
+    for path in (lane / "top.md", lane / "a" / "one.md", lane / "a" / "deep" / "two.md", lane / "b" / "three.md"):
+        path.write_text("x")
+    old = 1_000_000_000_000_000_000
+    for directory in (lane, lane / "a", lane / "a" / "deep", lane / "b"):
+        os.utime(directory, ns=(old, old))
+
+    index_path = tmp_path / "cache" / "lanes.json"
+    index = DirectoryCountIndex(index_path)
+    assert index.count(lane) == 4
+    assert index.stats["relisted"] == 4
+    index.save()
+
+    warm = DirectoryCountIndex(index_path)
+    (lane / "b" / "four.md").write_text("x")
+    os.utime(lane / "b", ns=(old + 1, old + 1))
+    assert warm.count(lane) == 5
+    assert warm.stats == {"relisted": 1, "reused": 3}
+
+
+def test_skill_index_reparses_only_changed_skills_and_pages_sorted(tmp_path):
+    import os
+    import web_dashboard
+
+    def write_skill(root, rel, name, description="does things"):
+        skill_dir = root / rel
+        skill_dir.mkdir(parents=True, exist_ok=True)
+        (skill_dir / "SKILL.md").write_text(f"---\nname: {name}\ndescription: {description}\n---\n", encoding="utf-8")
+        old = 1_600_000_000_000_000_000
+        os.utime(skill_dir / "SKILL.md", ns=(old, old))
+        os.utime(skill_dir, ns=(old, old))
+
+    agents = tmp_path / ".agents" / "skills"
+    codex = tmp_path / ".codex" / "skills"
+    write_skill(agents, "zeta", "zeta")
+    write_skill(agents, "group/alpha", "alpha", "writes release notes")
+    write_skill(codex, "beta", "beta")
+    (agents / "node_modules" / "junk").mkdir(parents=True)
+    (agents / "node_modules" / "junk" / "SKILL.md").write_text("name: junk\n", encoding="utf-8")
+    index_path = tmp_path / "skill_index.json"
+
+    index = web_dashboard.SkillIndex(path=index_path, roots=[agents, codex])
+    names = [item["name"] for item in index.refresh()]
+    assert names == ["alpha", "zeta", "beta"]
+    assert index.stats["parsed"] == 3
+
+    write_skill(agents, "zeta", "zeta", "changed description that is longer")
+    index.refresh()
+    assert index.stats["parsed"] == 4
+    assert index.stats["reused"] == 2
+
+    restarted = web_dashboard.SkillIndex(path=index_path, roots=[agents, codex])
+    restarted.refresh()
+    assert restarted.stats["parsed"] == 0
+    assert restarted.query(q="release")["items"][0]["name"] == "alpha"
+    assert [item["name"] for item in restarted.query(namespace=".codex")["items"]] == ["beta"]
+    page = restarted.query(offset=1, limit=1)
+    assert page["total"] == 3
+    assert page["items"][0]["name"] == "zeta"
+    assert page["next_offset"] == 2
+
+
+def test_git_metadata_reader_parses_refs_without_forking(tmp_path):
+    import subprocess
+    from web_dashboard import GitMetadataReader
+
+    def git(*args):
+        subprocess.run(["git", "-C", str(tmp_path), *args], check=True, capture_output=True)
+
+    git("init", "-q", "-b", "lane/main")
+    git("-c", "user.name=t", "-c", "user.email=t@example.com", "commit", "-q", "--allow-empty", "-m", "first line", "-m", "body")
+    expected = subprocess.run(["git", "-C", str(tmp_path), "log", "-1", "--pretty=%h %s"], check=True, capture_output=True, text=True).stdout.strip()
+    (tmp_path / "sub").mkdir()
+
+    reader = GitMetadataReader()
+    info = reader.read(tmp_path / "sub")
+    assert info["branch"] == "lane/main"
+    assert info["commit"].split()[1:] == expected.split()[1:]
+    assert info["sha"].startswith(expected.split()[0])
+    assert reader.read(tmp_path / "sub") is info
+    assert reader.stats == {"hits": 1, "misses": 1, "subprocess": 0}
+
+    git("gc", "-q")
+    packed = GitMetadataReader()
+    assert packed.read(tmp_path)["commit"] == expected
+    assert packed.stats["subprocess"] == 1
+
+
+def test_http_probe_engine_opens_circuit_after_repeated_failures(monkeypatch):
+    calls = []
+
+    def refuse(url, _headers, _timeout):
+        calls.append(url)
+        raise ConnectionRefusedError("connection refused")
+
+    engine = HttpProbeEngine(failure_threshold=2, backoff=60)
+    monkeypatch.setattr(engine, "_request", refuse)
+
+    first = engine.probe("https://user:pw@example.com/mcp?token=x")
+    second = engine.probe("https://user:pw@example.com/mcp?token=x")
+    third = engine.probe("https://user:pw@example.com/mcp?token=x")
+
+    assert len(calls) == 2
+    assert first["reachable"] is False
+    assert first["circuit"] == "closed"
+    assert second["circuit"] == "open"
+    assert third["skipped"] is True
+    assert "connection refused" in third["error"]
+    histogram = engine.latency_histograms()["https://example.com/mcp"]
+    assert histogram["count"] == 2
+
+
+def test_http_probe_engine_reuses_keep_alive_connections():
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    connections = set()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            connections.add(self.client_address)
+            self.send_response(204)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        engine = HttpProbeEngine()
+        url = f"http://127.0.0.1:{server.server_address[1]}/health"
+        results = [engine.probe(url, timeout=2) for _ in range(3)]
+    finally:
+        server.shutdown()
+        engine.reset()
+
+    assert [result["http_status"] for result in results] == [204, 204, 204]
+    assert len(connections) == 1
+
+
+def test_tail_lines_reads_backwards_in_blocks(tmp_path):
+    from web_dashboard import tail_lines
+
+    log = tmp_path / "big.log"
+    log.write_text("".join(f"line-{i}\n" for i in range(1000)))
+
+    assert tail_lines(log, 3, block_size=16) == ["line-997", "line-998", "line-999"]
+    assert tail_lines(log, 2, skip=3, block_size=7) == ["line-995", "line-996"]
+    assert tail_lines(log, 5000, block_size=64)[0] == "line-0"
+    assert tail_lines(tmp_path / "missing.log", 5) == []
+
+
+def test_action_log_rotates_and_pages_history_by_offset(monkeypatch, tmp_path):
+    import web_dashboard
+    from web_dashboard import append_action_event, read_action_history
+
+    monkeypatch.setattr(web_dashboard, "HERO_ACTION_LOG", tmp_path / "actions.jsonl")
+    monkeypatch.setattr(web_dashboard, "ACTION_LOG_MAX_BYTES", 200)
+    monkeypatch.setattr(web_dashboard, "ACTION_LOG_KEEP", 50)
+
+    for number in range(30):
+        append_action_event({"id": f"a{number}", "status": "succeeded"})
+
+    archived = sorted((tmp_path / "actions.archive").iterdir())
+    assert archived, "log should have rotated"
+
+    first = read_action_history(offset=0, limit=5)
+    assert [event["id"] for event in first["events"]] == ["a25", "a26", "a27", "a28", "a29"]
+    assert first["total"] == 30
+    assert first["next_offset"] == 5
+
+    deep = read_action_history(offset=22, limit=5)
+    assert [event["id"] for event in deep["events"]] == ["a3", "a4", "a5", "a6", "a7"]
+
+    last = read_action_history(offset=27, limit=5)
+    assert [event["id"] for event in last["events"]] == ["a0", "a1", "a2"]
+    assert last["next_offset"] is None
+    assert web_dashboard.read_action_events(2) == [{"id": "a28", "status": "succeeded"}, {"id": "a29", "status": "succeeded"}]
+
+
+def test_parsed_file_cache_reparses_only_when_file_changes(tmp_path):
+    import os
+    import web_dashboard
+
+    calls = []
+
+    def parse(text):
+        calls.append(text)
+        return json.loads(text)
+
+    def write(path, payload, stamp):
+        path.write_text(json.dumps(payload), encoding="utf-8")
+        os.utime(path, ns=(stamp, stamp))
+
+    old = 1_600_000_000_000_000_000
+    first = tmp_path / "a.json"
+    write(first, {"v": 1}, old)
+    cache = web_dashboard.ParsedFileCache(max_entries=2)
+
+    assert cache.get(first, parse, {}) == {"v": 1}
+    assert cache.get(first, parse, {}) == {"v": 1}
+    assert len(calls) == 1
+    assert cache.stats["hits"] == 1
+
+    write(first, {"v": 2}, old + 1_000_000_000)
+    assert cache.get(first, parse, {}) == {"v": 2}
+    assert len(calls) == 2
+
+    first.write_text("{broken", encoding="utf-8")
+    os.utime(first, ns=(old, old))
+    assert cache.get(first, parse, {"fallback": True}) == {"fallback": True}
+    assert cache.stats["errors"] == 1
+    assert cache.get(tmp_path / "missing.json", parse, None) is None
+
+    for name in ("b.json", "c.json"):
+        write(tmp_path / name, {"name": name}, old)
+        cache.get(tmp_path / name, parse, {})
+    assert cache.stats["evictions"] == 1
+    assert len(cache._entries) == 2
+
+
+def test_config_loaders_share_parse_cache(monkeypatch, tmp_path):
+    import os
+    import web_dashboard
+
+    cache = web_dashboard.ParsedFileCache()
+    monkeypatch.setattr(web_dashboard, "parsed_files", cache)
+    config = tmp_path / "config.yaml"
+    config.write_text("model:\n  default: gpt\n", encoding="utf-8")
+    settings = tmp_path / "settings.json"
+    settings.write_text('{"customModels": []}', encoding="utf-8")
+    old = 1_600_000_000_000_000_000
+    for path in (config, settings):
+        os.utime(path, ns=(old, old))
+
+    for _ in range(3):
+        assert web_dashboard.try_load_yaml(config) == {"model": {"default": "gpt"}}
+        assert web_dashboard.load_factory_settings(settings) == {"customModels": []}
+    assert cache.stats["misses"] == 2
+    assert cache.stats["hits"] == 4
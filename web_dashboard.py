@@ -3,25 +3,39 @@
 
 from __future__ import annotations
 
+import asyncio
+import gzip
+import hashlib
+import http.client
 import json
 import logging
+import multiprocessing
 import os
+import random
 import re
 import shutil
 import socket
+import sqlite3
+import ssl
+import struct
 import subprocess
+import threading
 import time
-from collections import OrderedDict
+import zlib
+from array import array
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from contextlib import asynccontextmanager, suppress
 from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
 from typing import Any
-from urllib.error import HTTPError, URLError
-from urllib.parse import urlsplit, urlunsplit
-from urllib.request import Request, urlopen
+from urllib.parse import urlparse, urlsplit, urlunsplit
 
 from fastapi import FastAPI, HTTPException, Request as FastAPIRequest
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, JSONResponse, PlainTextResponse, Response, StreamingResponse
 from fastapi.templating import Jinja2Templates
+from markupsafe import Markup
 from starlette.concurrency import run_in_threadpool
 import uvicorn
 
@@ -30,6 +44,26 @@ try:
 except ImportError:  # pragma: no cover - optional dependency fallback
     yaml = None
 
+try:
+    import psutil
+except ImportError:  # pragma: no cover - optional dependency fallback
+    psutil = None
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - optional dependency fallback (non-POSIX)
+    fcntl = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency fallback
+    orjson = None
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency fallback
+    brotli = None
+
 logger = logging.getLogger("hero_reboot_dashboard")
 logging.basicConfig(level=logging.INFO)
 
@@ -60,6 +94,24 @@ def env_int(name: str, default: int) -> int:
         return default
 
 
+def env_float(name: str, default: float) -> float:
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    try:
+        return float(raw)
+    except ValueError:
+        logger.warning("Invalid %s=%r; falling back to %s", name, raw, default)
+        return default
+
+
+def env_flag(name: str, default: bool) -> bool:
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    return raw.strip().lower() not in {"0", "false", "no", "off", ""}
+
+
 WORKFLOWS_ROOT = env_path("HERO_WORKFLOWS_ROOT", Path.home() / "ORGANIZED/ACTIVE_PROJECTS/ARSENAL/WORKFLOWS")
 BRAIN_ROOT = env_path("HERO_BRAIN_ROOT", Path.home() / "brain")
 WIKI_GROK_SYSTEM = env_path("HERO_TELEGRAM_CANON", Path.home() / "wiki/queries/grok420system.md")
@@ -69,7 +121,10 @@ PORT_WORKSPACE = env_int("HERO_WORKSPACE_PORT", 3011)
 DROID_BRIDGE_PORT = env_int("HERO_DROID_BRIDGE_PORT", 8645)
 DASHBOARD_PORT = env_int("HERO_DASHBOARD_PORT", env_int("PORT", 8080))
 FACTORY_SETTINGS_PATH = env_path("HERO_FACTORY_SETTINGS", Path.home() / ".factory" / "settings.json")
-CARD_ORDER = ["hermes", "droids", "telegram", "gbrain", "workflows", "alerts"]
+# Probe cards are inserted ahead of "alerts" by register_probe, in registration order.
+CARD_ORDER = ["alerts"]
+PROBE_REGISTRY: OrderedDict[str, dict[str, Any]] = OrderedDict()
+PROBE_COST_CLASSES = ("light", "heavy")
 ACTION_REGISTRY: OrderedDict[str, dict[str, Any]] = OrderedDict(
     {
         "refresh_status": {
@@ -110,7 +165,6 @@ ACTION_REGISTRY: OrderedDict[str, dict[str, Any]] = OrderedDict(
         },
     }
 )
-SKILL_CACHE: dict[str, Any] = {"timestamp": 0.0, "items": []}
 FRESHNESS_THRESHOLDS = {
     "hermes": 60,
     "droids": 60,
@@ -119,6 +173,183 @@ FRESHNESS_THRESHOLDS = {
     "workflows": 60 * 60 * 24 * 14,
     "alerts": 60,
 }
+# Per-probe deadlines measured from the moment a snapshot dispatches its probes. Filled by
+# register_probe from each probe's declared timeout, overridable via HERO_PROBE_DEADLINE_<NAME>.
+PROBE_DEADLINES: dict[str, float] = {}
+DEFAULT_PROBE_DEADLINE = 5.0
+PROBE_ISOLATION = env_flag("HERO_PROBE_ISOLATION", True)
+PROBE_ISOLATION_WORKERS = max(1, env_int("HERO_PROBE_WORKERS", 2))
+PROCESS_INDEX_TTL = env_float("HERO_PROCESS_INDEX_TTL", 1.0)
+PROC_ROOT = Path("/proc")
+PROCESS_NOISE_MARKERS = ("hermes-snap", "hermes-cwd", "pgrep -fal")
+LANE_INDEX_PATH = HERO_CACHE / "lane_file_index.json"
+SKILL_INDEX_PATH = HERO_CACHE / "skill_index.json"
+SKILL_INDEX_TTL = env_float("HERO_SKILL_INDEX_TTL", 60.0)
+SKILL_MAX_DEPTH = 4
+SKILL_IGNORED_DIRS = {".git", "__pycache__", "node_modules", ".venv", "cache"}
+HTTP_BREAKER_FAILURES = env_int("HERO_HTTP_BREAKER_FAILURES", 3)
+HTTP_BREAKER_BACKOFF = env_float("HERO_HTTP_BREAKER_BACKOFF", 30.0)
+HTTP_BREAKER_MAX_BACKOFF = env_float("HERO_HTTP_BREAKER_MAX_BACKOFF", 300.0)
+HTTP_LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+HTTP_POOL_SIZE = 4
+HTTP_MAX_DRAIN_BYTES = 64 * 1024
+ACTION_LOG_MAX_BYTES = env_int("HERO_ACTION_LOG_MAX_BYTES", 5 * 1024 * 1024)
+ACTION_LOG_MAX_AGE_DAYS = env_int("HERO_ACTION_LOG_MAX_AGE_DAYS", 30)
+ACTION_LOG_KEEP = env_int("HERO_ACTION_LOG_KEEP", 10)
+ACTION_LOG_LOCK = threading.Lock()
+ACTION_CONCURRENCY = env_int("HERO_ACTION_CONCURRENCY", 2)
+JOB_OUTPUT_LINES = 2000
+JOB_RETENTION = 50
+SNAPSHOT_TTL = env_float("HERO_SNAPSHOT_TTL", 5.0)
+SNAPSHOT_STALE_TTL = env_float("HERO_SNAPSHOT_STALE_TTL", 30.0)
+STREAM_INTERVAL = env_float("HERO_STREAM_INTERVAL", 2.0)
+STREAM_KEYFRAME_SECONDS = env_float("HERO_STREAM_KEYFRAME", 60.0)
+STREAM_KEEPALIVE_SECONDS = 15.0
+HISTORY_PATH = HERO_CACHE / "history.bin"
+HISTORY_POINTS = env_int("HERO_HISTORY_POINTS", 4320)
+HISTORY_FLAP_WINDOW = env_float("HERO_HISTORY_FLAP_WINDOW", 900.0)
+HISTORY_FLAP_THRESHOLD = env_int("HERO_HISTORY_FLAP_THRESHOLD", 3)
+HISTORY_RECORD = struct.Struct("<dBBff")
+HISTORY_STATUSES = ("healthy", "stale", "degraded", "down")
+JSON_ENCODER = os.getenv("HERO_JSON_ENCODER", "auto").strip().lower()
+COMPRESS_MIN_BYTES = env_int("HERO_COMPRESS_MIN_BYTES", 1024)
+RESPONSE_CACHE_ENTRIES = 8
+DASHBOARD_WORKERS = max(1, env_int("HERO_DASHBOARD_WORKERS", 1))
+SHARED_SNAPSHOT_PATH = HERO_CACHE / "snapshots.sqlite3"
+SHARED_PROBER_LOCK = HERO_CACHE / "prober.lock"
+SHARED_SNAPSHOT_MAX_AGE = env_float("HERO_SHARED_SNAPSHOT_MAX_AGE", 30.0)
+LABYRINTH_EVENTS_IN_MEMORY = env_int("HERO_LABYRINTH_EVENTS_IN_MEMORY", 5000)
+PARSE_CACHE_ENTRIES = env_int("HERO_PARSE_CACHE_ENTRIES", 256)
+PROBE_SCHEDULER_ENABLED = env_flag("HERO_PROBE_SCHEDULER", True)
+SCHEDULER_MIN_INTERVAL = env_float("HERO_SCHEDULER_MIN_INTERVAL", 5.0)
+SCHEDULER_MAX_INTERVAL = env_float("HERO_SCHEDULER_MAX_INTERVAL", 300.0)
+SCHEDULER_JITTER = 0.1
+SCHEDULER_VOLATILITY_WINDOW = 6
+
+
+class MetricsRegistry:
+    """Minimal thread-safe counters and histograms rendered in Prometheus text format."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._families: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._collectors: list[Any] = []
+
+    def counter(self, name: str, help_text: str) -> None:
+        self._families.setdefault(name, {"type": "counter", "help": help_text, "values": {}})
+
+    def histogram(self, name: str, help_text: str, buckets: tuple[float, ...]) -> None:
+        self._families.setdefault(name, {"type": "histogram", "help": help_text, "buckets": buckets, "values": {}})
+
+    def collector(self, func: Any) -> None:
+        """Register ``func() -> list[(name, type, help, [(labels, value)])]`` for state owned elsewhere."""
+        self._collectors.append(func)
+
+    def inc(self, name: str, amount: float = 1.0, **labels: str) -> None:
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            values = self._families[name]["values"]
+            values[key] = values.get(key, 0.0) + amount
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            family = self._families[name]
+            series = family["values"].setdefault(key, {"buckets": [0] * len(family["buckets"]), "sum": 0.0, "count": 0})
+            for index, bound in enumerate(family["buckets"]):
+                if value <= bound:
+                    series["buckets"][index] += 1
+            series["sum"] += value
+            series["count"] += 1
+
+    def counter_values(self) -> dict[tuple[str, tuple[tuple[str, str], ...]], float]:
+        with self._lock:
+            return {
+                (name, key): value
+                for name, family in self._families.items()
+                if family["type"] == "counter"
+                for key, value in family["values"].items()
+            }
+
+    def merge_counters(self, deltas: dict[tuple[str, tuple[tuple[str, str], ...]], float]) -> None:
+        """Fold counter increments recorded in another process into this registry."""
+        with self._lock:
+            for (name, key), amount in deltas.items():
+                family = self._families.get(name)
+                if family is not None and family["type"] == "counter":
+                    family["values"][key] = family["values"].get(key, 0.0) + amount
+
+    def value(self, name: str, **labels: str) -> float:
+        with self._lock:
+            series = self._families[name]["values"].get(tuple(sorted(labels.items())))
+        if isinstance(series, dict):
+            return float(series["count"])
+        return float(series or 0.0)
+
+    def total(self, name: str, **labels: str) -> float:
+        """Sum of a counter across every series matching ``labels``."""
+        wanted = set(labels.items())
+        with self._lock:
+            return sum(value for key, value in self._families[name]["values"].items() if wanted <= set(key))
+
+    @staticmethod
+    def _labels(pairs: Any, extra: tuple[tuple[str, str], ...] = ()) -> str:
+        items = list(pairs) + list(extra)
+        if not items:
+            return ""
+        escaped = (
+            f'{key}="{str(value).replace(chr(92), chr(92) * 2).replace(chr(34), chr(92) + chr(34)).replace(chr(10), chr(92) + "n")}"'
+            for key, value in items
+        )
+        return "{" + ",".join(escaped) + "}"
+
+    def render(self) -> str:
+        lines: list[str] = []
+        with self._lock:
+            families = [(name, dict(family, values=dict(family["values"]))) for name, family in self._families.items()]
+        for name, family in families:
+            lines.append(f"# HELP {name} {family['help']}")
+            lines.append(f"# TYPE {name} {family['type']}")
+            for key, series in sorted(family["values"].items()):
+                if family["type"] == "counter":
+                    lines.append(f"{name}{self._labels(key)} {series:g}")
+                    continue
+                for bound, count in zip(family["buckets"], series["buckets"]):
+                    lines.append(f"{name}_bucket{self._labels(key, (('le', f'{bound:g}'),))} {count}")
+                lines.append(f"{name}_bucket{self._labels(key, (('le', '+Inf'),))} {series['count']}")
+                lines.append(f"{name}_sum{self._labels(key)} {series['sum']:.6f}")
+                lines.append(f"{name}_count{self._labels(key)} {series['count']}")
+        for collect in self._collectors:
+            for name, kind, help_text, samples in collect():
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} {kind}")
+                lines.extend(f"{sample_name}{self._labels(labels)} {value:g}" for sample_name, labels, value in samples)
+        return "\n".join(lines) + "\n"
+
+
+DURATION_BUCKETS_SECONDS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS_BYTES = (256, 1024, 4096, 16384, 65536, 262144, 1048576)
+PROBE_CONTEXT = threading.local()
+metrics = MetricsRegistry()
+metrics.histogram("hero_probe_duration_seconds", "Wall time of each dashboard probe run.", DURATION_BUCKETS_SECONDS)
+metrics.counter("hero_probe_timeouts_total", "Probes that missed their snapshot deadline.")
+metrics.counter("hero_probe_failures_total", "Probes that raised instead of returning a card.")
+metrics.counter("hero_subprocess_spawns_total", "Child processes started, by kind and by the probe that started them.")
+metrics.counter("hero_socket_connects_total", "Outbound sockets opened, by kind and by the probe that opened them.")
+metrics.histogram("hero_http_request_duration_seconds", "Dashboard endpoint latency.", DURATION_BUCKETS_SECONDS)
+metrics.histogram("hero_http_response_size_bytes", "Dashboard endpoint payload size.", SIZE_BUCKETS_BYTES)
+
+
+def current_probe() -> str:
+    return getattr(PROBE_CONTEXT, "name", None) or "none"
+
+
+def count_spawn(kind: str) -> None:
+    metrics.inc("hero_subprocess_spawns_total", kind=kind, probe=current_probe())
+
+
+def count_connect(kind: str) -> None:
+    metrics.inc("hero_socket_connects_total", kind=kind, probe=current_probe())
 
 
 def utc_now() -> datetime:
@@ -170,18 +401,83 @@ def preview_lines(value: str | None, max_lines: int = 80, max_chars: int = 5000)
     return "\n".join(lines)
 
 
+class ParsedFileCache:
+    """Bounded LRU of parsed config files keyed on ``(path, mtime_ns, size)``.
+
+    A lookup costs one ``stat``; the file is only read and parsed again when its mtime
+    or size moves. Files touched within the last couple of seconds are not cached, since
+    a second write in the same mtime tick would go unnoticed. Parsed values are shared
+    between callers and must be treated as read-only.
+    """
+
+    RACY_WINDOW_NS = 2_000_000_000
+
+    def __init__(self, max_entries: int = PARSE_CACHE_ENTRIES) -> None:
+        self.max_entries = max(1, max_entries)
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple[str, Any], tuple[tuple[int, int], Any]] = OrderedDict()
+        self.stats = {"hits": 0, "misses": 0, "errors": 0, "evictions": 0}
+
+    def get(self, path: Path, parse: Any, default: Any, label: str = "file") -> Any:
+        """``parse(text)`` for ``path``, or ``default`` when it is missing or does not parse."""
+        key = (str(path), parse)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            with self._lock:
+                self._entries.pop(key, None)
+            return default
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == stamp:
+                self._entries.move_to_end(key)
+                self.stats["hits"] += 1
+                return entry[1]
+            self.stats["misses"] += 1
+        try:
+            value = parse(Path(path).read_text(encoding="utf-8", errors="replace"))
+        except Exception as exc:
+            logger.warning("Failed to parse %s %s: %s", label, path, exc)
+            with self._lock:
+                self.stats["errors"] += 1
+            value = default
+        if time.time_ns() - stat.st_mtime_ns >= self.RACY_WINDOW_NS:
+            with self._lock:
+                self._entries[key] = (stamp, value)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                    self.stats["evictions"] += 1
+        return value
+
+
+parsed_files = ParsedFileCache()
+
+
+def _yaml_mapping(text: str) -> dict[str, Any]:
+    loaded = yaml.safe_load(text)
+    return loaded if isinstance(loaded, dict) else {}
+
+
+def _json_mapping(text: str) -> dict[str, Any]:
+    loaded = json.loads(text)
+    return loaded if isinstance(loaded, dict) else {}
+
+
 def try_load_yaml(path: Path) -> dict[str, Any]:
-    if not path.exists() or yaml is None:
-        return {}
-    try:
-        loaded = yaml.safe_load(path.read_text())
-        return loaded if isinstance(loaded, dict) else {}
-    except Exception as exc:  # pragma: no cover - defensive
-        logger.warning("Failed to parse YAML %s: %s", path, exc)
+    if yaml is None:
         return {}
+    return parsed_files.get(path, _yaml_mapping, {}, label="YAML")
 
 
 def run_pgrep(pattern: str) -> list[str]:
+    """Return ``pid cmdline`` lines matching ``pattern``, like ``pgrep -fal``, from the shared process index."""
+    return process_index.query(pattern)
+
+
+def pgrep_subprocess(pattern: str) -> list[str]:
+    count_spawn("pgrep")
     try:
         result = subprocess.run(
             ["pgrep", "-fal", pattern],
@@ -192,8 +488,7 @@ def run_pgrep(pattern: str) -> list[str]:
     except FileNotFoundError:
         return []
     lines = [line.strip() for line in result.stdout.splitlines() if line.strip()]
-    noise_markers = ("hermes-snap", "hermes-cwd", "pgrep -fal")
-    return [line for line in lines if not any(marker in line for marker in noise_markers)]
+    return [line for line in lines if not any(marker in line for marker in PROCESS_NOISE_MARKERS)]
 
 
 def redact_process_line(line: str) -> str:
@@ -227,7 +522,105 @@ def redact_process_lines(lines: list[str], limit: int = 6) -> list[str]:
     return [redact_process_line(line) for line in lines[:limit]]
 
 
+class ProcessIndex:
+    """In-memory index of process command lines, scanned once and shared by every probe.
+
+    Reads ``/proc`` directly where it exists and falls back to psutil. When neither is
+    available each query shells out to ``pgrep`` as before.
+    """
+
+    def __init__(self, ttl: float = PROCESS_INDEX_TTL, proc_root: Path = PROC_ROOT) -> None:
+        self.ttl = ttl
+        self.proc_root = proc_root
+        self._lock = threading.Lock()
+        self._entries: list[tuple[int, str]] | None = None
+        self._scanned_at = 0.0
+        self._pinned = False
+        self.scans = 0
+
+    def _scan_proc(self) -> list[tuple[int, str]]:
+        entries: list[tuple[int, str]] = []
+        with os.scandir(self.proc_root) as listing:
+            for entry in listing:
+                if not entry.name.isdigit():
+                    continue
+                try:
+                    with open(os.path.join(entry.path, "cmdline"), "rb") as handle:
+                        raw = handle.read()
+                except OSError:
+                    continue
+                command = raw.replace(b"\0", b" ").decode("utf-8", errors="replace").strip()
+                if command:
+                    entries.append((int(entry.name), command))
+        return entries
+
+    def _scan_psutil(self) -> list[tuple[int, str]]:
+        entries: list[tuple[int, str]] = []
+        for proc in psutil.process_iter(["pid", "cmdline"]):
+            cmdline = proc.info.get("cmdline") or []
+            command = " ".join(cmdline).strip()
+            if command:
+                entries.append((proc.info["pid"], command))
+        return entries
+
+    def _scan(self) -> list[tuple[int, str]] | None:
+        try:
+            if self.proc_root.is_dir():
+                return self._scan_proc()
+            if psutil is not None:
+                return self._scan_psutil()
+        except Exception as exc:  # pragma: no cover - defensive
+            logger.warning("Process scan failed, falling back to pgrep: %s", exc)
+        return None
+
+    def refresh(self, force: bool = False) -> None:
+        with self._lock:
+            if self._pinned or (not force and self._scanned_at and time.monotonic() - self._scanned_at < self.ttl):
+                return
+            self._entries = self._scan()
+            self._scanned_at = time.monotonic()
+            self.scans += 1
+
+    def entries(self) -> list[tuple[int, str]] | None:
+        """The current ``(pid, command)`` table, or None when queries fall back to ``pgrep``."""
+        self.refresh()
+        with self._lock:
+            return self._entries
+
+    def pin(self, entries: list[tuple[int, str]]) -> None:
+        """Answer queries from a table scanned elsewhere, without rescanning, until ``unpin``."""
+        with self._lock:
+            self._entries = entries
+            self._scanned_at = time.monotonic()
+            self._pinned = True
+
+    def unpin(self) -> None:
+        with self._lock:
+            self._pinned = False
+
+    def query(self, pattern: str) -> list[str]:
+        self.refresh()
+        with self._lock:
+            entries = self._entries
+        if entries is None:
+            return pgrep_subprocess(pattern)
+        try:
+            matcher = re.compile(pattern)
+        except re.error:
+            matcher = re.compile(re.escape(pattern))
+        lines = [f"{pid} {command}" for pid, command in entries if matcher.search(command)]
+        return [line for line in lines if not any(marker in line for marker in PROCESS_NOISE_MARKERS)]
+
+    def evidence(self, pattern: str, limit: int = 6) -> list[str]:
+        """Matching processes with arguments stripped by ``redact_process_line``."""
+        return redact_process_lines(self.query(pattern), limit=limit)
+
+
+process_index = ProcessIndex()
+
+
 def run_command(args: list[str], timeout: float = 2.0) -> tuple[int, str, str]:
+    count_spawn("command")
     try:
         result = subprocess.run(
             args,
@@ -256,18 +649,129 @@ def list_actions() -> list[dict[str, Any]]:
     return [action_public_payload(action_id, spec) for action_id, spec in ACTION_REGISTRY.items()]
 
 
-def append_action_event(event: dict[str, Any]) -> None:
-    HERO_HOME.mkdir(parents=True, exist_ok=True)
-    with HERO_ACTION_LOG.open("a", encoding="utf-8") as handle:
-        handle.write(json.dumps(event, sort_keys=True) + "\n")
+def tail_lines(path: Path, max_lines: int, skip: int = 0, block_size: int = 64 * 1024) -> list[str]:
+    """Last ``max_lines`` lines of ``path`` before the final ``skip`` lines, read backwards from EOF."""
+    wanted = max_lines + skip
+    if max_lines <= 0:
+        return []
+    try:
+        handle = path.open("rb")
+    except OSError:
+        return []
+    with handle:
+        handle.seek(0, os.SEEK_END)
+        position = handle.tell()
+        data = b""
+        while position > 0 and data.count(b"\n") <= wanted:
+            step = min(block_size, position)
+            position -= step
+            handle.seek(position)
+            data = handle.read(step) + data
+    lines = data.decode("utf-8", errors="replace").splitlines()
+    if position > 0:
+        lines = lines[1:]
+    end = max(0, len(lines) - skip)
+    return lines[max(0, end - max_lines) : end]
 
 
-def read_action_events(limit: int = 20) -> list[dict[str, Any]]:
-    if not HERO_ACTION_LOG.exists():
-        return []
-    lines = HERO_ACTION_LOG.read_text(encoding="utf-8", errors="replace").splitlines()
+def action_index_path() -> Path:
+    return HERO_ACTION_LOG.with_name(f"{HERO_ACTION_LOG.stem}.index.json")
+
+
+def action_archive_dir() -> Path:
+    return HERO_ACTION_LOG.with_name(f"{HERO_ACTION_LOG.stem}.archive")
+
+
+def labyrinth_events_path() -> Path:
+    return HERO_ACTION_LOG.with_name("labyrinth_events.jsonl")
+
+
+def load_action_index() -> dict[str, Any]:
+    try:
+        loaded = json.loads(action_index_path().read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        loaded = {}
+    if not isinstance(loaded, dict):
+        loaded = {}
+    loaded.setdefault("segments", [])
+    loaded.setdefault("active", {})
+    return loaded
+
+
+def save_action_index(index: dict[str, Any]) -> None:
+    path = action_index_path()
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(index, sort_keys=True), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def count_newlines(path: Path, start: int = 0) -> int:
+    total = 0
+    with path.open("rb") as handle:
+        handle.seek(start)
+        for block in iter(lambda: handle.read(1024 * 1024), b""):
+            total += block.count(b"\n")
+    return total
+
+
+def active_line_count(index: dict[str, Any]) -> int:
+    """Lines in the live action log, counted incrementally from the last known size."""
+    active = index["active"]
+    try:
+        size = HERO_ACTION_LOG.stat().st_size
+    except OSError:
+        return 0
+    counted = active.get("counted_bytes", 0)
+    if size < counted:
+        counted, active["lines"] = 0, 0
+    if size > counted:
+        active["lines"] = active.get("lines", 0) + count_newlines(HERO_ACTION_LOG, counted)
+        active["counted_bytes"] = size
+    return active.get("lines", 0)
+
+
+def rotate_action_log(index: dict[str, Any], now: float | None = None) -> bool:
+    """Move the live log into the archive when it exceeds the size or age budget."""
+    now = time.time() if now is None else now
+    try:
+        size = HERO_ACTION_LOG.stat().st_size
+    except OSError:
+        return False
+    active = index["active"]
+    opened_at = active.setdefault("opened_at", now)
+    too_big = size >= ACTION_LOG_MAX_BYTES
+    too_old = size > 0 and now - opened_at >= ACTION_LOG_MAX_AGE_DAYS * 86400
+    if not (too_big or too_old):
+        return False
+    lines = active_line_count(index)
+    archive = action_archive_dir()
+    archive.mkdir(parents=True, exist_ok=True)
+    stamp = datetime.fromtimestamp(now, tz=timezone.utc).strftime("%Y%m%dT%H%M%S")
+    name = f"{HERO_ACTION_LOG.stem}-{stamp}-{len(index['segments'])}.jsonl"
+    os.replace(HERO_ACTION_LOG, archive / name)
+    index["segments"].append({"file": name, "lines": lines, "opened_at": opened_at, "closed_at": now})
+    while len(index["segments"]) > max(0, ACTION_LOG_KEEP):
+        dropped = index["segments"].pop(0)
+        (archive / dropped["file"]).unlink(missing_ok=True)
+    index["active"] = {"opened_at": now, "lines": 0, "counted_bytes": 0}
+    return True
+
+
+def append_action_event(event: dict[str, Any]) -> None:
+    HERO_ACTION_LOG.parent.mkdir(parents=True, exist_ok=True)
+    with ACTION_LOG_LOCK:
+        index = load_action_index()
+        rotate_action_log(index)
+        with HERO_ACTION_LOG.open("a", encoding="utf-8") as handle:
+            handle.write(json.dumps(event, sort_keys=True) + "\n")
+        active_line_count(index)
+        save_action_index(index)
+    labyrinth_events.record_action(event)
+
+
+def parse_action_lines(lines: list[str]) -> list[dict[str, Any]]:
     events: list[dict[str, Any]] = []
-    for line in lines[-limit:]:
+    for line in lines:
         try:
             parsed = json.loads(line)
         except json.JSONDecodeError:
@@ -277,6 +781,36 @@ def read_action_events(limit: int = 20) -> list[dict[str, Any]]:
     return events
 
 
+def read_action_events(limit: int = 20) -> list[dict[str, Any]]:
+    return parse_action_lines(tail_lines(HERO_ACTION_LOG, limit))
+
+
+def read_action_history(offset: int = 0, limit: int = 50) -> dict[str, Any]:
+    """One page of action history, ``offset`` lines back from the newest, oldest-first within the page."""
+    offset = max(0, offset)
+    with ACTION_LOG_LOCK:
+        index = load_action_index()
+        segments = [(HERO_ACTION_LOG, active_line_count(index))]
+        archive = action_archive_dir()
+        segments.extend((archive / item["file"], item["lines"]) for item in reversed(index["segments"]))
+    total = sum(lines for _, lines in segments)
+    chunks: list[list[str]] = []
+    skip, remaining = offset, limit
+    for path, lines in segments:
+        if remaining <= 0:
+            break
+        if skip >= lines:
+            skip -= lines
+            continue
+        chunk = tail_lines(path, min(remaining, lines - skip), skip=skip)
+        chunks.append(chunk)
+        remaining -= len(chunk)
+        skip = 0
+    ordered = [line for chunk in reversed(chunks) for line in chunk]
+    next_offset = offset + limit if offset + limit < total else None
+    return {"events": parse_action_lines(ordered), "offset": offset, "limit": limit, "total": total, "next_offset": next_offset}
+
+
 def tail_dashboard_logs(max_lines: int = 80) -> tuple[str, str]:
     candidates = [
         HERO_LOGS / "web_dashboard.log",
@@ -286,13 +820,61 @@ def tail_dashboard_logs(max_lines: int = 80) -> tuple[str, str]:
     for path in candidates:
         if not path.exists():
             continue
-        lines = path.read_text(encoding="utf-8", errors="replace").splitlines()[-max_lines:]
+        lines = tail_lines(path, max_lines)
         chunks.append(f"==> {path}\n" + "\n".join(lines))
     if not chunks:
         return "", "No dashboard logs found in ~/.hero_core/logs"
     return "\n\n".join(chunks), ""
 
 
+def run_internal_action(action_id: str) -> tuple[str, int, str, str]:
+    """Run an in-process action and return ``(status, exit_code, stdout, stderr)``."""
+    if action_id == "refresh_status":
+        # With the scheduler attached a snapshot only re-ages its cards, so probe explicitly first.
+        if runtime.scheduler is not None:
+            runtime.scheduler.refresh_all()
+        current = snapshot_cache.get(force=True)
+        stdout = json.dumps(
+            {
+                "timestamp": current["overview"]["timestamp"],
+                "cards": {name: current["cards"][name]["status"] for name in current["card_order"]},
+            },
+            indent=2,
+        )
+        return "succeeded", 0, stdout, ""
+    if action_id == "tail_logs":
+        stdout, stderr = tail_dashboard_logs()
+        return ("succeeded", 0, stdout, stderr) if stdout else ("failed", 1, stdout, stderr)
+    raise KeyError(action_id)
+
+
+def build_action_event(
+    action_id: str,
+    spec: dict[str, Any],
+    *,
+    status: str,
+    exit_code: int,
+    started_at: str,
+    duration_ms: int,
+    stdout: str,
+    stderr: str,
+) -> dict[str, Any]:
+    return {
+        "id": f"action-{int(time.time() * 1000)}-{action_id}",
+        "action_id": action_id,
+        "label": spec["label"],
+        "status": status,
+        "exit_code": exit_code,
+        "started_at": started_at,
+        "completed_at": iso_now(),
+        "duration_ms": duration_ms,
+        "cwd": str(ROOT),
+        "command": spec.get("args", [action_id]),
+        "stdout_preview": preview_lines(stdout),
+        "stderr_preview": preview_lines(stderr),
+    }
+
+
 def execute_action(action_id: str) -> dict[str, Any]:
     spec = ACTION_REGISTRY.get(action_id)
     if not spec:
@@ -306,20 +888,10 @@ def execute_action(action_id: str) -> dict[str, Any]:
     stderr = ""
 
     try:
-        if action_id == "refresh_status":
-            current = runtime.snapshot()
-            stdout = json.dumps(
-                {
-                    "timestamp": current["overview"]["timestamp"],
-                    "cards": {name: current["cards"][name]["status"] for name in current["card_order"]},
-                },
-                indent=2,
-            )
-        elif action_id == "tail_logs":
-            stdout, stderr = tail_dashboard_logs()
-            exit_code = 0 if stdout else 1
-            status = "succeeded" if stdout else "failed"
+        if spec["kind"] == "internal":
+            status, exit_code, stdout, stderr = run_internal_action(action_id)
         else:
+            count_spawn("action")
             result = subprocess.run(
                 spec["args"],
                 cwd=str(ROOT),
@@ -342,27 +914,254 @@ def execute_action(action_id: str) -> dict[str, Any]:
         exit_code = 1
         stderr = f"{type(exc).__name__}: {exc}"
 
-    completed_at = iso_now()
-    duration_ms = int((time.monotonic() - started) * 1000)
-    event = {
-        "id": f"action-{int(time.time() * 1000)}-{action_id}",
-        "action_id": action_id,
-        "label": spec["label"],
-        "status": status,
-        "exit_code": exit_code,
-        "started_at": started_at,
-        "completed_at": completed_at,
-        "duration_ms": duration_ms,
-        "cwd": str(ROOT),
-        "command": spec.get("args", [action_id]),
-        "stdout_preview": preview_lines(stdout),
-        "stderr_preview": preview_lines(stderr),
-    }
+    event = build_action_event(
+        action_id,
+        spec,
+        status=status,
+        exit_code=exit_code,
+        started_at=started_at,
+        duration_ms=int((time.monotonic() - started) * 1000),
+        stdout=stdout,
+        stderr=stderr,
+    )
     append_action_event(event)
     return event
 
 
+class ActionJob:
+    """One queued or running operator action and its redacted, line-by-line output."""
+
+    def __init__(self, action_id: str, spec: dict[str, Any]) -> None:
+        self.id = f"job-{int(time.time() * 1000)}-{action_id}-{os.urandom(3).hex()}"
+        self.action_id = action_id
+        self.spec = spec
+        self.status = "queued"
+        self.queued_at = iso_now()
+        self.started_at: str | None = None
+        self.queued_monotonic = time.monotonic()
+        self.started_monotonic: float | None = None
+        self.output: list[dict[str, Any]] = []
+        self.next_seq = 0
+        self.event: dict[str, Any] | None = None
+        self.changed = asyncio.Condition()
+        self.task: asyncio.Task | None = None
+
+    @property
+    def finished(self) -> bool:
+        return self.event is not None
+
+    async def emit(self, stream: str, line: str) -> None:
+        async with self.changed:
+            self.output.append({"seq": self.next_seq, "stream": stream, "line": redact_text(line)})
+            self.next_seq += 1
+            if len(self.output) > JOB_OUTPUT_LINES:
+                del self.output[: len(self.output) - JOB_OUTPUT_LINES]
+            self.changed.notify_all()
+
+    def output_after(self, seq: int) -> list[dict[str, Any]]:
+        if not self.output:
+            return []
+        return self.output[max(0, seq + 1 - self.output[0]["seq"]) :]
+
+    async def set_status(self, status: str) -> None:
+        async with self.changed:
+            self.status = status
+            self.changed.notify_all()
+
+    def text(self, stream: str) -> str:
+        return "\n".join(item["line"] for item in self.output if item["stream"] == stream)
+
+    def payload(self, include_output: bool = False) -> dict[str, Any]:
+        payload = {
+            "job_id": self.id,
+            "action_id": self.action_id,
+            "label": self.spec["label"],
+            "status": self.status,
+            "queued_at": self.queued_at,
+            "started_at": self.started_at,
+            "event": self.event,
+            "links": {"self": f"/api/jobs/{self.id}", "stream": f"/api/jobs/{self.id}/stream"},
+        }
+        if include_output:
+            payload["output"] = list(self.output)
+        return payload
+
+
+class ActionJobManager:
+    """Runs operator actions as asyncio jobs under a global concurrency cap.
+
+    Identical actions already queued or running are deduplicated onto the existing
+    job. Command actions run as asyncio subprocesses so they never hold a threadpool
+    worker; internal actions still use the threadpool.
+    """
+
+    def __init__(self, concurrency: int = ACTION_CONCURRENCY, retention: int = JOB_RETENTION) -> None:
+        self.concurrency = max(1, concurrency)
+        self.retention = retention
+        self.jobs: OrderedDict[str, ActionJob] = OrderedDict()
+        self._active: dict[str, ActionJob] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+        self.metrics: dict[str, dict[str, float]] = {}
+
+    def _bind(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop or self._semaphore is None:
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+            self._active.clear()
+        return self._semaphore
+
+    def _metric(self, action_id: str) -> dict[str, float]:
+        return self.metrics.setdefault(
+            action_id,
+            {"submitted": 0, "deduplicated": 0, "runs": 0, "failures": 0, "queue_ms_total": 0.0, "queue_ms_max": 0.0, "run_ms_total": 0.0, "run_ms_max": 0.0},
+        )
+
+    def submit(self, action_id: str) -> tuple[ActionJob, bool]:
+        """Queue ``action_id`` and return ``(job, created)``."""
+        spec = ACTION_REGISTRY.get(action_id)
+        if not spec:
+            raise KeyError(action_id)
+        semaphore = self._bind()
+        metric = self._metric(action_id)
+        existing = self._active.get(action_id)
+        if existing is not None and not existing.finished:
+            metric["deduplicated"] += 1
+            return existing, False
+        metric["submitted"] += 1
+        job = ActionJob(action_id, spec)
+        self.jobs[job.id] = job
+        self._active[action_id] = job
+        job.task = asyncio.get_running_loop().create_task(self._run(job, semaphore))
+        self._prune()
+        return job, True
+
+    def get(self, job_id: str) -> ActionJob | None:
+        return self.jobs.get(job_id)
+
+    def _prune(self) -> None:
+        finished = [job_id for job_id, job in self.jobs.items() if job.finished]
+        for job_id in finished[: max(0, len(finished) - self.retention)]:
+            del self.jobs[job_id]
+
+    async def _pump(self, job: ActionJob, stream_name: str, stream: asyncio.StreamReader) -> None:
+        pending = b""
+        while True:
+            chunk = await stream.read(4096)
+            if not chunk:
+                break
+            pending += chunk
+            *lines, pending = pending.split(b"\n")
+            for line in lines:
+                await job.emit(stream_name, line.decode("utf-8", errors="replace"))
+        if pending:
+            await job.emit(stream_name, pending.decode("utf-8", errors="replace"))
+
+    async def _run_command(self, job: ActionJob) -> tuple[str, int]:
+        timeout = job.spec.get("timeout", 30)
+        count_spawn("action")
+        process = await asyncio.create_subprocess_exec(
+            *job.spec["args"],
+            cwd=str(ROOT),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        pumps = asyncio.gather(self._pump(job, "stdout", process.stdout), self._pump(job, "stderr", process.stderr))
+        try:
+            await asyncio.wait_for(asyncio.shield(pumps), timeout=timeout)
+            exit_code = await process.wait()
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            await pumps
+            await job.emit("stderr", f"Action timed out after {timeout}s")
+            return "failed", 124
+        except asyncio.CancelledError:
+            # Server shutdown: do not leave the child running without a reader.
+            if process.returncode is None:
+                process.kill()
+            pumps.cancel()
+            raise
+        return ("succeeded" if exit_code == 0 else "failed"), exit_code
+
+    async def _run(self, job: ActionJob, semaphore: asyncio.Semaphore) -> None:
+        async with semaphore:
+            job.started_monotonic = time.monotonic()
+            job.started_at = iso_now()
+            await job.set_status("running")
+            try:
+                if job.spec["kind"] == "internal":
+                    status, exit_code, stdout, stderr = await run_in_threadpool(run_internal_action, job.action_id)
+                    for stream_name, text in (("stdout", stdout), ("stderr", stderr)):
+                        for line in text.splitlines():
+                            await job.emit(stream_name, line)
+                else:
+                    status, exit_code = await self._run_command(job)
+            except Exception as exc:
+                status, exit_code = "failed", 1
+                await job.emit("stderr", f"{type(exc).__name__}: {exc}")
+            run_ms = (time.monotonic() - job.started_monotonic) * 1000
+            event = build_action_event(
+                job.action_id,
+                job.spec,
+                status=status,
+                exit_code=exit_code,
+                started_at=job.started_at,
+                duration_ms=int(run_ms),
+                stdout=job.text("stdout"),
+                stderr=job.text("stderr"),
+            )
+            event["job_id"] = job.id
+            try:
+                await run_in_threadpool(append_action_event, event)
+            except OSError as exc:  # pragma: no cover - defensive
+                logger.warning("Failed to record action %s: %s", job.id, exc)
+            queue_ms = (job.started_monotonic - job.queued_monotonic) * 1000
+            metric = self._metric(job.action_id)
+            metric["runs"] += 1
+            metric["failures"] += 0 if status == "succeeded" else 1
+            metric["queue_ms_total"] += queue_ms
+            metric["queue_ms_max"] = max(metric["queue_ms_max"], queue_ms)
+            metric["run_ms_total"] += run_ms
+            metric["run_ms_max"] = max(metric["run_ms_max"], run_ms)
+            async with job.changed:
+                job.event = event
+                job.status = status
+                job.changed.notify_all()
+            if self._active.get(job.action_id) is job:
+                del self._active[job.action_id]
+
+    async def wait(self, job: ActionJob) -> dict[str, Any]:
+        async with job.changed:
+            await job.changed.wait_for(lambda: job.finished)
+        return job.event or {}
+
+    async def stream(self, job: ActionJob, after: int = -1):
+        """Yield SSE messages for ``job`` output after sequence number ``after``, then its final event."""
+        last_seq = after
+        status = None
+        while True:
+            async with job.changed:
+                await job.changed.wait_for(lambda seq=last_seq, seen=status: job.next_seq - 1 > seq or job.status != seen or job.finished)
+                lines = job.output_after(last_seq)
+                status = job.status
+                finished = job.finished
+            for item in lines:
+                yield f"id: {item['seq']}\n" + sse_message("output", item)
+            if lines:
+                last_seq = lines[-1]["seq"]
+            if finished:
+                yield sse_message("done", job.event or {})
+                return
+            yield sse_message("status", {"job_id": job.id, "status": status})
+
+
+job_manager = ActionJobManager()
+
+
 def port_open(port: int, host: str = "127.0.0.1", timeout: float = 0.35) -> bool:
+    count_connect("port")
     try:
         with socket.create_connection((host, port), timeout=timeout):
             return True
@@ -370,6 +1169,161 @@ def port_open(port: int, host: str = "127.0.0.1", timeout: float = 0.35) -> bool
         return False
 
 
+class HttpProbeEngine:
+    """Shared HTTP health checks with keep-alive pooling, a per-endpoint circuit breaker
+    and per-endpoint latency histograms.
+
+    Calls are blocking and thread-safe; concurrency comes from the probe executor.
+    After ``failure_threshold`` consecutive failures (transport errors or HTTP 5xx) the
+    breaker opens and ``probe`` returns the last result without touching the network
+    until the backoff expires. Each failed retry doubles the backoff up to ``max_backoff``.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = HTTP_BREAKER_FAILURES,
+        backoff: float = HTTP_BREAKER_BACKOFF,
+        max_backoff: float = HTTP_BREAKER_MAX_BACKOFF,
+    ) -> None:
+        self.failure_threshold = max(1, failure_threshold)
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self._lock = threading.Lock()
+        self._idle: dict[tuple[str, str, int], list[http.client.HTTPConnection]] = {}
+        self._breakers: dict[str, dict[str, Any]] = {}
+        self._latency: dict[str, dict[str, Any]] = {}
+
+    @staticmethod
+    def _connect(key: tuple[str, str, int], timeout: float) -> http.client.HTTPConnection:
+        count_connect("http")
+        scheme, host, port = key
+        if scheme == "https":
+            return http.client.HTTPSConnection(host, port, timeout=timeout, context=ssl.create_default_context())
+        return http.client.HTTPConnection(host, port, timeout=timeout)
+
+    def _checkout(self, key: tuple[str, str, int], timeout: float) -> tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                conn = idle.pop()
+                conn.timeout = timeout
+                if conn.sock is not None:
+                    conn.sock.settimeout(timeout)
+                return conn, True
+        return self._connect(key, timeout), False
+
+    def _checkin(self, key: tuple[str, str, int], conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < HTTP_POOL_SIZE:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def _request(self, url: str, headers: dict[str, str], timeout: float) -> int:
+        parts = urlsplit(url)
+        key = (parts.scheme, parts.hostname or "", parts.port or (443 if parts.scheme == "https" else 80))
+        path = parts.path or "/"
+        if parts.query:
+            path = f"{path}?{parts.query}"
+        conn, reused = self._checkout(key, timeout)
+        while True:
+            try:
+                conn.request("GET", path, headers=headers)
+                response = conn.getresponse()
+                break
+            except (OSError, http.client.HTTPException):
+                conn.close()
+                if not reused:
+                    raise
+                # The server may have dropped an idle keep-alive connection; retry once fresh.
+                conn, reused = self._connect(key, timeout), False
+        self._finish(key, conn, response)
+        return response.status
+
+    def _finish(self, key: tuple[str, str, int], conn: http.client.HTTPConnection, response: http.client.HTTPResponse) -> None:
+        # Only small, fully-sized bodies are drained for reuse; streaming endpoints
+        # (MCP may answer GET with an event stream) are closed instead of read.
+        length = response.getheader("Content-Length")
+        if response.will_close or length is None or not length.isdigit() or int(length) > HTTP_MAX_DRAIN_BYTES:
+            conn.close()
+            return
+        try:
+            response.read()
+        except (OSError, http.client.HTTPException):
+            conn.close()
+            return
+        self._checkin(key, conn)
+
+    def _observe(self, endpoint: str, latency_ms: float) -> None:
+        with self._lock:
+            histogram = self._latency.setdefault(
+                endpoint, {"buckets": [0] * (len(HTTP_LATENCY_BUCKETS_MS) + 1), "sum_ms": 0.0, "count": 0}
+            )
+            index = next((i for i, bound in enumerate(HTTP_LATENCY_BUCKETS_MS) if latency_ms <= bound), len(HTTP_LATENCY_BUCKETS_MS))
+            histogram["buckets"][index] += 1
+            histogram["sum_ms"] += latency_ms
+            histogram["count"] += 1
+
+    def latency_histograms(self) -> dict[str, dict[str, Any]]:
+        with self._lock:
+            return {endpoint: {**data, "buckets": list(data["buckets"])} for endpoint, data in self._latency.items()}
+
+    def probe(self, url: str, headers: dict[str, str] | None = None, timeout: float = 4.0) -> dict[str, Any]:
+        """GET ``url`` and report reachability; any HTTP status counts as reachable."""
+        endpoint = sanitize_url(url) or url
+        now = time.monotonic()
+        with self._lock:
+            breaker = self._breakers.setdefault(endpoint, {"failures": 0, "open_until": 0.0, "backoff": self.backoff, "last": None})
+            if breaker["open_until"] > now and breaker["last"] is not None:
+                cached = dict(breaker["last"])
+                cached.update({"skipped": True, "circuit": "open", "retry_in_seconds": round(breaker["open_until"] - now, 1)})
+                return cached
+
+        started = time.monotonic()
+        http_status: int | None = None
+        error: str | None = None
+        try:
+            http_status = self._request(url, headers or {}, timeout)
+        except (OSError, http.client.HTTPException) as exc:
+            error = str(exc) or type(exc).__name__
+        latency_ms = round((time.monotonic() - started) * 1000, 1)
+        self._observe(endpoint, latency_ms)
+
+        failed = error is not None or (http_status is not None and http_status >= 500)
+        with self._lock:
+            if failed:
+                breaker["failures"] += 1
+                if breaker["failures"] >= self.failure_threshold:
+                    breaker["open_until"] = time.monotonic() + breaker["backoff"]
+                    breaker["backoff"] = min(breaker["backoff"] * 2, self.max_backoff)
+            else:
+                breaker.update({"failures": 0, "open_until": 0.0, "backoff": self.backoff})
+            result = {
+                "endpoint": endpoint,
+                "reachable": error is None,
+                "http_status": http_status,
+                "error": error,
+                "latency_ms": latency_ms,
+                "circuit": "open" if breaker["open_until"] > time.monotonic() else "closed",
+                "consecutive_failures": breaker["failures"],
+                "skipped": False,
+            }
+            breaker["last"] = result
+        return dict(result)
+
+    def reset(self) -> None:
+        with self._lock:
+            for idle in self._idle.values():
+                for conn in idle:
+                    conn.close()
+            self._idle.clear()
+            self._breakers.clear()
+
+
+http_probes = HttpProbeEngine()
+
+
 def file_timestamp(path: Path | None) -> str | None:
     if not path or not path.exists():
         return None
@@ -384,42 +1338,274 @@ def newest_timestamp(paths: list[Path]) -> str | None:
     return file_timestamp(newest)
 
 
+class DirectoryCountIndex:
+    """Recursive file counts cached per directory and keyed on each directory's mtime.
+
+    A directory's mtime only moves when its own entries change, so unchanged
+    directories reuse their cached direct file count and child list; only changed
+    directories are re-listed. Refreshing a tree costs one ``stat`` per directory
+    instead of one per file. The index is persisted so restarts start warm.
+    """
+
+    # Directories modified this recently are re-listed next time; a later change in
+    # the same mtime tick would otherwise go unnoticed.
+    RACY_WINDOW_NS = 2_000_000_000
+
+    def __init__(self, path: Path | None = LANE_INDEX_PATH) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._dirs: dict[str, dict[str, Any]] = {}
+        self._loaded = False
+        self._dirty = False
+        self.stats = {"relisted": 0, "reused": 0}
+
+    def _load(self) -> None:
+        self._loaded = True
+        if self.path is None or not self.path.exists():
+            return
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as exc:
+            logger.warning("Ignoring unreadable lane index %s: %s", self.path, exc)
+            return
+        if isinstance(payload, dict) and isinstance(payload.get("dirs"), dict):
+            self._dirs = payload["dirs"]
+
+    def save(self) -> None:
+        with self._lock:
+            if self.path is None or not self._dirty:
+                return
+            payload = json.dumps({"version": 1, "dirs": self._dirs}, separators=(",", ":"))
+            self._dirty = False
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            tmp.write_text(payload, encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError as exc:
+            logger.warning("Failed to persist lane index %s: %s", self.path, exc)
+
+    def _entry(self, directory: str) -> dict[str, Any] | None:
+        try:
+            mtime_ns = os.stat(directory).st_mtime_ns
+        except OSError:
+            return None
+        entry = self._dirs.get(directory)
+        if entry is not None and entry["mtime_ns"] == mtime_ns:
+            self.stats["reused"] += 1
+            return entry
+        files = 0
+        children: list[str] = []
+        try:
+            with os.scandir(directory) as listing:
+                for item in listing:
+                    try:
+                        if item.is_dir(follow_symlinks=False):
+                            children.append(item.name)
+                        elif item.is_file():
+                            files += 1
+                    except OSError:
+                        continue
+        except OSError:
+            return None
+        if time.time_ns() - mtime_ns < self.RACY_WINDOW_NS:
+            mtime_ns = -1
+        entry = {"mtime_ns": mtime_ns, "files": files, "dirs": sorted(children)}
+        self._dirs[directory] = entry
+        self._dirty = True
+        self.stats["relisted"] += 1
+        return entry
+
+    def count(self, path: Path) -> int:
+        root = os.path.abspath(path)
+        with self._lock:
+            if not self._loaded:
+                self._load()
+            total = 0
+            seen: set[str] = set()
+            stack = [root]
+            while stack:
+                directory = stack.pop()
+                entry = self._entry(directory)
+                if entry is None:
+                    continue
+                seen.add(directory)
+                total += entry["files"]
+                stack.extend(os.path.join(directory, name) for name in entry["dirs"])
+            prefix = root + os.sep
+            for stale in [key for key in self._dirs if (key == root or key.startswith(prefix)) and key not in seen]:
+                del self._dirs[stale]
+                self._dirty = True
+            return total
+
+
+lane_index = DirectoryCountIndex()
+
+
 def count_files(path: Path) -> int:
-    if not path.exists():
+    if not path.is_dir():
         return 0
-    return sum(1 for item in path.rglob("*") if item.is_file())
+    return lane_index.count(path)
+
+
+def _mtime_ns(path: Path) -> int | None:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+class GitMetadataReader:
+    """Branch and HEAD commit read straight from ``.git`` instead of forking ``git``.
+
+    Results are cached per repository and keyed on the mtimes of ``HEAD``, the ref it
+    points to, and ``packed-refs``, so an unchanged repo costs three ``stat`` calls.
+    The commit subject comes from the loose object when there is one; packed commits
+    fall back to a single ``git log`` call, made only when HEAD moves.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._locations: dict[str, tuple[Path, Path] | None] = {}
+        self._cache: dict[str, dict[str, Any]] = {}
+        self.stats = {"hits": 0, "misses": 0, "subprocess": 0}
+
+    @staticmethod
+    def _find_git_dirs(path: Path) -> tuple[Path, Path] | None:
+        for candidate in (path, *path.parents):
+            dotgit = candidate / ".git"
+            if dotgit.is_dir():
+                git_dir = dotgit
+            elif dotgit.is_file():
+                try:
+                    pointer = dotgit.read_text(encoding="utf-8").strip()
+                except OSError:
+                    return None
+                if not pointer.startswith("gitdir:"):
+                    return None
+                git_dir = (candidate / pointer[len("gitdir:"):].strip()).resolve()
+            else:
+                continue
+            common_dir = git_dir
+            commondir_file = git_dir / "commondir"
+            if commondir_file.is_file():
+                with suppress(OSError):
+                    common_dir = (git_dir / commondir_file.read_text(encoding="utf-8").strip()).resolve()
+            return git_dir, common_dir
+        return None
+
+    def _locate(self, path: Path) -> tuple[Path, Path] | None:
+        key = str(path)
+        located = self._locations.get(key)
+        if located is None or not (located[0] / "HEAD").exists():
+            located = self._find_git_dirs(path)
+            self._locations[key] = located
+        return located
+
+    @staticmethod
+    def _packed_ref(common_dir: Path, ref: str) -> str | None:
+        try:
+            lines = (common_dir / "packed-refs").read_text(encoding="utf-8").splitlines()
+        except OSError:
+            return None
+        for line in lines:
+            if line.startswith(("#", "^")):
+                continue
+            sha, _, name = line.partition(" ")
+            if name.strip() == ref:
+                return sha.strip()
+        return None
+
+    @staticmethod
+    def _loose_subject(common_dir: Path, sha: str) -> str | None:
+        try:
+            raw = zlib.decompress((common_dir / "objects" / sha[:2] / sha[2:]).read_bytes())
+        except (OSError, zlib.error):
+            return None
+        header, _, body = raw.partition(b"\0")
+        if not header.startswith(b"commit "):
+            return None
+        _, _, message = body.partition(b"\n\n")
+        paragraph = message.decode("utf-8", errors="replace").strip().split("\n\n", 1)[0]
+        return " ".join(line.strip() for line in paragraph.splitlines())
+
+    def _subprocess_commit(self, path: Path) -> str | None:
+        self.stats["subprocess"] += 1
+        count_spawn("git")
+        try:
+            result = subprocess.run(
+                ["git", "-C", str(path), "log", "-1", "--pretty=%h %s"],
+                capture_output=True,
+                text=True,
+                check=False,
+            )
+        except FileNotFoundError:
+            return None
+        return result.stdout.strip() or None
+
+    def read(self, path: Path) -> dict[str, str | None] | None:
+        """Return ``{"branch", "sha", "commit"}`` for the repository containing ``path``."""
+        with self._lock:
+            located = self._locate(path)
+            if located is None:
+                return None
+            git_dir, common_dir = located
+            head_mtime = _mtime_ns(git_dir / "HEAD")
+            cached = self._cache.get(str(path))
+            if cached is not None and cached["head_mtime"] == head_mtime:
+                head = cached["head"]
+            else:
+                try:
+                    head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+                except OSError:
+                    return None
+            ref = head[len("ref:"):].strip() if head.startswith("ref:") else None
+            key = (
+                head_mtime,
+                _mtime_ns(common_dir / ref) if ref else None,
+                _mtime_ns(common_dir / "packed-refs"),
+            )
+            if cached is not None and cached["key"] == key:
+                self.stats["hits"] += 1
+                return cached["info"]
+            self.stats["misses"] += 1
+
+            if ref is None:
+                sha: str | None = head
+                branch = "HEAD"
+            else:
+                try:
+                    sha = (common_dir / ref).read_text(encoding="utf-8").strip()
+                except OSError:
+                    sha = self._packed_ref(common_dir, ref)
+                branch = ref[len("refs/heads/"):] if ref.startswith("refs/heads/") else ref
+            if cached is not None and sha and cached["info"]["sha"] == sha:
+                commit = cached["info"]["commit"]
+            elif sha:
+                subject = self._loose_subject(common_dir, sha)
+                commit = f"{sha[:7]} {subject}" if subject is not None else self._subprocess_commit(path)
+            else:
+                commit = None
+            info = {"branch": branch, "sha": sha, "commit": commit}
+            self._cache[str(path)] = {"head_mtime": head_mtime, "head": head, "key": key, "info": info}
+            return info
+
+
+git_metadata = GitMetadataReader()
 
 
 def git_branch(path: Path) -> str | None:
     if not path.exists():
         return None
-    try:
-        result = subprocess.run(
-            ["git", "-C", str(path), "rev-parse", "--abbrev-ref", "HEAD"],
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-    except FileNotFoundError:
-        return None
-    branch = result.stdout.strip()
-    return branch or None
+    info = git_metadata.read(path)
+    return info["branch"] if info else None
 
 
 def git_recent_commit(path: Path) -> str | None:
     if not path.exists():
         return None
-    try:
-        result = subprocess.run(
-            ["git", "-C", str(path), "log", "-1", "--pretty=%h %s"],
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-    except FileNotFoundError:
-        return None
-    commit = result.stdout.strip()
-    return commit or None
+    info = git_metadata.read(path)
+    return info["commit"] if info else None
 
 
 def parse_topic_ownership(markdown: str) -> list[dict[str, Any]]:
@@ -461,14 +1647,11 @@ def profile_summary(profile_name: str) -> dict[str, Any]:
 
 
 def load_factory_settings(path: Path = FACTORY_SETTINGS_PATH) -> dict[str, Any]:
-    if not path.exists():
-        return {}
-    try:
-        loaded = json.loads(path.read_text())
-        return loaded if isinstance(loaded, dict) else {}
-    except Exception as exc:  # pragma: no cover - defensive
-        logger.warning("Failed to parse Factory settings %s: %s", path, exc)
-        return {}
+    return parsed_files.get(path, _json_mapping, {}, label="Factory settings")
+
+
+def load_topic_ownership(path: Path = WIKI_GROK_SYSTEM) -> list[dict[str, Any]]:
+    return parsed_files.get(path, parse_topic_ownership, [], label="Telegram canon")
 
 
 def summarize_factory_models(settings: dict[str, Any]) -> list[dict[str, Any]]:
@@ -529,24 +1712,49 @@ def make_probe(
     }
 
 
-def build_alerts(cards: dict[str, dict[str, Any]]) -> dict[str, Any]:
+def reage_probe(card: dict[str, Any]) -> dict[str, Any]:
+    """Recompute ``freshness_seconds`` (and the stale downgrade) for a card probed earlier."""
+    freshness = age_in_seconds(card.get("timestamp"))
+    if freshness is None:
+        return card
+    card = dict(card, freshness_seconds=freshness)
+    threshold = FRESHNESS_THRESHOLDS.get(card.get("name", ""))
+    if card.get("status") == "healthy" and threshold is not None and freshness > threshold:
+        card["status"] = "stale"
+        card["last_error"] = card.get("last_error") or f"{card['name']} evidence is older than {threshold}s"
+    return card
+
+
+def build_alerts(cards: dict[str, dict[str, Any]], flaps: dict[str, int] | None = None) -> dict[str, Any]:
+    """Summarise non-healthy cards; cards in ``flaps`` at or over the threshold alert even when healthy."""
     items: list[dict[str, Any]] = []
     severity_rank = {"healthy": 0, "stale": 1, "degraded": 2, "down": 3}
     highest = "healthy"
+    flaps = flaps or {}
     for key, card in cards.items():
         status = card.get("status", "down")
+        flap_count = flaps.get(key, 0)
+        flapping = flap_count >= HISTORY_FLAP_THRESHOLD
+        if status == "healthy" and flapping:
+            status = "degraded"
         if severity_rank.get(status, 3) > severity_rank[highest]:
             highest = status
         if status == "healthy":
             continue
-        items.append(
-            {
-                "card": key,
-                "status": status,
-                "message": card.get("last_error") or f"{key} is {status}",
-                "timestamp": card.get("timestamp"),
-            }
-        )
+        message = card.get("last_error") or f"{key} is {status}"
+        if flapping:
+            message = f"{key} changed status {flap_count} times in the last {HISTORY_FLAP_WINDOW / 60:g}m" + (
+                f"; {card['last_error']}" if card.get("last_error") else ""
+            )
+        item = {
+            "card": key,
+            "status": status,
+            "message": message,
+            "timestamp": card.get("timestamp"),
+        }
+        if flap_count:
+            item["flaps"] = flap_count
+        items.append(item)
     details = {
         "count": len(items),
         "items": items,
@@ -566,7 +1774,282 @@ def build_alerts(cards: dict[str, dict[str, Any]]) -> dict[str, Any]:
     )
 
 
+def register_probe(name: str, *, cost: str = "light", timeout: float = DEFAULT_PROBE_DEADLINE, freshness: int | None = None, description: str = "") -> Any:
+    """Declare a dashboard card probe.
+
+    Works on ``DashboardRuntime.probe_<name>`` methods and on plain zero-argument functions
+    alike. ``cost="heavy"`` probes run in the isolated process pool when
+    ``HERO_PROBE_ISOLATION`` is on. ``timeout`` becomes the card's deadline.
+    """
+    if cost not in PROBE_COST_CLASSES:
+        raise ValueError(f"Unknown probe cost class: {cost}")
+
+    def decorate(func: Any) -> Any:
+        PROBE_REGISTRY[name] = {"func": func, "cost": cost, "timeout": timeout, "description": description}
+        PROBE_DEADLINES[name] = env_float(f"HERO_PROBE_DEADLINE_{name.upper()}", timeout)
+        if freshness is not None:
+            FRESHNESS_THRESHOLDS.setdefault(name, freshness)
+        if name not in CARD_ORDER:
+            CARD_ORDER.insert(CARD_ORDER.index("alerts"), name)
+        return func
+
+    return decorate
+
+
+def run_isolated_probe(name: str, func: Any = None, processes: list[tuple[int, str]] | None = None) -> tuple[dict[str, Any], dict[Any, float]]:
+    """Pool-side entry point: run one probe and return its card plus the counter increments it caused.
+
+    ``processes`` is the parent's process table; when given, the worker answers
+    ``run_pgrep`` from it instead of walking ``/proc`` again for every call.
+    """
+    before = metrics.counter_values()
+    PROBE_CONTEXT.name = name
+    if processes is not None:
+        process_index.pin(processes)
+    try:
+        card = func() if func is not None else getattr(runtime, f"probe_{name}")()
+    finally:
+        PROBE_CONTEXT.name = None
+        if processes is not None:
+            process_index.unpin()
+    after = metrics.counter_values()
+    return card, {key: value - before.get(key, 0.0) for key, value in after.items() if value != before.get(key, 0.0)}
+
+
+def _isolated_worker(conn: Any) -> None:
+    while True:
+        try:
+            task = conn.recv()
+        except (EOFError, OSError):
+            return
+        if task is None:
+            return
+        try:
+            conn.send(("ok", task()))
+        except Exception as exc:
+            conn.send(("error", f"{type(exc).__name__}: {exc}"))
+
+
+class IsolatedProbePool:
+    """Reusable ``spawn`` worker processes for heavy probes.
+
+    Each call takes an idle worker and sends it a picklable callable. If the callable
+    overruns its timeout, that worker is killed and a fresh one takes its place on the
+    next call. A hung ``droid --version`` or a stuck NFS ``stat`` therefore costs one
+    process, never a dashboard thread.
+    """
+
+    def __init__(self, size: int = PROBE_ISOLATION_WORKERS) -> None:
+        self.size = size
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(size)
+        self._idle: list[tuple[Any, Any]] = []
+        self.stats = {"calls": 0, "spawned": 0, "killed": 0, "crashed": 0}
+
+    def _spawn(self) -> tuple[Any, Any]:
+        context = multiprocessing.get_context("spawn")
+        parent, child = context.Pipe()
+        process = context.Process(target=_isolated_worker, args=(child,), name="hero-probe-worker", daemon=True)
+        process.start()
+        child.close()
+        with self._lock:
+            self.stats["spawned"] += 1
+        return process, parent
+
+    @staticmethod
+    def _kill(worker: tuple[Any, Any]) -> None:
+        process, conn = worker
+        conn.close()
+        if process.is_alive():
+            process.kill()
+        process.join(1.0)
+
+    def call(self, func: Any, timeout: float) -> Any:
+        deadline = time.monotonic() + timeout
+        if not self._slots.acquire(timeout=timeout):
+            raise FutureTimeoutError(f"no isolated probe worker free within {timeout:g}s")
+        try:
+            with self._lock:
+                self.stats["calls"] += 1
+                worker = self._idle.pop() if self._idle else None
+            if worker is None or not worker[0].is_alive():
+                worker = self._spawn()
+            try:
+                worker[1].send(func)
+                finished = worker[1].poll(max(0.0, deadline - time.monotonic()))
+                if finished:
+                    outcome, value = worker[1].recv()
+            except (EOFError, OSError) as exc:
+                self._kill(worker)
+                with self._lock:
+                    self.stats["crashed"] += 1
+                raise RuntimeError(f"isolated probe worker died: {exc}") from exc
+            if not finished:
+                self._kill(worker)
+                with self._lock:
+                    self.stats["killed"] += 1
+                raise FutureTimeoutError(f"isolated probe exceeded {timeout:g}s; worker killed")
+            with self._lock:
+                self._idle.append(worker)
+            if outcome == "error":
+                raise RuntimeError(value)
+            return value
+        finally:
+            self._slots.release()
+
+    def warm(self) -> None:
+        """Start idle workers ahead of the first heavy probe so it does not pay the interpreter spawn."""
+        with self._lock:
+            missing = self.size - len(self._idle)
+        for _ in range(max(0, missing)):
+            worker = self._spawn()
+            with self._lock:
+                self._idle.append(worker)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for process, conn in idle:
+            with suppress(OSError):
+                conn.send(None)
+            process.join(1.0)
+            self._kill((process, conn))
+
+
+isolated_pool = IsolatedProbePool()
+
+
 class DashboardRuntime:
+    def __init__(self, history: HistoryStore | None = None, events: LabyrinthEventStore | None = None) -> None:
+        self.history = history
+        self.events = events
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self._inflight: dict[str, Future] = {}
+        self._last_cards: dict[str, dict[str, Any]] = {}
+        self.scheduler: ProbeScheduler | None = None
+
+    def probe_methods(self) -> OrderedDict[str, Any]:
+        """Registered probes in card order; ``probe_<name>`` attributes (and instance overrides) win."""
+        return OrderedDict((name, getattr(self, f"probe_{name}", None) or spec["func"]) for name, spec in PROBE_REGISTRY.items())
+
+    def _isolate(self, name: str) -> Any | None:
+        """Pool-backed runner for a heavy probe, or None when it should run in a probe thread."""
+        spec = PROBE_REGISTRY[name]
+        if not PROBE_ISOLATION or spec["cost"] != "heavy" or f"probe_{name}" in vars(self):
+            return None
+        func = None if hasattr(type(self), f"probe_{name}") else spec["func"]
+        deadline = PROBE_DEADLINES.get(name, DEFAULT_PROBE_DEADLINE)
+
+        def run() -> dict[str, Any]:
+            request = partial(run_isolated_probe, name, func, processes=process_index.entries())
+            card, deltas = isolated_pool.call(request, deadline)
+            metrics.merge_counters(deltas)
+            return card
+
+        return run
+
+    def _remember(self, name: str, future: Future) -> None:
+        if future.cancelled() or future.exception() is not None:
+            return
+        with self._lock:
+            self._last_cards[name] = future.result()
+
+    def _submit(self, name: str, probe: Any) -> Future:
+        """Start a probe unless the previous run is still in flight, in which case wait on that one."""
+        with self._lock:
+            future = self._inflight.get(name)
+            if future is not None and not future.done():
+                return future
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=len(CARD_ORDER), thread_name_prefix="hero-probe")
+            future = self._executor.submit(probe)
+            self._inflight[name] = future
+        future.add_done_callback(lambda done: self._remember(name, done))
+        return future
+
+    def timeout_card(self, name: str, deadline: float) -> dict[str, Any]:
+        message = f"{name} probe missed its {deadline:g}s deadline"
+        with self._lock:
+            last = self._last_cards.get(name)
+        if last is None:
+            return make_probe(
+                name=name,
+                status="down",
+                source="probe-timeout",
+                details={"probe_timeout": True, "probe_deadline_seconds": deadline},
+                last_error=f"{message}; no earlier evidence",
+            )
+        details = dict(last.get("details") or {})
+        details.update({"probe_timeout": True, "probe_deadline_seconds": deadline})
+        details.setdefault("evidence_timestamp", last.get("timestamp"))
+        # A hung probe never reads better than its last evidence: down stays down.
+        status = max("stale", last.get("status") or "stale", key=status_weight)
+        return make_probe(
+            name=name,
+            status=status,
+            source=last.get("source") or "probe-timeout",
+            details=details,
+            timestamp=last.get("timestamp"),
+            last_error=f"{message}; showing last known evidence",
+        )
+
+    @staticmethod
+    def _instrumented(name: str, probe: Any) -> Any:
+        """Wrap ``probe`` so its duration lands in metrics and in the card's ``duration_ms``."""
+
+        def run() -> dict[str, Any]:
+            PROBE_CONTEXT.name = name
+            started = time.monotonic()
+            try:
+                card = dict(probe())
+            except FutureTimeoutError:
+                raise
+            except Exception:
+                metrics.inc("hero_probe_failures_total", probe=name)
+                raise
+            finally:
+                elapsed = time.monotonic() - started
+                PROBE_CONTEXT.name = None
+                metrics.observe("hero_probe_duration_seconds", elapsed, probe=name)
+            card["duration_ms"] = round(elapsed * 1000, 1)
+            return card
+
+        return run
+
+    def run_probes(self, names: list[str] | None = None) -> OrderedDict[str, dict[str, Any]]:
+        """Run every probe (or just ``names``) concurrently, each bounded by its own deadline."""
+        started = time.monotonic()
+        futures = OrderedDict(
+            (name, self._submit(name, self._instrumented(name, self._isolate(name) or probe)))
+            for name, probe in self.probe_methods().items()
+            if names is None or name in names
+        )
+        cards: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        for name, future in futures.items():
+            deadline = PROBE_DEADLINES.get(name, DEFAULT_PROBE_DEADLINE)
+            remaining = max(0.0, started + deadline - time.monotonic())
+            try:
+                cards[name] = future.result(timeout=remaining)
+            except FutureTimeoutError:
+                logger.warning("Probe %s exceeded %ss deadline", name, deadline)
+                metrics.inc("hero_probe_timeouts_total", probe=name)
+                cards[name] = self.timeout_card(name, deadline)
+                cards[name]["duration_ms"] = round(deadline * 1000, 1)
+            except Exception as exc:
+                logger.exception("Probe %s crashed", name)
+                cards[name] = make_probe(
+                    name=name,
+                    status="down",
+                    source="probe-executor",
+                    details={},
+                    last_error=f"{name} probe failed: {type(exc).__name__}: {exc}",
+                )
+        if self.history is not None:
+            self.history.record(cards)
+        return cards
+
+    @register_probe("hermes", cost="light", timeout=3.0)
     def probe_hermes(self) -> dict[str, Any]:
         process_lines = run_pgrep("hermes")
         gateway_lines = [line for line in process_lines if "gateway run" in line]
@@ -620,6 +2103,7 @@ class DashboardRuntime:
             last_error=last_error,
         )
 
+    @register_probe("droids", cost="heavy", timeout=5.0)
     def probe_droids(self) -> dict[str, Any]:
         droid_binary = Path(os.getenv("HERO_DROID_BIN", "")) if os.getenv("HERO_DROID_BIN") else Path.home() / ".local" / "bin" / "droid"
         resolved_binary = droid_binary if droid_binary.exists() else Path(shutil.which("droid") or droid_binary)
@@ -674,11 +2158,11 @@ class DashboardRuntime:
             last_error=last_error,
         )
 
+    @register_probe("telegram", cost="light", timeout=3.0)
     def probe_telegram(self) -> dict[str, Any]:
         profiles = [profile_summary(name) for name in ("tg-alpha", "tg-beta", "chaddin")]
         active_profiles = [item for item in profiles if item["enabled"]]
-        markdown = WIKI_GROK_SYSTEM.read_text() if WIKI_GROK_SYSTEM.exists() else ""
-        topics = parse_topic_ownership(markdown)
+        topics = load_topic_ownership(WIKI_GROK_SYSTEM)
         gateway_running = bool([line for line in run_pgrep("hermes") if "gateway run" in line])
 
         if active_profiles and gateway_running:
@@ -714,6 +2198,7 @@ class DashboardRuntime:
             last_error=last_error,
         )
 
+    @register_probe("gbrain", cost="light", timeout=6.0)
     def probe_gbrain(self) -> dict[str, Any]:
         config = try_load_yaml(MAIN_HERMES_CONFIG)
         gbrain = config.get("mcp_servers", {}).get("gbrain", {})
@@ -725,9 +2210,10 @@ class DashboardRuntime:
         http_status: int | None = None
         last_error: str | None = None
 
+        latency_ms: float | None = None
+        circuit: str | None = None
         if url:
             # Validate scheme
-            from urllib.parse import urlparse
             parsed = urlparse(url)
             if parsed.scheme not in ("http", "https"):
                 last_error = f"GBrain URL has invalid scheme: {parsed.scheme}"
@@ -737,18 +2223,15 @@ class DashboardRuntime:
                 # Filter headers: only allow safe headers
                 allowed_headers = {"User-Agent", "Accept", "Content-Type"}
                 filtered_headers = {k: v for k, v in headers.items() if k in allowed_headers}
-                request = Request(safe_url, headers=filtered_headers, method="GET")
-                try:
-                    with urlopen(request, timeout=4) as response:
-                        endpoint_reachable = True
-                        http_status = getattr(response, "status", None)
-                except HTTPError as exc:
-                    endpoint_reachable = True
-                    http_status = exc.code
-                except URLError as exc:
-                    last_error = f"GBrain endpoint unreachable: {exc.reason}"
-                except Exception as exc:  # pragma: no cover - defensive
-                    last_error = f"GBrain probe failed: {exc}"
+                result = http_probes.probe(safe_url, headers=filtered_headers, timeout=4)
+                endpoint_reachable = result["reachable"]
+                http_status = result["http_status"]
+                latency_ms = result["latency_ms"]
+                circuit = result["circuit"]
+                if result["error"]:
+                    last_error = f"GBrain endpoint unreachable: {result['error']}"
+                    if result["skipped"]:
+                        last_error += f" (circuit open, retry in {result['retry_in_seconds']}s)"
 
         endpoint_ok = endpoint_reachable and (http_status is None or 200 <= http_status < 500)
 
@@ -768,6 +2251,8 @@ class DashboardRuntime:
             "endpoint": sanitized_url,
             "endpoint_reachable": endpoint_reachable,
             "http_status": http_status,
+            "latency_ms": latency_ms,
+            "circuit": circuit,
             "brain_repo_exists": repo_exists,
             "brain_branch": git_branch(BRAIN_ROOT),
             "brain_recent_commit": git_recent_commit(BRAIN_ROOT),
@@ -781,6 +2266,7 @@ class DashboardRuntime:
             last_error=last_error,
         )
 
+    @register_probe("workflows", cost="heavy", timeout=8.0)
     def probe_workflows(self) -> dict[str, Any]:
         key_paths = OrderedDict(
             {
@@ -809,6 +2295,7 @@ class DashboardRuntime:
                     "timestamp": file_timestamp(path),
                 }
             )
+        lane_index.save()
 
         if existing_count == len(key_paths):
             status = "healthy"
@@ -835,14 +2322,23 @@ class DashboardRuntime:
             last_error=last_error,
         )
 
+    def record_crossings(self, cards: dict[str, dict[str, Any]]) -> dict[str, dict[str, Any]]:
+        """Add the alerts card to ``cards`` and log every status that changed since the last call."""
+        flaps = self.history.flap_counts() if self.history is not None else None
+        cards["alerts"] = build_alerts(cards, flaps)
+        if self.events is not None:
+            self.events.record_probes(cards)
+        return cards
+
     def snapshot(self) -> dict[str, Any]:
-        cards: OrderedDict[str, dict[str, Any]] = OrderedDict()
-        cards["hermes"] = self.probe_hermes()
-        cards["droids"] = self.probe_droids()
-        cards["telegram"] = self.probe_telegram()
-        cards["gbrain"] = self.probe_gbrain()
-        cards["workflows"] = self.probe_workflows()
-        cards["alerts"] = build_alerts(cards)
+        scheduler = self.scheduler
+        if scheduler is not None:
+            cards = scheduler.assemble()
+        else:
+            # One process-table scan per snapshot so every probe sees the same moment.
+            process_index.refresh(force=True)
+            cards = self.run_probes()
+        self.record_crossings(cards)
         return {
             "overview": {
                 "timestamp": iso_now(),
@@ -855,69 +2351,746 @@ class DashboardRuntime:
         }
 
 
-def status_weight(status: str) -> int:
-    return {"healthy": 0, "succeeded": 0, "stale": 1, "degraded": 2, "failed": 2, "down": 3}.get(status, 2)
+class _Flight:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.error: BaseException | None = None
+
+
+class SnapshotCache:
+    """TTL cache in front of ``DashboardRuntime.snapshot`` with single-flight refreshes.
+
+    Fresh entries are served directly. Entries older than ``ttl`` but younger than
+    ``ttl + stale_ttl`` are served as-is while one background refresh runs. Anything
+    older blocks, but concurrent callers all wait on the same computation.
+    """
+
+    def __init__(self, compute: Any, ttl: float = SNAPSHOT_TTL, stale_ttl: float = SNAPSHOT_STALE_TTL) -> None:
+        self._compute = compute
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self._lock = threading.Lock()
+        self._value: dict[str, Any] | None = None
+        self._stored_at = 0.0
+        self._flight: _Flight | None = None
+        # ``version`` moves only when the content signature does; ``generation`` moves for
+        # every newly stored snapshot, so bodies carrying fresh timestamps are re-encoded
+        # while validators derived from ``signature`` stay put.
+        self.version = 0
+        self.generation = 0
+        self.signature = ""
+        self.stats = {"hits": 0, "stale_hits": 0, "misses": 0, "computations": 0, "joined": 0}
+
+    def _join_or_start(self) -> tuple[_Flight, bool]:
+        if self._flight is not None:
+            self.stats["joined"] += 1
+            return self._flight, False
+        self._flight = _Flight()
+        return self._flight, True
+
+    def _refresh(self, flight: _Flight) -> None:
+        try:
+            value = self._compute()
+        except BaseException as exc:
+            flight.error = exc
+        else:
+            signature = snapshot_signature(value)
+            with self._lock:
+                # A compute that hands back the very same object (a follower re-reading an
+                # unchanged shared snapshot) is not a new generation.
+                if value is not self._value:
+                    self.generation += 1
+                if signature != self.signature:
+                    self.version += 1
+                    self.signature = signature
+                self._value = value
+                self._stored_at = time.monotonic()
+        finally:
+            with self._lock:
+                self.stats["computations"] += 1
+                self._flight = None
+            flight.done.set()
+
+    def get(self, force: bool = False) -> dict[str, Any]:
+        return self.get_versioned(force)[1]
+
+    def get_versioned(self, force: bool = False) -> tuple[int, dict[str, Any]]:
+        """Return ``(version, snapshot)`` read together, so callers can key work on the version."""
+        version, _, _, value = self.get_entry(force)
+        return version, value
+
+    def get_tagged(self, force: bool = False) -> tuple[str, int, dict[str, Any]]:
+        """Return ``(signature, generation, snapshot)``: a worker-independent validator plus a body key."""
+        _, generation, signature, value = self.get_entry(force)
+        return signature, generation, value
+
+    def _entry(self) -> tuple[int, int, str, dict[str, Any]]:
+        return self.version, self.generation, self.signature, self._value
+
+    def get_entry(self, force: bool = False) -> tuple[int, int, str, dict[str, Any]]:
+        """``(version, generation, signature, snapshot)`` read together under the lock."""
+        with self._lock:
+            value = self._value
+            age = time.monotonic() - self._stored_at
+            if value is not None and not force and age < self.ttl:
+                self.stats["hits"] += 1
+                return self._entry()
+            if value is not None and not force and age < self.ttl + self.stale_ttl:
+                self.stats["stale_hits"] += 1
+                flight, owner = self._join_or_start()
+                if owner:
+                    threading.Thread(target=self._refresh, args=(flight,), name="hero-snapshot-revalidate", daemon=True).start()
+                return self._entry()
+            self.stats["misses"] += 1
+            flight, owner = self._join_or_start()
+        if owner:
+            self._refresh(flight)
+        else:
+            flight.done.wait()
+        if flight.error is not None:
+            raise flight.error
+        with self._lock:
+            if self._value is None:  # pragma: no cover - refresh either stored a value or raised
+                raise RuntimeError("snapshot refresh produced no value")
+            return self._entry()
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._value = None
+            self._stored_at = 0.0
+
+
+class SharedSnapshotStore:
+    """Hands snapshots from one elected prober process to every other worker.
+
+    Election is an exclusive ``fcntl`` lock on ``lock_path``, held for the life of the
+    prober, so it passes to another worker automatically if the prober dies. The prober
+    writes each snapshot into a single-row SQLite table in WAL mode. Followers read it
+    back and only re-parse the body when the version changes.
+    """
+
+    def __init__(self, path: Path = SHARED_SNAPSHOT_PATH, lock_path: Path = SHARED_PROBER_LOCK, max_age: float = SHARED_SNAPSHOT_MAX_AGE) -> None:
+        self.path = path
+        self.lock_path = lock_path
+        self.max_age = max_age
+        self.role: str | None = None
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._lock_handle: Any = None
+        self._cached: tuple[int, dict[str, Any]] | None = None
+        self._published = 0
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), timeout=5.0, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS snapshot (id INTEGER PRIMARY KEY CHECK (id = 1), version INTEGER NOT NULL, written_at REAL NOT NULL, body BLOB NOT NULL)"
+            )
+            self._conn = conn
+        return self._conn
 
+    def try_elect(self) -> bool:
+        """Take the prober lock if nobody holds it; returns whether this process is the prober."""
+        if self.role == "prober":
+            return True
+        if fcntl is None:
+            # No advisory locks here; every worker probes rather than none.
+            self.role = "prober"
+            return True
+        self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+        handle = self.lock_path.open("a+")
+        try:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            handle.close()
+            self.role = "follower"
+            return False
+        handle.seek(0)
+        handle.truncate()
+        handle.write(f"{os.getpid()}\n")
+        handle.flush()
+        self._lock_handle = handle
+        self.role = "prober"
+        return True
+
+    def publish(self, snapshot: dict[str, Any]) -> None:
+        with self._lock:
+            self._published += 1
+            version = int(time.time() * 1000) * 1000 + self._published % 1000
+            try:
+                self._connection().execute(
+                    "INSERT INTO snapshot (id, version, written_at, body) VALUES (1, ?, ?, ?) "
+                    "ON CONFLICT(id) DO UPDATE SET version = excluded.version, written_at = excluded.written_at, body = excluded.body",
+                    (version, time.time(), encode_json(snapshot)),
+                )
+            except sqlite3.Error as exc:
+                logger.warning("Failed to publish shared snapshot %s: %s", self.path, exc)
+
+    def read(self) -> tuple[dict[str, Any] | None, float | None]:
+        """Return ``(snapshot, age_seconds)``; the body is only parsed when its version moved."""
+        with self._lock:
+            try:
+                conn = self._connection()
+                row = conn.execute("SELECT version, written_at FROM snapshot WHERE id = 1").fetchone()
+                if row is None:
+                    return None, None
+                version, written_at = row
+                if self._cached is None or self._cached[0] != version:
+                    body = conn.execute("SELECT body FROM snapshot WHERE id = 1 AND version = ?", (version,)).fetchone()
+                    if body is None:
+                        return (self._cached[1] if self._cached else None), None
+                    self._cached = (version, decode_json(body[0]))
+            except (sqlite3.Error, ValueError) as exc:
+                logger.warning("Failed to read shared snapshot %s: %s", self.path, exc)
+                return (self._cached[1] if self._cached else None), None
+            return self._cached[1], max(0.0, time.time() - written_at)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+            if self._lock_handle is not None:
+                self._lock_handle.close()
+                self._lock_handle = None
+            self.role = None
+
+
+class HistoryStore:
+    """Per-card ring buffers of probe results, mirrored to an append-only binary log.
+
+    Each card keeps at most ``capacity`` points in parallel ``array`` columns, so memory is
+    fixed no matter how long the dashboard runs. Every point is also appended to ``path``
+    as one ``HISTORY_RECORD``. The log is rewritten from the rings once it holds twice what
+    they can, and it is replayed on first use so history survives restarts. Readers re-sync
+    from the log, so workers that do not probe still see what the prober recorded.
+    """
+
+    def __init__(self, path: Path | None = HISTORY_PATH, capacity: int = HISTORY_POINTS, cards: list[str] | None = None) -> None:
+        self.path = path
+        self.capacity = max(1, capacity)
+        self.cards = list(cards or [name for name in CARD_ORDER if name != "alerts"])
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._log_records = 0
+        self._inode = 0
+        self._offset = 0
+        self._rings = {
+            name: {
+                "t": array("d", bytes(8 * self.capacity)),
+                "status": array("b", bytes(self.capacity)),
+                "freshness": array("f", bytes(4 * self.capacity)),
+                "duration": array("f", bytes(4 * self.capacity)),
+                "next": 0,
+                "size": 0,
+            }
+            for name in self.cards
+        }
 
-def discover_skill_inventory(limit: int = 60) -> list[dict[str, Any]]:
-    now = time.monotonic()
-    if SKILL_CACHE["timestamp"] and now - SKILL_CACHE["timestamp"] < 300:
-        return SKILL_CACHE["items"][:limit]
-
-    inventory: list[dict[str, Any]] = []
-    roots = [Path.home() / ".agents" / "skills", Path.home() / ".codex" / "skills"]
-    for root in roots:
-        if not root.exists():
-            continue
-        queue: list[tuple[Path, int]] = [(root, 0)]
-        while queue and len(inventory) < limit:
-            directory, depth = queue.pop(0)
-            skill_file = directory / "SKILL.md"
-            if not skill_file.exists():
-                if depth >= 4:
+    def _push(self, name: str, t: float, status: int, freshness: float, duration: float) -> None:
+        ring = self._rings[name]
+        slot = ring["next"]
+        ring["t"][slot] = t
+        ring["status"][slot] = status
+        ring["freshness"][slot] = freshness
+        ring["duration"][slot] = duration
+        ring["next"] = (slot + 1) % self.capacity
+        ring["size"] = min(ring["size"] + 1, self.capacity)
+
+    def _sync(self) -> None:
+        """Replay the log on first use, then pick up records another worker appended since."""
+        if self.path is None:
+            self._loaded = True
+            return
+        size = HISTORY_RECORD.size
+        try:
+            with self.path.open("rb") as handle:
+                stat = os.fstat(handle.fileno())
+                if self._loaded and stat.st_ino == self._inode and stat.st_size == self._offset:
+                    return
+                total = stat.st_size // size
+                if not self._loaded or stat.st_ino != self._inode or stat.st_size < self._offset:
+                    # First load, or the log was compacted under us: rebuild the rings from its tail.
+                    for ring in self._rings.values():
+                        ring["next"] = ring["size"] = 0
+                    first = total - min(total, self.capacity * len(self.cards))
+                else:
+                    first = self._offset // size
+                handle.seek(first * size)
+                data = handle.read((total - first) * size)
+        except FileNotFoundError:
+            self._loaded = True
+            return
+        except OSError as exc:
+            logger.warning("Ignoring unreadable history log %s: %s", self.path, exc)
+            self._loaded = True
+            return
+        self._loaded = True
+        self._inode = stat.st_ino
+        self._offset = first * size + len(data)
+        self._log_records = total
+        for t, card_index, status, freshness, duration in HISTORY_RECORD.iter_unpack(data):
+            if card_index < len(self.cards):
+                self._push(self.cards[card_index], t, status, freshness, duration)
+
+    def _points(self, name: str) -> list[tuple[float, int, float, float]]:
+        ring = self._rings[name]
+        start = (ring["next"] - ring["size"]) % self.capacity
+        slots = [(start + offset) % self.capacity for offset in range(ring["size"])]
+        return [(ring["t"][i], ring["status"][i], ring["freshness"][i], ring["duration"][i]) for i in slots]
+
+    def _compact(self) -> None:
+        records = []
+        for card_index, name in enumerate(self.cards):
+            records.extend((t, card_index, status, freshness, duration) for t, status, freshness, duration in self._points(name))
+        records.sort(key=lambda record: record[0])
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        tmp.write_bytes(b"".join(HISTORY_RECORD.pack(*record) for record in records))
+        os.replace(tmp, self.path)
+        self._log_records = len(records)
+        self._inode = self.path.stat().st_ino
+        self._offset = len(records) * HISTORY_RECORD.size
+
+    def record(self, cards: dict[str, dict[str, Any]], now: float | None = None) -> None:
+        now = time.time() if now is None else now
+        rows = []
+        with self._lock:
+            self._sync()
+            for name, card in cards.items():
+                if name not in self._rings:
                     continue
-                try:
-                    children = sorted(
-                        child
-                        for child in directory.iterdir()
-                        if child.is_dir() and child.name not in {".git", "__pycache__", "node_modules", ".venv", "cache"}
-                    )
-                except OSError:
-                    children = []
-                queue.extend((child, depth + 1) for child in children)
-                continue
+                status = card.get("status", "down")
+                code = HISTORY_STATUSES.index(status) if status in HISTORY_STATUSES else len(HISTORY_STATUSES) - 1
+                freshness = card.get("freshness_seconds")
+                duration = card.get("duration_ms")
+                row = (now, self.cards.index(name), code, -1.0 if freshness is None else float(freshness), -1.0 if duration is None else float(duration))
+                self._push(name, row[0], row[2], row[3], row[4])
+                rows.append(row)
+            if self.path is None or not rows:
+                return
             try:
-                rel = skill_file.relative_to(root).parent.as_posix()
-                text = skill_file.read_text(encoding="utf-8", errors="replace")[:900]
-            except OSError:
-                continue
-            name_match = re.search(r"^name:\s*(.+)$", text, flags=re.MULTILINE)
-            desc_match = re.search(r"^description:\s*(.+)$", text, flags=re.MULTILINE)
-            description = desc_match.group(1).strip() if desc_match else "local skill"
-            if description == "|":
-                description = "local skill"
-            inventory.append(
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with self.path.open("ab") as handle:
+                    handle.write(b"".join(HISTORY_RECORD.pack(*row) for row in rows))
+                    self._inode = os.fstat(handle.fileno()).st_ino
+                    self._offset = handle.tell()
+                self._log_records += len(rows)
+                if self._log_records > 2 * self.capacity * len(self.cards):
+                    self._compact()
+            except OSError as exc:
+                logger.warning("Failed to append history log %s: %s", self.path, exc)
+
+    def flap_counts(self, window: float = HISTORY_FLAP_WINDOW, now: float | None = None) -> dict[str, int]:
+        """Status transitions per card within the last ``window`` seconds."""
+        cutoff = (time.time() if now is None else now) - window
+        counts: dict[str, int] = {}
+        with self._lock:
+            self._sync()
+            for name in self.cards:
+                statuses = [status for t, status, _, _ in self._points(name) if t >= cutoff]
+                counts[name] = sum(1 for before, after in zip(statuses, statuses[1:]) if before != after)
+        return counts
+
+    def series(self, name: str, since: float | None = None, points: int = 120) -> list[dict[str, Any]]:
+        """Points for ``name`` since ``since``, downsampled to at most ``points`` time buckets.
+
+        A bucket reports its worst status, mean freshness and slowest probe duration.
+        """
+        with self._lock:
+            self._sync()
+            raw = [point for point in self._points(name) if since is None or point[0] >= since]
+        if not raw:
+            return []
+        points = max(1, points)
+        start, end = raw[0][0], raw[-1][0]
+        width = (end - start) / points if len(raw) > points and end > start else 0.0
+        buckets: list[list[tuple[float, int, float, float]]] = []
+        last_index = -1
+        for position, point in enumerate(raw):
+            index = min(points - 1, int((point[0] - start) / width)) if width else position
+            if index == last_index:
+                buckets[-1].append(point)
+            else:
+                buckets.append([point])
+                last_index = index
+        series = []
+        for bucket in buckets:
+            freshness = [point[2] for point in bucket if point[2] >= 0]
+            durations = [point[3] for point in bucket if point[3] >= 0]
+            series.append(
                 {
-                    "name": (name_match.group(1).strip() if name_match else rel.split("/")[-1]),
-                    "namespace": root.parent.name,
-                    "path": str(skill_file),
-                    "description": description,
-                    "timestamp": file_timestamp(skill_file),
+                    "t": round(bucket[-1][0], 3),
+                    "status": HISTORY_STATUSES[max(point[1] for point in bucket)],
+                    "freshness_seconds": round(sum(freshness) / len(freshness), 1) if freshness else None,
+                    "duration_ms": round(max(durations), 1) if durations else None,
+                    "samples": len(bucket),
                 }
             )
-            if depth < 4:
-                try:
-                    children = sorted(
-                        child
-                        for child in directory.iterdir()
-                        if child.is_dir() and child.name not in {".git", "__pycache__", "node_modules", ".venv", "cache"}
-                    )
-                except OSError:
-                    children = []
-                queue.extend((child, depth + 1) for child in children)
-    SKILL_CACHE["timestamp"] = now
-    SKILL_CACHE["items"] = inventory
-    return inventory
+        return series
+
+
+history_store = HistoryStore()
+
+
+class ProbeScheduler:
+    """Background prober that refreshes each card on its own cadence.
+
+    A card's base interval is a quarter of its ``FRESHNESS_THRESHOLDS`` entry, clamped to
+    ``[min_interval, max_interval]``. The interval then shrinks towards the minimum as the
+    share of recent runs that changed the card grows. Every interval is jittered so probes
+    do not line up. A card that gets worse is re-probed on the next tick to confirm it.
+    """
+
+    def __init__(
+        self,
+        runtime: DashboardRuntime,
+        *,
+        min_interval: float = SCHEDULER_MIN_INTERVAL,
+        max_interval: float = SCHEDULER_MAX_INTERVAL,
+        jitter: float = SCHEDULER_JITTER,
+        on_update: Any = None,
+    ) -> None:
+        self.runtime = runtime
+        self.min_interval = min_interval
+        self.max_interval = max(min_interval, max_interval)
+        self.jitter = jitter
+        self.on_update = on_update
+        self._lock = threading.Lock()
+        self._state: dict[str, dict[str, Any]] = {}
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def base_interval(self, name: str) -> float:
+        threshold = FRESHNESS_THRESHOLDS.get(name, self.max_interval * 4)
+        return min(self.max_interval, max(self.min_interval, threshold / 4))
+
+    def _state_for(self, name: str) -> dict[str, Any]:
+        return self._state.setdefault(
+            name,
+            {"card": None, "signature": None, "due": 0.0, "interval": self.base_interval(name), "changes": deque(maxlen=SCHEDULER_VOLATILITY_WINDOW), "recheck": False},
+        )
+
+    def record(self, cards: dict[str, dict[str, Any]], now: float | None = None) -> bool:
+        """Store fresh probe results, schedule each card's next run, and report whether any changed."""
+        now = time.monotonic() if now is None else now
+        changed_any = False
+        crossed = False
+        with self._lock:
+            for name, card in cards.items():
+                state = self._state_for(name)
+                previous = state["card"]
+                signature = card_signature(card)
+                changed = previous is not None and signature != state["signature"]
+                if previous is None or changed:
+                    changed_any = True
+                if previous is None or previous["status"] != card["status"]:
+                    crossed = True
+                state["changes"].append(changed)
+                volatility = sum(state["changes"]) / len(state["changes"])
+                interval = max(self.min_interval, self.base_interval(name) * (1 - 0.75 * volatility))
+                state["interval"] = interval
+                degraded = previous is not None and status_weight(card["status"]) > status_weight(previous["status"])
+                if degraded and not state["recheck"]:
+                    state["due"] = now
+                    state["recheck"] = True
+                else:
+                    state["due"] = now + interval * random.uniform(1 - self.jitter, 1 + self.jitter)
+                    state["recheck"] = False
+                state["card"] = card
+                state["signature"] = signature
+            if crossed:
+                latest = OrderedDict(
+                    (name, self._state[name]["card"]) for name in self.runtime.probe_methods() if name in self._state and self._state[name]["card"] is not None
+                )
+        # Log crossings as the scheduler sees them, not only when a client happens to ask for a snapshot.
+        if crossed and self.runtime.events is not None:
+            self.runtime.record_crossings(latest)
+        return changed_any
+
+    def due(self, now: float | None = None) -> list[str]:
+        now = time.monotonic() if now is None else now
+        names = list(self.runtime.probe_methods())
+        with self._lock:
+            return [name for name in names if self._state_for(name)["due"] <= now]
+
+    def tick(self, now: float | None = None) -> list[str]:
+        """Probe every card that is due and return their names."""
+        names = self.due(now)
+        if names:
+            self._probe(names, now)
+        return names
+
+    def refresh_all(self, now: float | None = None) -> list[str]:
+        """Probe every card now, whether due or not, and restart each card's schedule."""
+        names = list(self.runtime.probe_methods())
+        self._probe(names, now)
+        return names
+
+    def _probe(self, names: list[str], now: float | None) -> None:
+        process_index.refresh(force=True)
+        if self.record(self.runtime.run_probes(names), now) and self.on_update is not None:
+            self.on_update()
+
+    def assemble(self) -> OrderedDict[str, dict[str, Any]]:
+        """Latest card per probe, re-aged to now; cards never probed yet are probed inline."""
+        names = list(self.runtime.probe_methods())
+        with self._lock:
+            latest = {name: self._state[name]["card"] for name in names if name in self._state and self._state[name]["card"] is not None}
+        missing = [name for name in names if name not in latest]
+        if missing:
+            process_index.refresh(force=True)
+            fresh = self.runtime.run_probes(missing)
+            self.record(fresh)
+            latest.update(fresh)
+        return OrderedDict((name, reage_probe(latest[name])) for name in names)
+
+    def intervals(self) -> dict[str, float]:
+        with self._lock:
+            return {name: state["interval"] for name, state in self._state.items()}
+
+    def _loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.tick()
+            except Exception:
+                logger.exception("Probe scheduler tick failed")
+            with self._lock:
+                upcoming = min((state["due"] for state in self._state.values()), default=time.monotonic() + 1.0)
+            self._stop.wait(min(1.0, max(0.05, upcoming - time.monotonic())))
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="hero-probe-scheduler", daemon=True)
+        self._thread.start()
+        self.runtime.scheduler = self
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self.runtime.scheduler = None
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+
+def status_weight(status: str) -> int:
+    return {"healthy": 0, "succeeded": 0, "stale": 1, "degraded": 2, "failed": 2, "down": 3}.get(status, 2)
+
+
+def parse_skill_file(skill_file: Path, root: Path) -> dict[str, Any] | None:
+    try:
+        rel = skill_file.relative_to(root).parent.as_posix()
+        text = skill_file.read_text(encoding="utf-8", errors="replace")[:900]
+    except (OSError, ValueError):
+        return None
+    name_match = re.search(r"^name:\s*(.+)$", text, flags=re.MULTILINE)
+    desc_match = re.search(r"^description:\s*(.+)$", text, flags=re.MULTILINE)
+    description = desc_match.group(1).strip() if desc_match else "local skill"
+    if description == "|":
+        description = "local skill"
+    return {
+        "name": (name_match.group(1).strip() if name_match else rel.split("/")[-1]),
+        "namespace": root.parent.name,
+        "path": str(skill_file),
+        "description": description,
+        "timestamp": file_timestamp(skill_file),
+    }
+
+
+class SkillIndex:
+    """Skill inventory persisted under ``~/.hero_core`` and refreshed incrementally.
+
+    Directories are keyed on mtime like ``DirectoryCountIndex`` so unchanged ones are
+    not re-listed, and a ``SKILL.md`` is only re-read when its mtime or size moves.
+    Items are kept sorted by ``(namespace, name, path)`` so paging is stable. Once an
+    index exists, stale reads are answered from it while one background refresh runs.
+    """
+
+    RACY_WINDOW_NS = DirectoryCountIndex.RACY_WINDOW_NS
+
+    def __init__(self, path: Path | None = SKILL_INDEX_PATH, roots: list[Path] | None = None, ttl: float = SKILL_INDEX_TTL) -> None:
+        self.path = path
+        self.roots = roots
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._refreshing = False
+        self._loaded = False
+        self._dirs: dict[str, dict[str, Any]] = {}
+        self._skills: dict[str, dict[str, Any]] = {}
+        self._items: list[dict[str, Any]] | None = None
+        self._refreshed_at = 0.0
+        self.generation = 0
+        self.digest = ""
+        self.stats = {"refreshes": 0, "relisted": 0, "parsed": 0, "reused": 0}
+
+    def _roots(self) -> list[Path]:
+        if self.roots is not None:
+            return self.roots
+        return [Path.home() / ".agents" / "skills", Path.home() / ".codex" / "skills"]
+
+    def _load(self) -> None:
+        self._loaded = True
+        if self.path is None or not self.path.exists():
+            return
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as exc:
+            logger.warning("Ignoring unreadable skill index %s: %s", self.path, exc)
+            return
+        if not isinstance(payload, dict) or not isinstance(payload.get("skills"), dict) or not isinstance(payload.get("dirs"), dict):
+            return
+        self._dirs = payload["dirs"]
+        self._skills = payload["skills"]
+        self._items = self._sorted(self._skills)
+
+    def _save(self, dirs: dict[str, Any], skills: dict[str, Any]) -> None:
+        if self.path is None:
+            return
+        payload = json.dumps({"version": 1, "dirs": dirs, "skills": skills}, separators=(",", ":"))
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            tmp.write_text(payload, encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError as exc:
+            logger.warning("Failed to persist skill index %s: %s", self.path, exc)
+
+    @staticmethod
+    def _sorted(skills: dict[str, dict[str, Any]]) -> list[dict[str, Any]]:
+        items = [entry["item"] for entry in skills.values()]
+        return sorted(items, key=lambda item: (item["namespace"], item["name"].lower(), item["path"]))
+
+    def _listing(self, directory: str, old: dict[str, Any], new: dict[str, Any]) -> dict[str, Any] | None:
+        try:
+            mtime_ns = os.stat(directory).st_mtime_ns
+        except OSError:
+            return None
+        entry = old.get(directory)
+        if entry is None or entry["mtime_ns"] != mtime_ns:
+            children: list[str] = []
+            has_skill = False
+            try:
+                with os.scandir(directory) as listing:
+                    for item in listing:
+                        try:
+                            if item.name == "SKILL.md" and item.is_file():
+                                has_skill = True
+                            elif item.is_dir() and item.name not in SKILL_IGNORED_DIRS:
+                                children.append(item.name)
+                        except OSError:
+                            continue
+            except OSError:
+                return None
+            if time.time_ns() - mtime_ns < self.RACY_WINDOW_NS:
+                mtime_ns = -1
+            entry = {"mtime_ns": mtime_ns, "dirs": sorted(children), "skill": has_skill}
+            self.stats["relisted"] += 1
+        new[directory] = entry
+        return entry
+
+    def _skill(self, skill_file: Path, root: Path, old: dict[str, Any]) -> dict[str, Any] | None:
+        try:
+            stat = skill_file.stat()
+        except OSError:
+            return None
+        key = str(skill_file)
+        entry = old.get(key)
+        if entry is not None and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+            self.stats["reused"] += 1
+            return entry
+        item = parse_skill_file(skill_file, root)
+        if item is None:
+            return None
+        self.stats["parsed"] += 1
+        mtime_ns = stat.st_mtime_ns if time.time_ns() - stat.st_mtime_ns >= self.RACY_WINDOW_NS else -1
+        return {"mtime_ns": mtime_ns, "size": stat.st_size, "item": item}
+
+    def refresh(self) -> list[dict[str, Any]]:
+        """Walk the skill roots, re-reading only ``SKILL.md`` files that changed."""
+        with self._lock:
+            if not self._loaded:
+                self._load()
+            old_dirs, old_skills = self._dirs, self._skills
+        dirs: dict[str, dict[str, Any]] = {}
+        skills: dict[str, dict[str, Any]] = {}
+        for root in self._roots():
+            stack = [(str(root), 0)]
+            while stack:
+                directory, depth = stack.pop()
+                entry = self._listing(directory, old_dirs, dirs)
+                if entry is None:
+                    continue
+                if entry["skill"]:
+                    skill_file = Path(directory) / "SKILL.md"
+                    skill = self._skill(skill_file, root, old_skills)
+                    if skill is not None:
+                        skills[str(skill_file)] = skill
+                if depth < SKILL_MAX_DEPTH:
+                    stack.extend((os.path.join(directory, name), depth + 1) for name in entry["dirs"])
+        items = self._sorted(skills)
+        changed = dirs != old_dirs or skills != old_skills
+        with self._lock:
+            if items != self._items:
+                self.generation += 1
+                self.digest = hashlib.blake2s(_signature(items).encode("utf-8"), digest_size=12).hexdigest()
+            self._dirs, self._skills, self._items = dirs, skills, items
+            self._refreshed_at = time.monotonic()
+            self.stats["refreshes"] += 1
+        if changed:
+            self._save(dirs, skills)
+        return items
+
+    def _background_refresh(self) -> None:
+        try:
+            self.refresh()
+        except Exception as exc:  # pragma: no cover - defensive; keeps serving the old index
+            logger.warning("Skill index refresh failed: %s", exc)
+        finally:
+            with self._lock:
+                self._refreshing = False
+
+    def items(self) -> list[dict[str, Any]]:
+        """Return the sorted inventory; only the very first build walks in the caller's thread."""
+        with self._lock:
+            if not self._loaded:
+                self._load()
+            items = self._items
+            fresh = self._refreshed_at and time.monotonic() - self._refreshed_at < self.ttl
+            if items is not None and (fresh or self._refreshing):
+                return items
+            if items is not None:
+                self._refreshing = True
+        if items is None:
+            return self.refresh()
+        threading.Thread(target=self._background_refresh, name="skill-index-refresh", daemon=True).start()
+        return items
+
+    def query(self, q: str = "", namespace: str = "", offset: int = 0, limit: int = 50) -> dict[str, Any]:
+        items = self.items()
+        needle = q.strip().lower()
+        if namespace:
+            items = [item for item in items if item["namespace"] == namespace]
+        if needle:
+            items = [item for item in items if needle in item["name"].lower() or needle in item["description"].lower()]
+        offset = max(0, offset)
+        page = items[offset : offset + limit]
+        next_offset = offset + len(page) if offset + len(page) < len(items) else None
+        return {"items": page, "offset": offset, "limit": limit, "total": len(items), "next_offset": next_offset}
+
+
+skill_index = SkillIndex()
+
+
+def discover_skill_inventory(limit: int = 60) -> list[dict[str, Any]]:
+    return skill_index.items()[:limit]
 
 
 def cron_gate_snapshot() -> list[dict[str, Any]]:
@@ -940,8 +3113,230 @@ def cron_gate_snapshot() -> list[dict[str, Any]]:
     return gates
 
 
+def action_crossing(event: dict[str, Any], order: int) -> dict[str, Any]:
+    return {
+        "id": f"crossing-{event['id']}",
+        "journey_id": f"journey-{event['id']}",
+        "thread": "tools",
+        "type": "action",
+        "label": event.get("label") or event.get("action_id"),
+        "status": event.get("status", "unknown"),
+        "timestamp": event.get("completed_at"),
+        "duration_ms": event.get("duration_ms"),
+        "summary": event.get("stderr_preview") or event.get("stdout_preview") or "action completed",
+        "evidence": {
+            "command": event.get("command"),
+            "stdout_preview": event.get("stdout_preview"),
+            "stderr_preview": event.get("stderr_preview"),
+            "cwd": event.get("cwd"),
+        },
+        "weight": status_weight(event.get("status", "unknown")),
+        "order": order,
+    }
+
+
+def timestamp_epoch(ts: str | None) -> float | None:
+    if not ts:
+        return None
+    try:
+        parsed = datetime.fromisoformat(ts.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+class LabyrinthEventStore:
+    """Append-only log of labyrinth crossings, addressed by a monotonically increasing ``seq``.
+
+    Probe status transitions and finished operator actions are appended as they happen,
+    one JSON line each, next to ``actions.jsonl``. The newest ``memory`` events stay in
+    memory for cursor queries; older cursors are answered by scanning the file, so
+    history is never cut off at a fixed cap. Writers take an ``fcntl`` lock and catch up
+    on the file before assigning ``seq``, so several workers can share one log.
+    """
+
+    def __init__(self, path: Path | None = None, memory: int = LABYRINTH_EVENTS_IN_MEMORY) -> None:
+        self.path = path
+        self.memory = max(1, memory)
+        self._lock = threading.Lock()
+        self._reset(None)
+
+    def _reset(self, path: Path | None) -> None:
+        self._current_path = path
+        self._events: deque[dict[str, Any]] = deque(maxlen=self.memory)
+        self._probe_status: dict[str, str] = {}
+        self._inode = 0
+        self._offset = 0
+        self.last_seq = 0
+
+    def _path(self) -> Path:
+        path = self.path or labyrinth_events_path()
+        if path != self._current_path:
+            self._reset(path)
+        return path
+
+    def _apply(self, event: dict[str, Any]) -> None:
+        self._events.append(event)
+        self.last_seq = max(self.last_seq, int(event.get("seq", 0)))
+        if event.get("type") == "probe":
+            self._probe_status[event["label"]] = event["status"]
+
+    def _sync(self) -> None:
+        """Read whatever complete lines were appended since the last look."""
+        path = self._path()
+        try:
+            with path.open("rb") as handle:
+                stat = os.fstat(handle.fileno())
+                if stat.st_ino == self._inode and stat.st_size == self._offset:
+                    return
+                if stat.st_ino != self._inode or stat.st_size < self._offset:
+                    self._reset(path)
+                handle.seek(self._offset)
+                data = handle.read()
+        except FileNotFoundError:
+            return
+        except OSError as exc:
+            logger.warning("Ignoring unreadable labyrinth event log %s: %s", path, exc)
+            return
+        complete = data[: data.rfind(b"\n") + 1]
+        self._inode = stat.st_ino
+        self._offset += len(complete)
+        for line in complete.splitlines():
+            try:
+                event = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(event, dict) and "seq" in event:
+                self._apply(event)
+
+    def _append(self, build: Any) -> list[dict[str, Any]]:
+        """Catch up under the file lock, number the events ``build()`` returns, and append them."""
+        with self._lock:
+            path = self._path()
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                with path.open("ab") as handle:
+                    if fcntl is not None:
+                        fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+                    try:
+                        self._sync()
+                        events = build()
+                        for event in events:
+                            self.last_seq += 1
+                            event["seq"] = self.last_seq
+                            event.setdefault("id", f"crossing-{event['type']}-{event['label']}-{event['seq']}")
+                        if events:
+                            handle.write(b"".join(json.dumps(event, sort_keys=True, default=str).encode("utf-8") + b"\n" for event in events))
+                            handle.flush()
+                            # Our own lines are already applied below; skip them on the next sync.
+                            self._inode = os.fstat(handle.fileno()).st_ino
+                            self._offset = handle.tell()
+                    finally:
+                        if fcntl is not None:
+                            fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+            except OSError as exc:
+                logger.warning("Failed to append labyrinth events to %s: %s", path, exc)
+                return []
+            for event in events:
+                self._apply(event)
+            return events
+
+    def record_probes(self, cards: dict[str, dict[str, Any]]) -> list[dict[str, Any]]:
+        """Append one crossing per card whose status differs from the last one recorded."""
+
+        def build() -> list[dict[str, Any]]:
+            now = iso_now()
+            events = []
+            for name, card in cards.items():
+                previous = self._probe_status.get(name)
+                if previous == card.get("status"):
+                    continue
+                events.append(
+                    {
+                        "journey_id": "journey-current-dashboard",
+                        "thread": "main" if name != "alerts" else "thresholds",
+                        "type": "probe",
+                        "label": name,
+                        "status": card.get("status", "down"),
+                        "previous_status": previous,
+                        "timestamp": now,
+                        "duration_ms": card.get("duration_ms"),
+                        "summary": card.get("last_error") or card.get("source"),
+                        "evidence": {
+                            "source": card.get("source"),
+                            "evidence_timestamp": card.get("timestamp"),
+                            "freshness_seconds": card.get("freshness_seconds"),
+                        },
+                        "weight": status_weight(card.get("status", "down")),
+                    }
+                )
+            return events
+
+        return self._append(build)
+
+    def record_action(self, event: dict[str, Any]) -> list[dict[str, Any]]:
+        return self._append(lambda: [action_crossing(event, 0)])
+
+    def cursor(self) -> int:
+        with self._lock:
+            self._sync()
+            return self.last_seq
+
+    def _scan_file(self) -> Any:
+        try:
+            with self._path().open("rb") as handle:
+                for line in handle:
+                    try:
+                        event = json.loads(line)
+                    except ValueError:
+                        continue
+                    if isinstance(event, dict) and "seq" in event:
+                        yield event
+        except OSError:
+            return
+
+    def query(
+        self,
+        cursor: int | None = None,
+        since: float | None = None,
+        thread: str = "",
+        status: str = "",
+        limit: int = 100,
+    ) -> dict[str, Any]:
+        """Events after ``cursor`` (oldest first) matching the filters, plus the cursor to resume from."""
+        after = cursor or 0
+        statuses = {item.strip() for item in status.split(",") if item.strip()}
+        with self._lock:
+            self._sync()
+            in_memory = list(self._events)
+            last_seq = self.last_seq
+        source = in_memory if not in_memory or after >= in_memory[0]["seq"] - 1 else self._scan_file()
+        matches: list[dict[str, Any]] = []
+        has_more = False
+        for event in source:
+            if event["seq"] <= after:
+                continue
+            if thread and event.get("thread") != thread:
+                continue
+            if statuses and event.get("status") not in statuses:
+                continue
+            if since is not None and (timestamp_epoch(event.get("timestamp")) or 0.0) < since:
+                continue
+            if len(matches) == limit:
+                has_more = True
+                break
+            matches.append(event)
+        next_cursor = matches[-1]["seq"] if has_more else last_seq
+        return {"crossings": matches, "cursor": after, "next_cursor": next_cursor, "has_more": has_more, "latest_seq": last_seq}
+
+
+labyrinth_events = LabyrinthEventStore()
+
+
 def build_labyrinth(snapshot: dict[str, Any] | None = None) -> dict[str, Any]:
-    current = snapshot or runtime.snapshot()
+    current = snapshot or snapshot_cache.get()
     now = current["overview"]["timestamp"]
     action_events = read_action_events(25)
 
@@ -969,7 +3364,7 @@ def build_labyrinth(snapshot: dict[str, Any] | None = None) -> dict[str, Any]:
             "label": name,
             "status": card["status"],
             "timestamp": card["timestamp"],
-            "duration_ms": None,
+            "duration_ms": card.get("duration_ms"),
             "summary": card.get("last_error") or card.get("source"),
             "evidence": {
                 "source": card.get("source"),
@@ -1005,27 +3400,7 @@ def build_labyrinth(snapshot: dict[str, Any] | None = None) -> dict[str, Any]:
                 "summary": f"exit {event.get('exit_code')} in {event.get('duration_ms')}ms",
             }
         )
-        crossings.append(
-            {
-                "id": f"crossing-{event['id']}",
-                "journey_id": journey_id,
-                "thread": "tools",
-                "type": "action",
-                "label": event.get("label") or event.get("action_id"),
-                "status": event.get("status", "unknown"),
-                "timestamp": event.get("completed_at"),
-                "duration_ms": event.get("duration_ms"),
-                "summary": event.get("stderr_preview") or event.get("stdout_preview") or "action completed",
-                "evidence": {
-                    "command": event.get("command"),
-                    "stdout_preview": event.get("stdout_preview"),
-                    "stderr_preview": event.get("stderr_preview"),
-                    "cwd": event.get("cwd"),
-                },
-                "weight": status_weight(event.get("status", "unknown")),
-                "order": len(crossings) + index,
-            }
-        )
+        crossings.append(action_crossing(event, len(crossings) + index))
         if event.get("status") != "succeeded":
             guideposts.append(
                 {
@@ -1048,32 +3423,489 @@ def build_labyrinth(snapshot: dict[str, Any] | None = None) -> dict[str, Any]:
         "skills": discover_skill_inventory(),
         "cron": cron_gate_snapshot(),
         "actions": list_actions(),
+        "cursor": labyrinth_events.cursor(),
         "reports": {
             "json": "/api/labyrinth",
+            "events": "/api/labyrinth?cursor=0",
             "action_history": "/api/actions/history",
         },
     }
 
 
-app = FastAPI(title="Hero Reboot Dashboard", description="Honest operator surface for Hermes, Telegram, GBrain, and WORKFLOWS")
+def _signature(value: Any) -> str:
+    return json.dumps(value, sort_keys=True, default=str)
+
+
+def snapshot_signature(snapshot: Any) -> str:
+    """Content digest of a snapshot that ignores clock-driven fields.
+
+    Equal content gives an equal digest in every worker, so it can back validators that
+    clients carry from one worker to another.
+    """
+    if not isinstance(snapshot, dict):
+        return hashlib.blake2s(_signature(snapshot).encode("utf-8"), digest_size=12).hexdigest()
+    overview = {key: value for key, value in (snapshot.get("overview") or {}).items() if key != "timestamp"}
+    cards = {name: card_signature(card) for name, card in (snapshot.get("cards") or {}).items()}
+    rest = {key: value for key, value in snapshot.items() if key not in {"overview", "cards"}}
+    return hashlib.blake2s(_signature([overview, cards, rest]).encode("utf-8"), digest_size=12).hexdigest()
+
+
+def card_signature(card: dict[str, Any]) -> str:
+    """Identity of a card for change detection, ignoring clock-driven fields."""
+    details = {key: value for key, value in (card.get("details") or {}).items() if key != "evidence_timestamp"}
+    stable = {key: value for key, value in card.items() if key not in {"timestamp", "freshness_seconds", "details", "duration_ms"}}
+    stable["details"] = details
+    return _signature(stable)
+
+
+def labyrinth_item_signature(item: dict[str, Any]) -> str:
+    return _signature([item.get("status") or item.get("severity"), item.get("summary"), item.get("title"), item.get("label")])
+
+
+class StreamDiffer:
+    """Tracks what one SSE client has seen and turns new state into keyframes or patches.
+
+    Patches follow JSON Patch ``op`` naming. Cards are addressed as ``/cards/<name>``;
+    crossings and guideposts are addressed by id (``/crossings/<id>``) because clients
+    keep them keyed rather than positional.
+    """
+
+    def __init__(self, keyframe_seconds: float = STREAM_KEYFRAME_SECONDS) -> None:
+        self.keyframe_seconds = keyframe_seconds
+        self.last_keyframe: float | None = None
+        self.cards: dict[str, str] = {}
+        self.collections: dict[str, dict[str, str]] = {"crossings": {}, "guideposts": {}}
+
+    def _remember(self, status: dict[str, Any], labyrinth: dict[str, Any]) -> None:
+        self.cards = {name: card_signature(card) for name, card in status["cards"].items()}
+        for key in self.collections:
+            self.collections[key] = {item["id"]: labyrinth_item_signature(item) for item in labyrinth.get(key, [])}
+
+    def frame(self, status: dict[str, Any], labyrinth: dict[str, Any], now: float) -> tuple[str, dict[str, Any]] | None:
+        if self.last_keyframe is None or now - self.last_keyframe >= self.keyframe_seconds:
+            self.last_keyframe = now
+            self._remember(status, labyrinth)
+            return "keyframe", {"status": status, "labyrinth": labyrinth}
+
+        ops: list[dict[str, Any]] = []
+        for name, card in status["cards"].items():
+            signature = card_signature(card)
+            if self.cards.get(name) != signature:
+                ops.append({"op": "replace" if name in self.cards else "add", "path": f"/cards/{name}", "value": card})
+                self.cards[name] = signature
+        for key, seen in self.collections.items():
+            current = {item["id"]: item for item in labyrinth.get(key, [])}
+            for item_id, item in current.items():
+                signature = labyrinth_item_signature(item)
+                if seen.get(item_id) != signature:
+                    ops.append({"op": "replace" if item_id in seen else "add", "path": f"/{key}/{item_id}", "value": item})
+                    seen[item_id] = signature
+            for item_id in [item_id for item_id in seen if item_id not in current]:
+                ops.append({"op": "remove", "path": f"/{key}/{item_id}"})
+                del seen[item_id]
+        if not ops:
+            return None
+        return "patch", {"overview": status["overview"], "ops": ops}
+
+
+STREAM_STATE: dict[str, Any] = {"key": None, "labyrinth": None}
+STREAM_STATE_LOCK = threading.Lock()
+
+
+def labyrinth_state() -> tuple[tuple[Any, ...], dict[str, Any], dict[str, Any]]:
+    """``(key, snapshot, labyrinth)``; the labyrinth is rebuilt once per key for all clients."""
+    _, generation, _, status = snapshot_cache.get_entry()
+    try:
+        log_stat = HERO_ACTION_LOG.stat()
+        log_key: tuple[int, int] | None = (log_stat.st_mtime_ns, log_stat.st_size)
+    except OSError:
+        log_key = None
+    key = (generation, log_key, skill_index.generation)
+    with STREAM_STATE_LOCK:
+        if STREAM_STATE["key"] == key and STREAM_STATE["labyrinth"] is not None:
+            return key, status, STREAM_STATE["labyrinth"]
+    labyrinth = build_labyrinth(status)
+    with STREAM_STATE_LOCK:
+        STREAM_STATE["key"] = key
+        STREAM_STATE["labyrinth"] = labyrinth
+    return key, status, labyrinth
+
+
+def labyrinth_etag_key(key: tuple[Any, ...], status: dict[str, Any], labyrinth: dict[str, Any]) -> tuple[Any, ...]:
+    """Validator inputs for a labyrinth built at ``key``, all derived from shared content."""
+    _, log_key, _ = key
+    return (snapshot_signature(status), log_key, skill_index.digest, labyrinth.get("cursor"))
+
+
+def stream_state() -> tuple[dict[str, Any], dict[str, Any]]:
+    """Current snapshot plus its labyrinth, built once per snapshot/action-log change for all clients."""
+    _, status, labyrinth = labyrinth_state()
+    return status, labyrinth
+
+
+def encode_json(payload: Any) -> bytes:
+    """Compact UTF-8 JSON, via orjson when installed unless ``HERO_JSON_ENCODER=json``."""
+    if orjson is not None and JSON_ENCODER != "json":
+        return orjson.dumps(payload, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":"), default=str).encode("utf-8")
+
+
+def decode_json(data: bytes) -> Any:
+    if orjson is not None and JSON_ENCODER != "json":
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Workers started by main() inherit one token. Validators are keyed on content signatures,
+# so a client moved to another worker holding the same content still revalidates.
+BOOT_TOKEN = os.getenv("HERO_BOOT_TOKEN") or f"{os.getpid():x}{time.time_ns():x}"
+
+
+def make_etag(name: str, key: Any) -> str:
+    """Weak validator for ``name`` at ``key``; the boot token keeps restarts from reusing tags."""
+    digest = hashlib.blake2s(repr((BOOT_TOKEN, name, key)).encode("utf-8"), digest_size=8).hexdigest()
+    return f'W/"{digest}"'
+
+
+def etag_matches(header: str | None, etag: str) -> bool:
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    return any((tag.strip()[2:] if tag.strip().startswith("W/") else tag.strip()) == opaque for tag in header.split(","))
+
+
+def negotiate_encoding(header: str | None, size: int) -> str | None:
+    """Pick ``br`` or ``gzip`` from ``Accept-Encoding`` for bodies worth compressing."""
+    if not header or size < COMPRESS_MIN_BYTES:
+        return None
+    accepted: dict[str, float] = {}
+    for part in header.split(","):
+        token, _, params = part.strip().partition(";")
+        quality = 1.0
+        if params.strip().startswith("q="):
+            try:
+                quality = float(params.strip()[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[token.strip().lower()] = quality
+    for encoding in ("br", "gzip"):
+        if encoding == "br" and brotli is None:
+            continue
+        if accepted.get(encoding, accepted.get("*", 0.0)) > 0:
+            return encoding
+    return None
+
+
+class EncodedBody:
+    """One serialized payload plus its compressed variants, produced on first request."""
+
+    def __init__(self, etag: str, body: bytes) -> None:
+        self.etag = etag
+        self.body = body
+        self._variants: dict[str, bytes] = {}
+        self._lock = threading.Lock()
+
+    def variant(self, encoding: str | None) -> bytes:
+        if encoding is None:
+            return self.body
+        with self._lock:
+            data = self._variants.get(encoding)
+            if data is None:
+                data = brotli.compress(self.body, quality=5) if encoding == "br" else gzip.compress(self.body, compresslevel=6, mtime=0)
+                self._variants[encoding] = data
+            return data
+
+
+class ResponseCache:
+    """Encoded bodies memoised per ``(route, version key)`` so every client shares one serialization.
+
+    Bodies are JSON by default; pass ``encode`` for anything else (the rendered dashboard page).
+    """
+
+    def __init__(self, max_entries: int = RESPONSE_CACHE_ENTRIES) -> None:
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple[str, Any], EncodedBody] = OrderedDict()
+        self.stats = {"not_modified": 0, "hits": 0, "encodes": 0}
+
+    def get(self, name: str, key: Any, build: Any, encode: Any = encode_json, etag_key: Any = None) -> EncodedBody:
+        with self._lock:
+            entry = self._entries.get((name, key))
+            if entry is not None:
+                self._entries.move_to_end((name, key))
+                self.stats["hits"] += 1
+                return entry
+        entry = EncodedBody(make_etag(name, key if etag_key is None else etag_key), encode(build()))
+        with self._lock:
+            self.stats["encodes"] += 1
+            self._entries[(name, key)] = entry
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+
+response_cache = ResponseCache()
+
+
+def cached_response(
+    request: FastAPIRequest,
+    name: str,
+    key: Any,
+    build: Any,
+    *,
+    media_type: str = "application/json",
+    encode: Any = encode_json,
+    etag_key: Any = None,
+) -> Response:
+    """Serve ``build()`` for version ``key`` with ETag revalidation and negotiated compression.
+
+    ``etag_key`` decouples the validator from the body cache key. The ETag is weak, so
+    bodies that differ only in clock-driven fields may share it.
+    """
+    etag = make_etag(name, key if etag_key is None else etag_key)
+    headers = {"ETag": etag, "Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        response_cache.stats["not_modified"] += 1
+        return Response(status_code=304, headers=headers)
+    encoded = response_cache.get(name, key, build, encode, etag_key)
+    encoding = negotiate_encoding(request.headers.get("accept-encoding"), len(encoded.body))
+    if encoding is not None:
+        headers["Content-Encoding"] = encoding
+    return Response(encoded.variant(encoding), media_type=media_type, headers=headers)
+
+
+def html_safe_json(data: bytes) -> str:
+    """JSON bytes made safe to inline in ``<script>``, escaped the way Jinja's ``tojson`` does."""
+    return (
+        data.decode("utf-8")
+        .replace("<", "\\u003c")
+        .replace(">", "\\u003e")
+        .replace("&", "\\u0026")
+        .replace("'", "\\u0027")
+    )
+
+
+def render_dashboard(generation: int, snapshot: dict[str, Any]) -> str:
+    """Render the page around the same encoded snapshot ``/api/status`` serves for ``generation``."""
+    status_body = response_cache.get("status", generation, lambda: snapshot).body
+    return templates.get_template("dashboard.html").render(initial_json=Markup(html_safe_json(status_body)))
+
+
+def sse_message(event: str, data: dict[str, Any]) -> str:
+    return f"event: {event}\ndata: {encode_json(data).decode('utf-8')}\n\n"
+
+
+async def snapshot_event_stream(request: FastAPIRequest, differ: StreamDiffer | None = None):
+    differ = differ or StreamDiffer()
+    last_sent = time.monotonic()
+    yield f"retry: {int(STREAM_INTERVAL * 1000) + 1000}\n\n"
+    while not await request.is_disconnected():
+        status, labyrinth = await run_in_threadpool(stream_state)
+        now = time.monotonic()
+        frame = differ.frame(status, labyrinth, now)
+        if frame is not None:
+            yield sse_message(*frame)
+            last_sent = now
+        elif now - last_sent >= STREAM_KEEPALIVE_SECONDS:
+            yield ": keepalive\n\n"
+            last_sent = now
+        await asyncio.sleep(STREAM_INTERVAL)
+
+
+def compute_snapshot() -> dict[str, Any]:
+    """Probe locally, or in multi-worker mode publish/read through the shared store."""
+    if shared_snapshots.role is None:
+        return runtime.snapshot()
+    if shared_snapshots.role == "follower":
+        snapshot, age = shared_snapshots.read()
+        if snapshot is not None and age is not None and age <= shared_snapshots.max_age:
+            return snapshot
+        if not shared_snapshots.try_elect():
+            if snapshot is not None:
+                return snapshot
+            logger.warning("No shared snapshot yet and the prober lock is held; probing locally once")
+            return runtime.snapshot()
+        logger.info("Worker %s took over as prober", os.getpid())
+        if PROBE_SCHEDULER_ENABLED:
+            probe_scheduler.start()
+    snapshot = runtime.snapshot()
+    shared_snapshots.publish(snapshot)
+    return snapshot
+
+
+def keep_shared_snapshot_warm(stop: threading.Event) -> None:
+    """Prober-side loop so followers see fresh snapshots even if this worker gets no traffic."""
+    while not stop.wait(max(1.0, SNAPSHOT_TTL)):
+        if shared_snapshots.role != "prober":
+            continue
+        try:
+            snapshot_cache.get()
+        except Exception:
+            logger.exception("Shared snapshot refresh failed")
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> Any:
+    warm_stop = threading.Event()
+    if DASHBOARD_WORKERS > 1:
+        elected = await run_in_threadpool(shared_snapshots.try_elect)
+        logger.info("Worker %s running as %s", os.getpid(), "prober" if elected else "follower")
+        threading.Thread(target=keep_shared_snapshot_warm, args=(warm_stop,), name="hero-shared-snapshot", daemon=True).start()
+    if PROBE_ISOLATION and shared_snapshots.role != "follower":
+        threading.Thread(target=isolated_pool.warm, name="hero-probe-pool-warm", daemon=True).start()
+    if PROBE_SCHEDULER_ENABLED and shared_snapshots.role != "follower":
+        probe_scheduler.start()
+    try:
+        yield
+    finally:
+        warm_stop.set()
+        await run_in_threadpool(probe_scheduler.stop)
+        await run_in_threadpool(isolated_pool.shutdown)
+        await run_in_threadpool(shared_snapshots.close)
+
+
+app = FastAPI(
+    title="Hero Reboot Dashboard",
+    description="Honest operator surface for Hermes, Telegram, GBrain, and WORKFLOWS",
+    lifespan=lifespan,
+)
 templates = Jinja2Templates(directory=str(TEMPLATES_DIR))
-runtime = DashboardRuntime()
+runtime = DashboardRuntime(history=history_store, events=labyrinth_events)
+shared_snapshots = SharedSnapshotStore()
+snapshot_cache = SnapshotCache(compute_snapshot)
+probe_scheduler = ProbeScheduler(runtime, on_update=snapshot_cache.invalidate)
+
+
+def collect_runtime_metrics() -> list[tuple[str, str, str, list[tuple[str, tuple[tuple[str, str], ...], float]]]]:
+    """Export counters already kept by the caches, HTTP engine, git reader, and job manager."""
+    families = []
+    http_samples = []
+    for endpoint, data in sorted(http_probes.latency_histograms().items()):
+        cumulative = 0
+        for bound, count in zip(HTTP_LATENCY_BUCKETS_MS, data["buckets"]):
+            cumulative += count
+            http_samples.append(("hero_http_probe_latency_seconds_bucket", (("endpoint", endpoint), ("le", f"{bound / 1000:g}")), cumulative))
+        http_samples.append(("hero_http_probe_latency_seconds_bucket", (("endpoint", endpoint), ("le", "+Inf")), data["count"]))
+        http_samples.append(("hero_http_probe_latency_seconds_sum", (("endpoint", endpoint),), data["sum_ms"] / 1000))
+        http_samples.append(("hero_http_probe_latency_seconds_count", (("endpoint", endpoint),), data["count"]))
+    families.append(("hero_http_probe_latency_seconds", "histogram", "Upstream HTTP probe latency per endpoint.", http_samples))
+    families.append(
+        (
+            "hero_snapshot_cache_events_total",
+            "counter",
+            "Snapshot cache lookups by outcome.",
+            [("hero_snapshot_cache_events_total", (("outcome", key),), value) for key, value in sorted(snapshot_cache.stats.items())],
+        )
+    )
+    families.append(
+        (
+            "hero_git_metadata_reads_total",
+            "counter",
+            "Git metadata lookups by outcome.",
+            [("hero_git_metadata_reads_total", (("outcome", key),), value) for key, value in sorted(git_metadata.stats.items())],
+        )
+    )
+    families.append(
+        (
+            "hero_lane_index_lookups_total",
+            "counter",
+            "WORKFLOWS lane directory index lookups by outcome.",
+            [("hero_lane_index_lookups_total", (("outcome", key),), value) for key, value in sorted(lane_index.stats.items())],
+        )
+    )
+    families.append(
+        (
+            "hero_process_index_scans_total",
+            "counter",
+            "Full process table scans.",
+            [("hero_process_index_scans_total", (), process_index.scans)],
+        )
+    )
+    families.append(
+        (
+            "hero_skill_index_events_total",
+            "counter",
+            "Skill index refreshes, directory relists and SKILL.md parses.",
+            [("hero_skill_index_events_total", (("event", key),), value) for key, value in sorted(skill_index.stats.items())],
+        )
+    )
+    families.append(
+        (
+            "hero_probe_interval_seconds",
+            "gauge",
+            "Current background refresh interval per card.",
+            [("hero_probe_interval_seconds", (("probe", name),), value) for name, value in sorted(probe_scheduler.intervals().items())],
+        )
+    )
+    families.append(
+        (
+            "hero_response_cache_events_total",
+            "counter",
+            "Encoded JSON response cache outcomes, including 304 revalidations.",
+            [("hero_response_cache_events_total", (("outcome", key),), value) for key, value in sorted(response_cache.stats.items())],
+        )
+    )
+    families.append(
+        (
+            "hero_probe_isolation_events_total",
+            "counter",
+            "Isolated probe pool calls, worker spawns, overrun kills and crashes.",
+            [("hero_probe_isolation_events_total", (("event", key),), value) for key, value in sorted(isolated_pool.stats.items())],
+        )
+    )
+    families.append(
+        (
+            "hero_parse_cache_events_total",
+            "counter",
+            "Parsed config file cache lookups by outcome.",
+            [("hero_parse_cache_events_total", (("outcome", key),), value) for key, value in sorted(parsed_files.stats.items())],
+        )
+    )
+    job_samples = []
+    for action_id, data in sorted(job_manager.metrics.items()):
+        for key in ("submitted", "deduplicated", "runs", "failures"):
+            job_samples.append(("hero_action_jobs_total", (("action", action_id), ("event", key)), data[key]))
+    families.append(("hero_action_jobs_total", "counter", "Operator action jobs by action and lifecycle event.", job_samples))
+    return families
+
+
+metrics.collector(collect_runtime_metrics)
+
+
+@app.middleware("http")
+async def record_request_metrics(request: FastAPIRequest, call_next: Any) -> Any:
+    started = time.monotonic()
+    response = await call_next(request)
+    route = request.scope.get("route")
+    path = getattr(route, "path", None) or "unmatched"
+    metrics.observe("hero_http_request_duration_seconds", time.monotonic() - started, path=path, method=request.method)
+    length = response.headers.get("content-length")
+    if length and length.isdigit():
+        metrics.observe("hero_http_response_size_bytes", float(length), path=path, method=request.method)
+    return response
 
 
 @app.get("/", response_class=HTMLResponse)
-async def dashboard_home(request: FastAPIRequest) -> HTMLResponse:
-    snapshot = await run_in_threadpool(runtime.snapshot)
-    return templates.TemplateResponse(
-        request=request,
-        name="dashboard.html",
-        context={"initial_data": snapshot},
+async def dashboard_home(request: FastAPIRequest) -> Response:
+    signature, generation, snapshot = await run_in_threadpool(snapshot_cache.get_tagged)
+    return await run_in_threadpool(
+        cached_response,
+        request,
+        "home",
+        generation,
+        partial(render_dashboard, generation, snapshot),
+        media_type="text/html; charset=utf-8",
+        encode=str.encode,
+        etag_key=signature,
     )
 
 
 @app.get("/api/status")
-async def api_status() -> JSONResponse:
-    snapshot = await run_in_threadpool(runtime.snapshot)
-    return JSONResponse(snapshot)
+async def api_status(request: FastAPIRequest) -> Response:
+    signature, generation, snapshot = await run_in_threadpool(snapshot_cache.get_tagged)
+    return await run_in_threadpool(cached_response, request, "status", generation, lambda: snapshot, etag_key=signature)
 
 
 @app.get("/api/actions")
@@ -1083,24 +3915,114 @@ async def api_actions() -> JSONResponse:
 
 
 @app.get("/api/actions/history")
-async def api_actions_history() -> JSONResponse:
-    events = await run_in_threadpool(read_action_events, 50)
-    return JSONResponse({"events": events})
+async def api_actions_history(offset: int = 0, limit: int = 50) -> JSONResponse:
+    page = await run_in_threadpool(read_action_history, offset, max(1, min(limit, 500)))
+    return JSONResponse(page)
 
 
 @app.post("/api/actions/{action_id}")
-async def api_run_action(action_id: str) -> JSONResponse:
+async def api_run_action(action_id: str, wait: bool = False) -> JSONResponse:
     if action_id not in ACTION_REGISTRY:
         raise HTTPException(status_code=404, detail=f"Unknown action: {action_id}")
-    event = await run_in_threadpool(execute_action, action_id)
-    status_code = 200 if event["status"] == "succeeded" else 500
-    return JSONResponse(event, status_code=status_code)
+    job, created = job_manager.submit(action_id)
+    if wait:
+        event = await job_manager.wait(job)
+        return JSONResponse(event, status_code=200 if event.get("status") == "succeeded" else 500)
+    payload = job.payload()
+    payload["deduplicated"] = not created
+    return JSONResponse(payload, status_code=202)
+
+
+@app.get("/api/jobs")
+async def api_jobs() -> JSONResponse:
+    jobs = [job.payload() for job in reversed(job_manager.jobs.values())]
+    return JSONResponse({"jobs": jobs, "concurrency": job_manager.concurrency, "metrics": job_manager.metrics})
+
+
+@app.get("/api/jobs/{job_id}")
+async def api_job(job_id: str) -> JSONResponse:
+    job = job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Unknown job: {job_id}")
+    return JSONResponse(job.payload(include_output=True))
+
+
+@app.get("/api/jobs/{job_id}/stream")
+async def api_job_stream(job_id: str, request: FastAPIRequest) -> StreamingResponse:
+    job = job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Unknown job: {job_id}")
+    last_event_id = request.headers.get("last-event-id", "")
+    after = int(last_event_id) if last_event_id.isdigit() else -1
+    return StreamingResponse(
+        job_manager.stream(job, after),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-store", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.get("/api/skills")
+async def api_skills(offset: int = 0, limit: int = 50, q: str = "", namespace: str = "") -> JSONResponse:
+    page = await run_in_threadpool(skill_index.query, q, namespace, offset, max(1, min(limit, 500)))
+    return JSONResponse(page)
+
+
+def parse_since(value: str) -> float | None:
+    """Accept epoch seconds or an ISO-8601 timestamp."""
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid since: {value}") from None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+@app.get("/api/history")
+async def api_history(card: str = "", since: str = "", points: int = 120) -> JSONResponse:
+    names = [card] if card else history_store.cards
+    if card and card not in history_store.cards:
+        raise HTTPException(status_code=404, detail=f"Unknown card: {card}")
+    start = parse_since(since)
+    points = max(1, min(points, 1000))
+
+    def collect() -> dict[str, Any]:
+        return {name: history_store.series(name, start, points) for name in names}
+
+    series = await run_in_threadpool(collect)
+    return JSONResponse({"since": start, "points": points, "cards": series})
 
 
 @app.get("/api/labyrinth")
-async def api_labyrinth() -> JSONResponse:
-    payload = await run_in_threadpool(build_labyrinth)
-    return JSONResponse(payload)
+async def api_labyrinth(
+    request: FastAPIRequest,
+    cursor: int | None = None,
+    since: str = "",
+    thread: str = "",
+    status: str = "",
+    limit: int = 100,
+) -> Response:
+    if cursor is not None or since or thread or status:
+        page = await run_in_threadpool(labyrinth_events.query, cursor, parse_since(since), thread, status, max(1, min(limit, 1000)))
+        return JSONResponse(page)
+    key, status, labyrinth = await run_in_threadpool(labyrinth_state)
+    etag_key = await run_in_threadpool(labyrinth_etag_key, key, status, labyrinth)
+    return await run_in_threadpool(cached_response, request, "labyrinth", key, lambda: labyrinth, etag_key=etag_key)
+
+
+@app.get("/api/stream")
+async def api_stream(request: FastAPIRequest) -> StreamingResponse:
+    return StreamingResponse(
+        snapshot_event_stream(request),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-store", "X-Accel-Buffering": "no"},
+    )
 
 
 @app.get("/api/healthz")
@@ -1127,9 +4049,14 @@ async def api_version() -> JSONResponse:
     return JSONResponse({"version": "hero-reboot-v2", "dashboard_port": DASHBOARD_PORT, "timestamp": iso_now()})
 
 
+@app.get("/api/metrics")
+async def api_metrics() -> PlainTextResponse:
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
+
+
 @app.get("/api/readiness")
 async def readiness() -> JSONResponse:
-    snapshot = await run_in_threadpool(runtime.snapshot)
+    snapshot = await run_in_threadpool(snapshot_cache.get)
     statuses = [snapshot["cards"][name]["status"] for name in CARD_ORDER[:-1]]
     ready = all(status == "healthy" for status in statuses)
     return JSONResponse(
@@ -1143,7 +4070,19 @@ async def readiness() -> JSONResponse:
 
 
 def main() -> None:
-    logger.info("Starting Hero reboot dashboard on http://127.0.0.1:%s", DASHBOARD_PORT)
+    logger.info("Starting Hero reboot dashboard on http://127.0.0.1:%s with %s worker(s)", DASHBOARD_PORT, DASHBOARD_WORKERS)
+    if DASHBOARD_WORKERS > 1:
+        # Workers re-import this module; share the ETag token and let them elect one prober.
+        os.environ.setdefault("HERO_BOOT_TOKEN", BOOT_TOKEN)
+        uvicorn.run(
+            "web_dashboard:app",
+            app_dir=str(Path(__file__).resolve().parent),
+            host="127.0.0.1",
+            port=DASHBOARD_PORT,
+            workers=DASHBOARD_WORKERS,
+            log_level="info",
+        )
+        return
     uvicorn.run(app, host="127.0.0.1", port=DASHBOARD_PORT, log_level="info")
 
 